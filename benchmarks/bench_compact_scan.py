@@ -0,0 +1,82 @@
+"""Benchmark memory use of a full-tenant scan.
+
+Appends synthetic API pages into a CompactMemoryStore and reports
+tracemalloc bytes per memory, next to a list of Memory models built from a
+smaller sample (pydantic objects for 1M rows take several GB).
+
+Run with:
+    pip install keyoku[numpy]
+    python benchmarks/bench_compact_scan.py [rows] [model_sample_rows]
+"""
+
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Any
+
+from keyoku.compact import CompactMemoryStore
+from keyoku.models import Memory
+
+PAGE_SIZE = 1000
+TYPES = ["fact", "preference", "event", "relationship", "context"]
+AGENTS = [f"agent-{i}" for i in range(20)]
+
+
+def make_page(start: int, size: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"mem_{i:012d}",
+            "content": f"User mentioned that project {i % 977} is due on day {i % 31}",
+            "type": TYPES[i % len(TYPES)],
+            "agent_id": AGENTS[i % len(AGENTS)],
+            "importance": (i % 100) / 100,
+            "created_at": f"2024-01-{1 + i % 28:02d}T10:{i % 60:02d}:00Z",
+        }
+        for i in range(start, start + size)
+    ]
+
+
+def scan_compact(rows: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    store = CompactMemoryStore(capacity=rows)
+    for offset in range(0, rows, PAGE_SIZE):
+        store.append(make_page(offset, min(PAGE_SIZE, rows - offset)))
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"CompactMemoryStore  rows={rows:>9}  {retained / rows:7.1f} B/memory retained  "
+        f"{peak / rows:7.1f} B/memory peak  {elapsed:6.2f} s"
+    )
+    del store
+
+
+def scan_models(rows: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    memories: list[Memory] = []
+    for offset in range(0, rows, PAGE_SIZE):
+        memories.extend(Memory(**m) for m in make_page(offset, min(PAGE_SIZE, rows - offset)))
+    elapsed = time.perf_counter() - start
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"list[Memory]        rows={rows:>9}  {retained / rows:7.1f} B/memory retained  "
+        f"{peak / rows:7.1f} B/memory peak  {elapsed:6.2f} s"
+    )
+    del memories
+
+
+def main() -> None:
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sample = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    scan_models(sample)
+    scan_compact(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Benchmark near-duplicate detection on synthetic memories.
+
+Builds pages of random 30-word memories, every tenth one a one-word edit of
+its predecessor, and times NearDuplicateIndex.append() and find().
+
+Run with:
+    pip install keyoku[scipy]
+    python benchmarks/bench_dedup.py [memories]
+"""
+
+import random
+import sys
+import time
+
+from keyoku.dedup import NearDuplicateIndex
+
+PAGE = 1000
+
+
+def pages(count: int):
+    rng = random.Random(0)
+    vocab = [f"w{i}" for i in range(20_000)]
+    previous = ""
+    page = []
+    for i in range(count):
+        if i % 10 == 0 and previous:
+            words = previous.split()
+            words[rng.randrange(len(words))] = rng.choice(vocab)
+            content = " ".join(words)
+        else:
+            content = " ".join(rng.choice(vocab) for _ in range(30))
+        previous = content
+        page.append(
+            {
+                "id": f"mem_{i}",
+                "content": content,
+                "importance": rng.random(),
+                "created_at": "2024-01-15T10:30:00Z",
+            }
+        )
+        if len(page) == PAGE:
+            yield page
+            page = []
+    if page:
+        yield page
+
+
+def main() -> None:
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    index = NearDuplicateIndex(capacity=count)
+    hashing = 0.0
+    for page in pages(count):
+        start = time.perf_counter()
+        index.append(page)
+        hashing += time.perf_counter() - start
+    print(f"append    {hashing:8.2f} s  ({count / hashing:,.0f} memories/s)")
+    print(f"index     {index.nbytes / 1e6:8.1f} MB")
+
+    start = time.perf_counter()
+    report = index.find()
+    print(f"find      {time.perf_counter() - start:8.2f} s  {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark PageRank, degree centrality and connected components on a snapshot.
+
+Builds a synthetic GraphSnapshot (1M relationships by default) and times each
+analytic with the SciPy sparse backend and with the NumPy-only fallback.
+
+Run with:
+    pip install keyoku[scipy]
+    python benchmarks/bench_graph_analytics.py [entities] [relationships]
+"""
+
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+from keyoku import graph_analytics
+from keyoku._optional import optional_scipy_sparse
+from keyoku.graph_snapshot import GraphSnapshot
+from keyoku.models import Entity, Relationship
+
+TYPES = ["knows", "works_with", "manages", "located_in", "part_of"]
+
+
+def build(entities: int, relationships: int) -> GraphSnapshot:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    nodes = [
+        Entity.model_construct(id=f"ent_{i}", canonical_name=f"E{i}", type="thing", created_at=now)
+        for i in range(entities)
+    ]
+    edges = [
+        Relationship.model_construct(
+            id=f"rel_{i}",
+            source_entity_id=f"ent_{rng.randrange(entities)}",
+            target_entity_id=f"ent_{rng.randrange(entities)}",
+            relationship_type=TYPES[i % len(TYPES)],
+            created_at=now,
+        )
+        for i in range(relationships)
+    ]
+    start = time.perf_counter()
+    snapshot = GraphSnapshot(nodes, edges)
+    print(f"snapshot build         {time.perf_counter() - start:8.3f} s")
+    return snapshot
+
+
+def run(snapshot: GraphSnapshot, backend: str) -> None:
+    for name in ("pagerank", "degree_centrality", "connected_components"):
+        fn = getattr(graph_analytics, name)
+        start = time.perf_counter()
+        fn(snapshot)
+        elapsed = time.perf_counter() - start
+        print(f"{backend:<6} {name:<22}{elapsed:8.3f} s")
+
+
+def main() -> None:
+    entities = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    relationships = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    snapshot = build(entities, relationships)
+    print(f"graph                  {len(snapshot)} entities, {snapshot.num_relationships} rels")
+
+    if optional_scipy_sparse() is not None:
+        run(snapshot, "scipy")
+    graph_analytics.optional_scipy_sparse = lambda: None  # type: ignore[assignment]
+    run(snapshot, "numpy")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark local path finding on a GraphSnapshot against graph.find_path.
+
+Builds a synthetic graph and times snapshot construction, local find_path
+and 2-hop neighborhoods. With KEYOKU_API_KEY set, the snapshot is loaded
+from that tenant instead and the same random pairs are also timed through
+the remote graph.find_path endpoint.
+
+Run with:
+    pip install keyoku[numpy]
+    python benchmarks/bench_graph_snapshot.py [entities] [relationships] [queries]
+    KEYOKU_API_KEY=... python benchmarks/bench_graph_snapshot.py 0 0 [queries]
+"""
+
+import os
+import random
+import sys
+import time
+from datetime import datetime, timezone
+
+from keyoku import Keyoku
+from keyoku.graph_snapshot import GraphSnapshot
+from keyoku.models import Entity, Relationship
+
+TYPES = ["knows", "works_with", "manages", "located_in", "part_of"]
+
+
+def synthetic(entities: int, relationships: int) -> GraphSnapshot:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    nodes = [
+        Entity.model_construct(id=f"ent_{i}", canonical_name=f"E{i}", type="thing", created_at=now)
+        for i in range(entities)
+    ]
+    edges = [
+        Relationship.model_construct(
+            id=f"rel_{i}",
+            source_entity_id=f"ent_{rng.randrange(entities)}",
+            target_entity_id=f"ent_{rng.randrange(entities)}",
+            relationship_type=TYPES[i % len(TYPES)],
+            created_at=now,
+        )
+        for i in range(relationships)
+    ]
+    start = time.perf_counter()
+    snapshot = GraphSnapshot(nodes, edges)
+    elapsed = time.perf_counter() - start
+    print(f"build               {elapsed:8.3f} s  ({snapshot.nbytes / 1e6:.1f} MB CSR)")
+    return snapshot
+
+
+def timed(label: str, queries: list[tuple[str, str]], fn) -> None:
+    start = time.perf_counter()
+    found = sum(fn(a, b) is not None for a, b in queries)
+    elapsed = time.perf_counter() - start
+    per_query = elapsed / len(queries) * 1e3
+    print(f"{label:<20}{per_query:8.3f} ms/query  ({found}/{len(queries)} found)")
+
+
+def main() -> None:
+    entities = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    relationships = int(sys.argv[2]) if len(sys.argv) > 2 else 500_000
+    queries = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+
+    api_key = os.environ.get("KEYOKU_API_KEY")
+    client = Keyoku(api_key=api_key) if api_key else None
+    if client:
+        start = time.perf_counter()
+        snapshot = client.graph.snapshot()
+        print(f"load (remote)       {time.perf_counter() - start:8.3f} s")
+    else:
+        snapshot = synthetic(entities, relationships)
+    print(f"graph               {len(snapshot)} entities, {snapshot.num_relationships} rels")
+
+    rng = random.Random(1)
+    ids = snapshot.entity_ids
+    pairs = [(rng.choice(ids), rng.choice(ids)) for _ in range(queries)]
+
+    timed("find_path (local)", pairs, lambda a, b: snapshot.find_path(a, b, max_depth=5))
+    timed(
+        "neighborhood d=2",
+        pairs,
+        lambda a, b: snapshot.neighborhood([a], depth=2) or None,
+    )
+    if client:
+        timed("find_path (remote)", pairs, lambda a, b: client.graph.find_path(a, b, max_depth=5))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark raw records against validated pydantic models.
+
+Decodes the same search payload into MemorySearchResult models and into
+MemorySearchRecord objects, reporting CPU time and retained memory.
+
+Run with:
+    python benchmarks/bench_records.py
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from keyoku.models import MemorySearchResult
+from keyoku.records import MemorySearchRecord
+
+N = 50_000
+
+
+def make_rows(n: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "id": f"mem_{i:08d}",
+            "content": f"User mentioned preference number {i}",
+            "type": "preference",
+            "agent_id": "default",
+            "importance": 0.5,
+            "score": 0.9,
+            "created_at": "2024-01-15T10:30:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+def measure(label: str, build: Callable[[], list[Any]]) -> None:
+    gc.collect()
+    start = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    print(
+        f"{label:<22} {elapsed * 1000:9.1f} ms  "
+        f"{elapsed / N * 1e6:6.2f} us/row  {retained / N:7.0f} B/row"
+    )
+
+
+def main() -> None:
+    rows = make_rows(N)
+    print(f"Decoding {N} search rows")
+    measure("MemorySearchResult", lambda: [MemorySearchResult(**m) for m in rows])
+    measure("MemorySearchRecord", lambda: [MemorySearchRecord(m) for m in rows])
+
+    def records_with_dates() -> list[Any]:
+        records = [MemorySearchRecord(m) for m in rows]
+        for r in records:
+            r.created_at
+        return records
+
+    measure("  + created_at access", records_with_dates)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark client-side reranking of search results.
+
+Compares keyoku.ranking.Reranker against an equivalent pure-Python sort.
+
+Run with:
+    pip install keyoku[numpy]
+    python benchmarks/bench_rerank.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from keyoku.models import MemorySearchResult
+from keyoku.ranking import Reranker
+
+N = 10_000
+LIMIT = 100
+REPEAT = 20
+
+
+def make_results(n: int) -> list[MemorySearchResult]:
+    rng = random.Random(0)
+    now = datetime.now(timezone.utc)
+    return [
+        MemorySearchResult(
+            id=f"mem_{i}",
+            content=f"memory {i}",
+            type="fact",
+            agent_id="default",
+            importance=rng.random(),
+            score=rng.random(),
+            created_at=now - timedelta(seconds=rng.randrange(90 * 86400)),
+        )
+        for i in range(n)
+    ]
+
+
+def python_rerank(
+    results: list[MemorySearchResult], reranker: Reranker, now: datetime, limit: int
+) -> list[MemorySearchResult]:
+    reference = now.timestamp()
+
+    def key(r: MemorySearchResult) -> float:
+        age = max(reference - r.created_at.timestamp(), 0.0)
+        return (
+            reranker.score_weight * r.score
+            + reranker.importance_weight * r.importance
+            + reranker.recency_weight * 0.5 ** (age / reranker.half_life)
+        )
+
+    return sorted(results, key=key, reverse=True)[:limit]
+
+
+def bench(label: str, fn: object) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        fn()  # type: ignore[operator]
+    elapsed = (time.perf_counter() - start) / REPEAT
+    print(f"{label:<12} {elapsed * 1000:8.2f} ms")
+    return elapsed
+
+
+def main() -> None:
+    results = make_results(N)
+    reranker = Reranker(importance_weight=0.3, recency_weight=0.2, half_life=7 * 86400.0)
+    now = datetime.now(timezone.utc)
+
+    expected = [r.id for r in python_rerank(results, reranker, now, LIMIT)]
+    actual = [r.id for r in reranker.rerank(results, limit=LIMIT, now=now)]
+    assert expected == actual, "rerank mismatch"
+
+    print(f"Reranking {N} results, keeping top {LIMIT} ({REPEAT} runs)")
+    py = bench("python", lambda: python_rerank(results, reranker, now, LIMIT))
+    np_ = bench("numpy", lambda: reranker.rerank(results, limit=LIMIT, now=now))
+    print(f"speedup      {py / np_:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -17,6 +17,7 @@ from keyoku.exceptions import (
     ValidationError,
     RateLimitError,
     ServerError,
+    IntegrityError,
 )
 
 __version__ = "0.1.0"
@@ -39,4 +40,5 @@ __all__ = [
     "ValidationError",
     "RateLimitError",
     "ServerError",
+    "IntegrityError",
 ]
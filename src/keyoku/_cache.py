@@ -0,0 +1,255 @@
+"""Small in-process caches used by the clients and resources."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Generic, Hashable, Optional, TypeVar, Union
+
+V = TypeVar("V")
+
+
+class _Missing:
+    pass
+
+
+MISSING: Any = _Missing()
+
+
+class TTLCache(Generic[V]):
+    """Thread-safe LRU cache whose entries expire ``ttl`` seconds after being set.
+
+    ``None`` is a valid cached value, so callers can record negative results;
+    use ``MISSING`` as the default to tell a miss from a cached ``None``.
+    """
+
+    def __init__(
+        self, ttl: float, maxsize: int = 10_000, *, clock: Callable[[], float] = time.monotonic
+    ):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = MISSING) -> Union[V, Any]:
+        """Return the cached value for ``key``, or ``default`` if absent or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+class Validated(Generic[V]):
+    """A parsed response body with the validators needed to revalidate it."""
+
+    __slots__ = ("value", "etag", "last_modified")
+
+    def __init__(self, value: V, etag: Optional[str], last_modified: Optional[str]):
+        self.value = value
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def headers(self) -> dict[str, str]:
+        """Conditional request headers for this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ValidatorCache:
+    """Thread-safe LRU store of parsed GET responses keyed by request."""
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, Validated[Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> Optional[Validated[Any]]:
+        """Return the entry for ``key``, if any."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, entry: Validated[Any]) -> None:
+        """Store ``entry``, evicting the least recently used one if full."""
+        with self._lock:
+            self._data[key] = entry
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for ``key``, if any."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def request_key(path: str, params: Optional[dict[str, Any]]) -> Hashable:
+    """Cache key for a GET request."""
+    return (path, tuple(sorted((params or {}).items())))
+
+
+class StaleWhileRevalidate(Generic[V]):
+    """Caches one value, serving it stale while a background thread refreshes it.
+
+    A value younger than ``max_age`` is returned as is. Up to
+    ``stale_while_revalidate`` seconds past that, it is still returned at once
+    and a single background refresh is started if none is running. Older (or
+    missing) values are fetched synchronously, one caller at a time.
+    """
+
+    def __init__(self, fetch: Callable[[], V], *, clock: Callable[[], float] = time.monotonic):
+        self._fetch = fetch
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._value: Any = MISSING
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self.last_error: Optional[Exception] = None
+
+    def get(self, max_age: float, stale_while_revalidate: float) -> V:
+        """Return the cached value according to the freshness windows."""
+        value = self._cached(max_age, stale_while_revalidate)
+        if value is not MISSING:
+            return value  # type: ignore[no-any-return]
+        with self._load_lock:
+            # Another caller may have loaded it while we waited.
+            value = self._cached(max_age, 0.0)
+            if value is not MISSING:
+                return value  # type: ignore[no-any-return]
+            value = self._fetch()
+            self._store(value)
+            return value
+
+    def invalidate(self) -> None:
+        """Forget the cached value."""
+        with self._lock:
+            self._value = MISSING
+
+    def _cached(self, max_age: float, stale_while_revalidate: float) -> Any:
+        with self._lock:
+            if self._value is MISSING:
+                return MISSING
+            age = self._clock() - self._fetched_at
+            if age < max_age:
+                return self._value
+            if age < max_age + stale_while_revalidate:
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(target=self._refresh, daemon=True).start()
+                return self._value
+            return MISSING
+
+    def _store(self, value: V) -> None:
+        with self._lock:
+            self._value = value
+            self._fetched_at = self._clock()
+            self.last_error = None
+
+    def _refresh(self) -> None:
+        try:
+            self._store(self._fetch())
+        except Exception as e:
+            self.last_error = e
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+class AsyncStaleWhileRevalidate(Generic[V]):
+    """Async version of StaleWhileRevalidate; refreshes run as event-loop tasks."""
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[V]],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._fetch = fetch
+        self._clock = clock
+        self._load_lock: Optional[asyncio.Lock] = None
+        self._value: Any = MISSING
+        self._fetched_at = 0.0
+        self._refresh_task: Optional[asyncio.Task[None]] = None
+        self.last_error: Optional[Exception] = None
+
+    async def get(self, max_age: float, stale_while_revalidate: float) -> V:
+        """Return the cached value according to the freshness windows."""
+        value = self._cached(max_age, stale_while_revalidate)
+        if value is not MISSING:
+            return value  # type: ignore[no-any-return]
+        if self._load_lock is None:
+            self._load_lock = asyncio.Lock()
+        async with self._load_lock:
+            value = self._cached(max_age, 0.0)
+            if value is not MISSING:
+                return value  # type: ignore[no-any-return]
+            value = await self._fetch()
+            self._store(value)
+            return value
+
+    def invalidate(self) -> None:
+        """Forget the cached value."""
+        self._value = MISSING
+
+    def _cached(self, max_age: float, stale_while_revalidate: float) -> Any:
+        if self._value is MISSING:
+            return MISSING
+        age = self._clock() - self._fetched_at
+        if age < max_age:
+            return self._value
+        if age < max_age + stale_while_revalidate:
+            if self._refresh_task is None or self._refresh_task.done():
+                self._refresh_task = asyncio.ensure_future(self._refresh())
+            return self._value
+        return MISSING
+
+    def _store(self, value: V) -> None:
+        self._value = value
+        self._fetched_at = self._clock()
+        self.last_error = None
+
+    async def _refresh(self) -> None:
+        try:
+            self._store(await self._fetch())
+        except Exception as e:
+            self.last_error = e
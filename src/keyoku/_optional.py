@@ -0,0 +1,37 @@
+"""Helpers for optional third-party dependencies."""
+
+from types import ModuleType
+from typing import Optional, cast
+
+
+def require_numpy() -> ModuleType:
+    """Import NumPy, raising a helpful error if it is not installed."""
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError(
+            "NumPy is required for this feature. "
+            "Install it with: pip install keyoku[numpy]"
+        ) from e
+    return numpy
+
+
+def require_pyarrow() -> ModuleType:
+    """Import PyArrow, raising a helpful error if it is not installed."""
+    try:
+        import pyarrow  # type: ignore[import-untyped]
+    except ImportError as e:
+        raise ImportError(
+            "PyArrow is required for this feature. "
+            "Install it with: pip install keyoku[arrow]"
+        ) from e
+    return cast(ModuleType, pyarrow)
+
+
+def optional_scipy_sparse() -> Optional[ModuleType]:
+    """Import scipy.sparse if installed, or return None so callers can fall back to NumPy."""
+    try:
+        import scipy.sparse  # type: ignore[import-untyped]
+    except ImportError:
+        return None
+    return cast(ModuleType, scipy.sparse)
@@ -0,0 +1,103 @@
+"""Offset pagination helpers with lookahead prefetch."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+
+
+def iter_pages(
+    fetch: Callable[[int, int], Sequence[T]],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> Iterator[T]:
+    """Yield items from ``fetch(limit, offset)`` one page at a time.
+
+    While the caller consumes a full page, the next page is requested on a
+    background thread. Iteration stops after the first short page.
+
+    Args:
+        fetch: Callable returning up to ``limit`` items starting at ``offset``
+        page_size: Items requested per page
+        offset: Offset of the first item
+
+    Yields:
+        Items in server order
+    """
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending: Optional[Future[Sequence[T]]] = pool.submit(fetch, page_size, offset)
+        try:
+            while pending is not None:
+                page = pending.result()
+                pending = None
+                offset += len(page)
+                if len(page) >= page_size:
+                    pending = pool.submit(fetch, page_size, offset)
+                yield from page
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def aiter_pages(
+    fetch: Callable[[int, int], Awaitable[Sequence[T]]],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+) -> AsyncIterator[T]:
+    """Async version of :func:`iter_pages`; the next page is fetched as a task."""
+    pending: Optional[asyncio.Task[Sequence[T]]] = asyncio.ensure_future(fetch(page_size, offset))
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+            offset += len(page)
+            if len(page) >= page_size:
+                pending = asyncio.ensure_future(fetch(page_size, offset))
+            for item in page:
+                yield item
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+def fetch_pages(
+    fetch: Callable[[int, int], Sequence[T]],
+    *,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    max_workers: int = 8,
+) -> list[T]:
+    """Fetch every page, ``max_workers`` pages at a time.
+
+    Pages are requested in waves of consecutive offsets and concatenated in
+    order; the wave containing the first short page is the last one.
+
+    Args:
+        fetch: Callable returning up to ``limit`` items starting at ``offset``
+        page_size: Items requested per page
+        max_workers: Pages requested concurrently
+
+    Returns:
+        All items in server order
+    """
+    items: list[T] = []
+    offset = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            futures = [
+                pool.submit(fetch, page_size, offset + i * page_size) for i in range(max_workers)
+            ]
+            for future in futures:
+                page = future.result()
+                items.extend(page)
+                if len(page) < page_size:
+                    for rest in futures:
+                        rest.cancel()
+                    return items
+            offset += max_workers * page_size
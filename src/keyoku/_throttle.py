@@ -0,0 +1,44 @@
+"""Client-side request pacing."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Optional
+
+
+class RateLimiter:
+    """Spaces calls at least ``1 / rate`` seconds apart across threads."""
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            rate: Maximum calls per second, or None for no limit
+            clock: Monotonic clock
+            sleep: Sleep function
+        """
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        self._interval = 1.0 / rate if rate else 0.0
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next = 0.0
+
+    def acquire(self) -> None:
+        """Block until the next call is allowed."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = self._clock()
+            start = max(now, self._next)
+            self._next = start + self._interval
+        if start > now:
+            self._sleep(start - now)
@@ -1,7 +1,9 @@
 """Asynchronous Keyoku client."""
 
 import asyncio
-from typing import Any, Optional
+import copy
+import itertools
+from typing import Any, Callable, Literal, Optional, Sequence, TypeVar, Union, overload
 
 import httpx
 
@@ -19,10 +21,23 @@ from keyoku.models import (
     MemorySearchResult,
     Stats,
 )
+from keyoku._cache import AsyncStaleWhileRevalidate, Validated, ValidatorCache, request_key
+from keyoku.columnar import MemoryColumns
+from keyoku.loader import AsyncLoaders
+from keyoku.ranking import Reranker, fuse_results
+from keyoku.resources.audit import AsyncAuditResource
+from keyoku.resources.data import AsyncDataResource
+from keyoku.resources.entities import AsyncEntitiesResource
+from keyoku.resources.memories import AsyncMemoriesResource
+from keyoku.resources.relationships import AsyncRelationshipsResource
+from keyoku.records import MemorySearchRecord
 
 
 DEFAULT_BASE_URL = "https://api.keyoku.dev"
 DEFAULT_TIMEOUT = 30.0
+VALIDATOR_CACHE_SIZE = 1024
+
+T = TypeVar("T")
 
 
 class AsyncKeyoku:
@@ -66,6 +81,18 @@ class AsyncKeyoku:
             timeout=timeout,
             headers=self._default_headers(),
         )
+        self._validators = ValidatorCache(VALIDATOR_CACHE_SIZE)
+        self._stats_cache: AsyncStaleWhileRevalidate[Stats] = AsyncStaleWhileRevalidate(
+            self._fetch_stats
+        )
+
+        # Initialize resources
+        self.memories = AsyncMemoriesResource(self)
+        self.entities = AsyncEntitiesResource(self)
+        self.relationships = AsyncRelationshipsResource(self)
+        self.data = AsyncDataResource(self)
+        self.audit = AsyncAuditResource(self)
+        self.loaders = AsyncLoaders(self)
 
     def _default_headers(self) -> dict[str, str]:
         headers = {
@@ -81,6 +108,9 @@ class AsyncKeyoku:
         """Handle API response and raise appropriate exceptions."""
         if response.status_code == 200 or response.status_code == 201:
             return response.json() if response.content else None
+        if response.status_code == 304:
+            # Not Modified: callers holding a cached body reuse it.
+            return None
 
         try:
             error_data = response.json()
@@ -113,6 +143,7 @@ class AsyncKeyoku:
         *,
         json: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
     ) -> Any:
         """Make an async API request."""
         response = await self._client.request(
@@ -120,9 +151,53 @@ class AsyncKeyoku:
             path,
             json=json,
             params=params,
+            headers=headers,
         )
         return self._handle_response(response)
 
+    async def conditional_get(
+        self,
+        path: str,
+        parse: Callable[[Any], T],
+        *,
+        params: Optional[dict[str, Any]] = None,
+    ) -> T:
+        """Make a GET request, revalidating a cached body with ETag/Last-Modified.
+
+        When an earlier response carried an ``ETag`` or ``Last-Modified``
+        header, the request sends ``If-None-Match``/``If-Modified-Since`` and
+        a 304 response returns a copy of the cached parsed value without
+        re-parsing. Callers get their own copy, so mutating it does not affect
+        the cache.
+
+        Args:
+            path: Request path
+            parse: Turns the JSON body into the returned value
+            params: Query parameters
+
+        Returns:
+            The parsed (possibly cached) response
+        """
+        key = request_key(path, params)
+        cached = self._validators.get(key)
+        response = await self._client.request(
+            "GET",
+            path,
+            params=params,
+            headers=cached.headers() if cached else None,
+        )
+        if response.status_code == 304 and cached is not None:
+            return copy.deepcopy(cached.value)  # type: ignore[no-any-return]
+
+        value = parse(self._handle_response(response))
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._validators.set(key, Validated(copy.deepcopy(value), etag, last_modified))
+        else:
+            self._validators.discard(key)
+        return value
+
     async def remember(
         self,
         content: str,
@@ -149,6 +224,30 @@ class AsyncKeyoku:
         response = await self.request("POST", "/v1/memories", json=data)
         return AsyncJobHandle(self, response["job_id"])
 
+    @overload
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = ...,
+        mode: str = ...,
+        agent_id: Optional[str] = ...,
+        rerank: Optional[Reranker] = ...,
+        raw: Literal[False] = ...,
+    ) -> list[MemorySearchResult]: ...
+
+    @overload
+    async def search(
+        self,
+        query: str,
+        *,
+        limit: int = ...,
+        mode: str = ...,
+        agent_id: Optional[str] = ...,
+        rerank: Optional[Reranker] = ...,
+        raw: Literal[True],
+    ) -> list[MemorySearchRecord]: ...
+
     async def search(
         self,
         query: str,
@@ -156,7 +255,9 @@ class AsyncKeyoku:
         limit: int = 10,
         mode: str = "hybrid",
         agent_id: Optional[str] = None,
-    ) -> list[MemorySearchResult]:
+        rerank: Optional[Reranker] = None,
+        raw: bool = False,
+    ) -> Union[list[MemorySearchResult], list[MemorySearchRecord]]:
         """Search memories.
 
         Args:
@@ -164,10 +265,103 @@ class AsyncKeyoku:
             limit: Maximum results to return (default: 10)
             mode: Search mode - "semantic", "keyword", or "hybrid"
             agent_id: Filter by agent ID
+            rerank: Optional Reranker; fetches ``limit * rerank.overfetch``
+                results and keeps the best ``limit`` after reranking
+            raw: Return lightweight MemorySearchRecord objects without validation
 
         Returns:
             List of matching memories with scores
         """
+        fetch_limit = limit * rerank.overfetch if rerank else limit
+        rows = await self._search(query, limit=fetch_limit, mode=mode, agent_id=agent_id)
+        if raw:
+            records = [MemorySearchRecord(m) for m in rows]
+            return rerank.rerank(records, limit=limit) if rerank else records
+        results = [MemorySearchResult(**m) for m in rows]
+        return rerank.rerank(results, limit=limit) if rerank else results
+
+    async def search_columns(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        mode: str = "hybrid",
+        agent_id: Optional[str] = None,
+    ) -> MemoryColumns:
+        """Search memories and return the results as columns.
+
+        Requires NumPy (pip install keyoku[numpy]).
+
+        Args:
+            query: Search query
+            limit: Maximum results to return (default: 10)
+            mode: Search mode - "semantic", "keyword", or "hybrid"
+            agent_id: Filter by agent ID
+
+        Returns:
+            MemoryColumns in server rank order
+        """
+        rows = await self._search(query, limit=limit, mode=mode, agent_id=agent_id)
+        return MemoryColumns.from_rows(rows)
+
+    async def federated_search(
+        self,
+        query: str,
+        *,
+        agent_ids: Optional[Sequence[str]] = None,
+        entity_ids: Optional[Sequence[str]] = None,
+        limit: int = 10,
+        mode: str = "hybrid",
+        fusion: str = "rrf",
+        per_source_limit: Optional[int] = None,
+        max_workers: int = 8,
+    ) -> list[MemorySearchResult]:
+        """Search across several agents and tenants and merge the results.
+
+        One search is issued per (entity_id, agent_id) combination, concurrently.
+        The result lists are fused with ``keyoku.ranking.fuse_results``.
+        Requires NumPy (pip install keyoku[numpy]).
+
+        Args:
+            query: Search query
+            agent_ids: Agent IDs to search (default: no agent filter)
+            entity_ids: Entity IDs (tenants) to search (default: client entity_id)
+            limit: Maximum results to return after fusion (default: 10)
+            mode: Search mode - "semantic", "keyword", or "hybrid"
+            fusion: Fusion method - "rrf" or "score"
+            per_source_limit: Results requested per source (default: limit)
+            max_workers: Maximum concurrent searches
+
+        Returns:
+            Deduplicated results with fused scores
+        """
+        tenants: list[Optional[str]] = list(entity_ids) if entity_ids else [None]
+        agents: list[Optional[str]] = list(agent_ids) if agent_ids else [None]
+        sources = list(itertools.product(tenants, agents))
+        source_limit = per_source_limit or limit
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def search(entity_id: Optional[str], agent_id: Optional[str]) -> list[dict[str, Any]]:
+            async with semaphore:
+                return await self._search(
+                    query, limit=source_limit, mode=mode, agent_id=agent_id, entity_id=entity_id
+                )
+
+        all_rows = await asyncio.gather(*(search(e, a) for e, a in sources))
+        result_lists = [[MemorySearchResult(**m) for m in rows] for rows in all_rows]
+        return fuse_results(result_lists, method=fusion, limit=limit)
+
+    async def _search(
+        self,
+        query: str,
+        *,
+        limit: int,
+        mode: str,
+        agent_id: Optional[str] = None,
+        entity_id: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Run a search and return the undecoded result rows."""
         data: dict[str, Any] = {
             "query": query,
             "limit": limit,
@@ -175,14 +369,40 @@ class AsyncKeyoku:
         }
         if agent_id:
             data["agent_id"] = agent_id
+        headers = {"X-Entity-ID": entity_id} if entity_id else None
 
-        response = await self.request("POST", "/v1/memories/search", json=data)
-        return [MemorySearchResult(**m) for m in response["memories"]]
+        response = await self.request(
+            "POST", "/v1/memories/search", json=data, headers=headers
+        )
+        rows: list[dict[str, Any]] = response["memories"]
+        return rows
+
+    async def stats(
+        self,
+        *,
+        max_age: Optional[float] = None,
+        stale_while_revalidate: float = 60.0,
+    ) -> Stats:
+        """Get memory statistics.
+
+        Revalidated with a conditional GET when the server sends validators.
+
+        Args:
+            max_age: Serve a cached result up to this many seconds old. None
+                (default) always asks the server.
+            stale_while_revalidate: For this many seconds past ``max_age``,
+                return the cached result at once and refresh it in a
+                background task
+
+        Returns:
+            Stats
+        """
+        if max_age is None:
+            return await self._fetch_stats()
+        return await self._stats_cache.get(max_age, stale_while_revalidate)
 
-    async def stats(self) -> Stats:
-        """Get memory statistics."""
-        response = await self.request("GET", "/v1/stats")
-        return Stats(**response)
+    async def _fetch_stats(self) -> Stats:
+        return await self.conditional_get("/v1/stats", lambda data: Stats(**data))
 
     async def close(self) -> None:
         """Close the HTTP client."""
@@ -212,12 +432,17 @@ class AsyncJobHandle:
         *,
         poll_interval: float = 0.5,
         timeout: Optional[float] = None,
+        backoff: float = 1.0,
+        max_poll_interval: Optional[float] = None,
     ) -> Job:
         """Wait for job to complete.
 
         Args:
             poll_interval: Seconds between status checks
             timeout: Maximum seconds to wait (None = no timeout)
+            backoff: Factor applied to the interval after each check
+                (1.0 = fixed interval)
+            max_poll_interval: Upper bound for the interval when backing off
 
         Returns:
             Completed job
@@ -229,6 +454,7 @@ class AsyncJobHandle:
         import time
 
         start = time.time()
+        delay = poll_interval
         while True:
             job = await self.get()
             if job.status == JobStatus.COMPLETED:
@@ -239,4 +465,7 @@ class AsyncJobHandle:
             if timeout and (time.time() - start) > timeout:
                 raise TimeoutError(f"Job {self.job_id} did not complete in {timeout}s")
 
-            await asyncio.sleep(poll_interval)
+            await asyncio.sleep(delay)
+            delay *= backoff
+            if max_poll_interval is not None:
+                delay = min(delay, max_poll_interval)
@@ -0,0 +1,142 @@
+"""Local aggregation of audit log entries.
+
+Install with: pip install keyoku[numpy]
+
+Operations and resource types are interned to integer codes and timestamps
+are parsed a chunk at a time, so grouping a large backfill runs on NumPy
+arrays rather than a Python object per row and group.
+
+Example:
+    ```python
+    from keyoku.audit_analytics import count_audit_logs
+
+    logs = client.audit.backfill("2024-01-01T00:00:00Z", raw=True)
+    counts = count_audit_logs(logs, by=("operation", "hour"))
+    for operation, hour, n in zip(counts.operation, counts.hour, counts.count):
+        ...
+    ```
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+from keyoku._optional import require_numpy
+from keyoku.columnar import GrowableArray, parse_timestamps
+from keyoku.records import format_datetime
+
+if TYPE_CHECKING:
+    from keyoku.resources.audit import AuditEntry
+
+GROUP_FIELDS = ("operation", "resource_type", "hour")
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+class AuditCounts:
+    """Entry counts per group as parallel NumPy arrays, sorted by group.
+
+    ``operation`` and ``resource_type`` are object arrays of names, ``hour``
+    is ``datetime64[h]`` in UTC and ``count`` is int64. Fields that were not
+    grouped on are None; ``by`` lists the grouped fields in sort order.
+    """
+
+    def __init__(
+        self,
+        *,
+        by: Sequence[str],
+        operation: Optional[Any],
+        resource_type: Optional[Any],
+        hour: Optional[Any],
+        count: Any,
+    ):
+        self.by = tuple(by)
+        self.operation = operation
+        self.resource_type = resource_type
+        self.hour = hour
+        self.count = count
+
+    def __len__(self) -> int:
+        return len(self.count)
+
+    def __repr__(self) -> str:
+        return f"AuditCounts(groups={len(self)}, entries={int(self.count.sum())})"
+
+    def to_dict(self) -> dict[tuple[Any, ...], int]:
+        """Return the counts keyed by tuples of the ``by`` fields."""
+        columns = [getattr(self, name).tolist() for name in self.by]
+        return dict(zip(zip(*columns), self.count.tolist()))
+
+
+def _field(entry: "AuditEntry", name: str) -> Any:
+    return entry[name] if isinstance(entry, dict) else getattr(entry, name)
+
+
+def _hours(values: Sequence[Any]) -> Any:
+    """Truncate ``created_at`` strings or datetimes to ``datetime64[h]``."""
+    strings = [value if isinstance(value, str) else format_datetime(value) for value in values]
+    return parse_timestamps(strings).astype("datetime64[h]")
+
+
+def count_audit_logs(
+    logs: Iterable["AuditEntry"],
+    *,
+    by: Sequence[str] = GROUP_FIELDS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AuditCounts:
+    """Count audit log entries per group.
+
+    Args:
+        logs: AuditLog models or raw dicts, e.g. from ``client.audit.backfill()``
+        by: Fields to group on, any of "operation", "resource_type" and "hour"
+        chunk_size: Entries converted to arrays at a time
+
+    Returns:
+        AuditCounts with one row per group, sorted by the ``by`` fields
+    """
+    if not by or len(set(by)) != len(by) or set(by) - set(GROUP_FIELDS):
+        raise ValueError(f"by must be a non-empty subset of {GROUP_FIELDS}")
+    np = require_numpy()
+
+    names: dict[str, dict[str, int]] = {
+        name: {} for name in ("operation", "resource_type") if name in by
+    }
+    codes = {name: GrowableArray(np.int64) for name in names}
+    hours = GrowableArray("datetime64[h]") if "hour" in by else None
+
+    entries = iter(logs)
+    while True:
+        chunk = list(islice(entries, chunk_size))
+        if not chunk:
+            break
+        for name, column in codes.items():
+            table = names[name]
+            column.extend(np.fromiter(
+                (table.setdefault(_field(entry, name), len(table)) for entry in chunk),
+                dtype=np.int64,
+                count=len(chunk),
+            ))
+        if hours is not None:
+            hours.extend(_hours([_field(entry, "created_at") for entry in chunk]))
+
+    keys = []
+    labels = {}
+    for name in by:
+        if hours is not None and name == "hour":
+            keys.append(hours.view().astype(np.int64))
+            continue
+        table = names[name]
+        # Recode in name order so groups sort alphabetically.
+        labels[name] = np.array(sorted(table), dtype=object)
+        rank = np.empty(len(table), dtype=np.int64)
+        rank[[table[label] for label in labels[name]]] = np.arange(len(table))
+        keys.append(rank[codes[name].view()])
+
+    groups, count = np.unique(np.stack(keys, axis=1), axis=0, return_counts=True)
+    columns: dict[str, Any] = {name: None for name in GROUP_FIELDS}
+    for i, name in enumerate(by):
+        if name == "hour":
+            columns[name] = groups[:, i].astype("datetime64[h]")
+        else:
+            columns[name] = labels[name][groups[:, i]]
+    return AuditCounts(by=by, **columns, count=count.astype(np.int64))
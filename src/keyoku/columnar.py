@@ -0,0 +1,203 @@
+"""Columnar memory results backed by NumPy arrays.
+
+Install with: pip install keyoku[numpy] (or keyoku[arrow] for to_arrow())
+
+Columns are built straight from the decoded JSON rows, without creating a
+model object per row.
+
+Example:
+    ```python
+    columns = client.memories.scan_columns(page_size=100)
+    print(columns.importance.mean())
+
+    table = columns.to_arrow()  # requires pyarrow
+    ```
+"""
+
+from datetime import timezone
+from typing import Any, Iterable, Sequence
+
+from keyoku._optional import require_numpy, require_pyarrow
+from keyoku.records import parse_datetime
+
+COLUMNS = ("id", "content", "type", "agent_id", "importance", "score", "created_at")
+DEFAULT_CAPACITY = 1024
+
+
+def _timestamp_strings(values: Iterable[str]) -> list[str]:
+    """Normalize API timestamps to naive UTC strings NumPy can parse."""
+    out = []
+    for value in values:
+        if value.endswith("Z"):
+            out.append(value[:-1])
+        else:
+            parsed = parse_datetime(value)
+            if parsed.tzinfo is not None:
+                parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+            out.append(parsed.isoformat())
+    return out
+
+
+def parse_timestamps(values: Sequence[str]) -> Any:
+    """Parse API timestamps into a ``datetime64[us]`` array in UTC."""
+    np = require_numpy()
+    return np.array(_timestamp_strings(values), dtype="datetime64[us]")
+
+
+class GrowableArray:
+    """A NumPy buffer that doubles its capacity as values are appended.
+
+    A subarray dtype such as ``(np.uint8, 16)`` gives a 2-D buffer that grows
+    by rows.
+    """
+
+    def __init__(self, dtype: Any, capacity: int = DEFAULT_CAPACITY):
+        np = require_numpy()
+        self._np = np
+        self._buffer = np.empty(max(capacity, 1), dtype=dtype)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def reserve(self, capacity: int) -> None:
+        """Ensure the buffer can hold at least ``capacity`` values."""
+        if capacity <= len(self._buffer):
+            return
+        new_capacity = max(capacity, 2 * len(self._buffer))
+        shape = (new_capacity,) + self._buffer.shape[1:]
+        buffer = self._np.empty(shape, dtype=self._buffer.dtype)
+        buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = buffer
+
+    def extend(self, values: Any) -> None:
+        """Append an array or sequence of values."""
+        n = len(values)
+        self.reserve(self._size + n)
+        self._buffer[self._size : self._size + n] = values
+        self._size += n
+
+    def view(self) -> Any:
+        """Return the filled part of the buffer (no copy)."""
+        return self._buffer[: self._size]
+
+
+class MemoryColumns:
+    """Memory fields as parallel NumPy arrays.
+
+    String columns are object arrays, ``importance`` and ``score`` are float64
+    (``score`` is NaN for rows that came from listings), and ``created_at`` is
+    ``datetime64[us]`` in UTC.
+    """
+
+    def __init__(
+        self,
+        *,
+        id: Any,
+        content: Any,
+        type: Any,
+        agent_id: Any,
+        importance: Any,
+        score: Any,
+        created_at: Any,
+    ):
+        self.id = id
+        self.content = content
+        self.type = type
+        self.agent_id = agent_id
+        self.importance = importance
+        self.score = score
+        self.created_at = created_at
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[dict[str, Any]]) -> "MemoryColumns":
+        """Build columns from decoded memory or search result rows."""
+        builder = MemoryColumnBuilder(capacity=max(len(rows), 1))
+        builder.append(rows)
+        return builder.build()
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def __repr__(self) -> str:
+        return f"MemoryColumns(rows={len(self)})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the columns as a dict of arrays."""
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def to_arrow(self) -> Any:
+        """Convert to a ``pyarrow.Table`` (requires pyarrow)."""
+        pa = require_pyarrow()
+        return pa.table({
+            "id": pa.array(self.id, type=pa.string()),
+            "content": pa.array(self.content, type=pa.string()),
+            "type": pa.array(self.type, type=pa.string()),
+            "agent_id": pa.array(self.agent_id, type=pa.string()),
+            "importance": pa.array(self.importance, type=pa.float64()),
+            "score": pa.array(self.score, type=pa.float64(), from_pandas=True),
+            "created_at": pa.array(self.created_at, type=pa.timestamp("us", tz="UTC")),
+        })
+
+
+class MemoryColumnBuilder:
+    """Accumulates pages of memory rows into growable column buffers.
+
+    Example:
+        ```python
+        builder = MemoryColumnBuilder(capacity=page.total)
+        builder.append(page_rows)
+        columns = builder.build()
+        ```
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        np = require_numpy()
+        self._np = np
+        self._strings = {
+            name: GrowableArray(object, capacity)
+            for name in ("id", "content", "type", "agent_id")
+        }
+        self._importance = GrowableArray(np.float64, capacity)
+        self._score = GrowableArray(np.float64, capacity)
+        self._created_at = GrowableArray("datetime64[us]", capacity)
+
+    def __len__(self) -> int:
+        return len(self._importance)
+
+    def reserve(self, capacity: int) -> None:
+        """Ensure all buffers can hold at least ``capacity`` rows."""
+        for column in self._columns():
+            column.reserve(capacity)
+
+    def append(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Append a page of decoded memory or search result rows."""
+        np = self._np
+        n = len(rows)
+        if not n:
+            return
+        for name, column in self._strings.items():
+            column.extend([row[name] for row in rows])
+        self._importance.extend(
+            np.fromiter((row["importance"] for row in rows), dtype=np.float64, count=n)
+        )
+        self._score.extend(
+            np.fromiter((row.get("score", np.nan) for row in rows), dtype=np.float64, count=n)
+        )
+        self._created_at.extend(parse_timestamps([row["created_at"] for row in rows]))
+
+    def build(self) -> MemoryColumns:
+        """Return the accumulated rows as MemoryColumns (views, no copy)."""
+        return MemoryColumns(
+            id=self._strings["id"].view(),
+            content=self._strings["content"].view(),
+            type=self._strings["type"].view(),
+            agent_id=self._strings["agent_id"].view(),
+            importance=self._importance.view(),
+            score=self._score.view(),
+            created_at=self._created_at.view(),
+        )
+
+    def _columns(self) -> list[GrowableArray]:
+        return [*self._strings.values(), self._importance, self._score, self._created_at]
+
@@ -0,0 +1,192 @@
+"""Compact in-memory storage for full-tenant memory scans.
+
+Install with: pip install keyoku[numpy]
+
+``CompactMemoryStore`` keeps one scan in a handful of flat buffers instead of
+one model object per memory:
+
+- ``type`` and ``agent_id`` are interned into int32 codes plus a vocabulary
+- ``created_at`` is stored as int64 microseconds since the Unix epoch
+- ``id`` and ``content`` are UTF-8 encoded into shared byte buffers with
+  int64 offsets
+
+Example:
+    ```python
+    store = client.memories.scan_compact(page_size=100)
+    print(len(store), store.nbytes)
+
+    facts = store.type_codes == store.types.code("fact")
+    ```
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Sequence
+
+from keyoku._optional import require_numpy
+from keyoku.columnar import DEFAULT_CAPACITY, GrowableArray, parse_timestamps
+from keyoku.models import Memory
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class StringPool:
+    """Interns low-cardinality strings into dense int32 codes."""
+
+    def __init__(self) -> None:
+        self._codes: dict[str, int] = {}
+        self.values: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def code(self, value: str) -> int:
+        """Return the code of ``value``, or -1 if it was never interned."""
+        return self._codes.get(value, -1)
+
+    def intern(self, value: str) -> int:
+        """Return the code of ``value``, adding it to the pool if needed."""
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def encode(self, values: Sequence[str]) -> Any:
+        """Intern a batch of values and return their codes as an int32 array."""
+        np = require_numpy()
+        uniques, inverse = np.unique(np.asarray(values, dtype=object), return_inverse=True)
+        lookup = np.fromiter(
+            (self.intern(u) for u in uniques), dtype=np.int32, count=len(uniques)
+        )
+        return lookup[inverse.reshape(-1)]
+
+
+class _ByteColumn:
+    """Variable-length strings stored in one shared UTF-8 buffer."""
+
+    def __init__(self, capacity: int):
+        np = require_numpy()
+        self._np = np
+        self.data = bytearray()
+        self.offsets = GrowableArray(np.int64, capacity + 1)
+        self.offsets.extend([0])
+
+    def extend(self, values: Sequence[str]) -> None:
+        np = self._np
+        encoded = [v.encode("utf-8") for v in values]
+        lengths = np.fromiter((len(b) for b in encoded), dtype=np.int64, count=len(encoded))
+        base = len(self.data)
+        self.data += b"".join(encoded)
+        self.offsets.extend(base + np.cumsum(lengths))
+
+    def get(self, index: int) -> str:
+        offsets = self.offsets.view()
+        start, end = int(offsets[index]), int(offsets[index + 1])
+        return self.data[start:end].decode("utf-8")
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.data) + int(self.offsets.view().nbytes)
+
+
+class CompactMemoryStore:
+    """Memories from a scan, stored as interned codes and flat buffers.
+
+    Rows are appended page by page with ``append``. Individual memories are
+    materialized on demand with ``store[i]`` or by iterating.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        np = require_numpy()
+        self._np = np
+        self.types = StringPool()
+        self.agent_ids = StringPool()
+        self._ids = _ByteColumn(capacity)
+        self._content = _ByteColumn(capacity)
+        self._type_codes = GrowableArray(np.int32, capacity)
+        self._agent_codes = GrowableArray(np.int32, capacity)
+        self._importance = GrowableArray(np.float64, capacity)
+        self._created_at = GrowableArray(np.int64, capacity)
+
+    def __len__(self) -> int:
+        return len(self._importance)
+
+    def __repr__(self) -> str:
+        return f"CompactMemoryStore(rows={len(self)}, nbytes={self.nbytes})"
+
+    def append(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Append a page of decoded memory rows."""
+        np = self._np
+        n = len(rows)
+        if not n:
+            return
+        self._ids.extend([row["id"] for row in rows])
+        self._content.extend([row["content"] for row in rows])
+        self._type_codes.extend(self.types.encode([row["type"] for row in rows]))
+        self._agent_codes.extend(self.agent_ids.encode([row["agent_id"] for row in rows]))
+        self._importance.extend(
+            np.fromiter((row["importance"] for row in rows), dtype=np.float64, count=n)
+        )
+        self._created_at.extend(
+            parse_timestamps([row["created_at"] for row in rows]).astype(np.int64)
+        )
+
+    @property
+    def type_codes(self) -> Any:
+        """int32 codes into ``types.values``."""
+        return self._type_codes.view()
+
+    @property
+    def agent_codes(self) -> Any:
+        """int32 codes into ``agent_ids.values``."""
+        return self._agent_codes.view()
+
+    @property
+    def importance(self) -> Any:
+        """float64 importance per memory."""
+        return self._importance.view()
+
+    @property
+    def created_at(self) -> Any:
+        """int64 microseconds since the Unix epoch (UTC)."""
+        return self._created_at.view()
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes used by the filled part of the buffers."""
+        return (
+            self._ids.nbytes
+            + self._content.nbytes
+            + int(self.type_codes.nbytes)
+            + int(self.agent_codes.nbytes)
+            + int(self.importance.nbytes)
+            + int(self.created_at.nbytes)
+        )
+
+    def id(self, index: int) -> str:
+        """Return the memory ID at ``index``."""
+        return self._ids.get(index)
+
+    def content(self, index: int) -> str:
+        """Return the memory content at ``index``."""
+        return self._content.get(index)
+
+    def __getitem__(self, index: int) -> Memory:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("CompactMemoryStore index out of range")
+        micros = int(self.created_at[index])
+        return Memory(
+            id=self.id(index),
+            content=self.content(index),
+            type=self.types.values[int(self.type_codes[index])],
+            agent_id=self.agent_ids.values[int(self.agent_codes[index])],
+            importance=float(self.importance[index]),
+            created_at=_EPOCH + timedelta(microseconds=micros),
+        )
+
+    def __iter__(self) -> Iterator[Memory]:
+        for i in range(len(self)):
+            yield self[i]
+
@@ -0,0 +1,383 @@
+"""Near-duplicate memory detection with MinHash and LSH.
+
+Install with: pip install keyoku[numpy]
+
+The cleanup strategies only look at age, access and importance, so
+reworded copies of the same memory are never removed. ``NearDuplicateIndex``
+finds them locally:
+
+- content is split into word shingles (``shingle_size`` words) and hashed
+  with ``num_perm`` MinHash permutations, a page of memories per NumPy pass
+- only the low 8 bits of each MinHash are kept (b-bit MinHash), plus
+  importance, created_at and the ID in a shared buffer, which comes to
+  roughly ``num_perm + 30`` bytes per memory; content is not retained
+- signatures are cut into bands; memories sharing a band are compared with
+  their band's first member and linked when the estimated Jaccard
+  similarity reaches ``threshold``
+- linked memories form connected components, ranked by importance (then
+  the newest, or oldest, ``created_at``); the top-ranked memory survives
+  and every member whose estimated similarity *to the survivor* reaches
+  ``threshold`` becomes its duplicate
+
+Members of a component that are too far from its survivor (say, the start
+of a chain of rewordings) are not deleted; they are grouped again around
+the best-ranked of them, and so on.
+
+Example:
+    ```python
+    from keyoku.dedup import delete_duplicates
+
+    report = client.memories.scan_duplicates(threshold=0.8)
+    print(len(report.clusters), len(report.duplicate_ids))
+    delete_duplicates(client, report, chunk_size=100, requests_per_second=5)
+    ```
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from keyoku._optional import optional_scipy_sparse, require_numpy
+from keyoku._throttle import RateLimiter
+from keyoku.columnar import DEFAULT_CAPACITY, GrowableArray, parse_timestamps
+from keyoku.compact import _ByteColumn
+from keyoku.graph_analytics import _label_propagation
+
+if TYPE_CHECKING:
+    from keyoku.client import Keyoku
+
+DEFAULT_THRESHOLD = 0.8
+DEFAULT_NUM_PERM = 128
+DEFAULT_SHINGLE_SIZE = 3
+# LSH recall wanted for pairs exactly at the threshold.
+TARGET_RECALL = 0.99
+# Shingle hashes permuted per NumPy pass (num_perm * 8 bytes each).
+HASH_BLOCK = 16_384
+_BAND_MULTIPLIER = 0x100000001B3
+_WORD = re.compile(r"\w+")
+
+
+def lsh_params(threshold: float, num_perm: int) -> tuple[int, int]:
+    """Pick (bands, rows) for a similarity threshold.
+
+    Returns the split with the most rows per band (fewest false candidates)
+    whose chance of pairing two memories at exactly ``threshold`` is at least
+    ``TARGET_RECALL``.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1 - (1 - threshold**rows) ** bands >= TARGET_RECALL:
+            best = (bands, rows)
+    return best
+
+
+def words(text: str) -> list[str]:
+    """Case-folded words of ``text``, as used for shingling."""
+    return _WORD.findall(text.casefold())
+
+
+class DuplicateCluster:
+    """Near-duplicate memories; ``keep_id`` survives, the rest can go."""
+
+    __slots__ = ("keep_id", "duplicate_ids")
+
+    def __init__(self, keep_id: str, duplicate_ids: list[str]):
+        self.keep_id = keep_id
+        self.duplicate_ids = duplicate_ids
+
+    def __repr__(self) -> str:
+        return f"DuplicateCluster(keep={self.keep_id!r}, duplicates={len(self.duplicate_ids)})"
+
+
+class DuplicateReport:
+    """Clusters found by NearDuplicateIndex.find()."""
+
+    def __init__(self, clusters: list[DuplicateCluster], scanned: int):
+        self.clusters = clusters
+        self.scanned = scanned
+
+    @property
+    def duplicate_ids(self) -> list[str]:
+        """IDs of every memory that is not its cluster's survivor."""
+        return [i for cluster in self.clusters for i in cluster.duplicate_ids]
+
+    def __repr__(self) -> str:
+        return (
+            f"DuplicateReport(scanned={self.scanned}, clusters={len(self.clusters)}, "
+            f"duplicates={sum(len(c.duplicate_ids) for c in self.clusters)})"
+        )
+
+
+class NearDuplicateIndex:
+    """Streams memories into b-bit MinHash signatures for LSH clustering."""
+
+    def __init__(
+        self,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        shingle_size: int = DEFAULT_SHINGLE_SIZE,
+        bands: Optional[int] = None,
+        capacity: int = DEFAULT_CAPACITY,
+        seed: int = 1,
+    ):
+        """Initialize an empty index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of duplicates
+            num_perm: MinHash permutations per memory
+            shingle_size: Words per shingle
+            bands: LSH bands (must divide num_perm; default: from threshold)
+            capacity: Initial number of memories to allocate for
+            seed: Seed for the MinHash permutations
+        """
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        if bands is not None and (bands < 1 or num_perm % bands):
+            raise ValueError("bands must divide num_perm")
+        np = require_numpy()
+        self._np = np
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = (
+            (bands, num_perm // bands) if bands else lsh_params(threshold, num_perm)
+        )
+        rng = np.random.default_rng(seed)
+        # Multiply-shift hashing: ((a * h + b) mod 2**64) >> 32 with odd a.
+        self._a = (rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * 2 + 1)[:, None]
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)[:, None]
+        self._ids = _ByteColumn(capacity)
+        self._signatures = GrowableArray((np.uint8, num_perm), capacity)
+        self._has_content = GrowableArray(np.bool_, capacity)
+        self._importance = GrowableArray(np.float64, capacity)
+        self._created_at = GrowableArray(np.int64, capacity)
+
+    def __len__(self) -> int:
+        return len(self._importance)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held for the memories added so far."""
+        arrays = (self._signatures, self._has_content, self._importance, self._created_at)
+        return self._ids.nbytes + sum(int(a.view().nbytes) for a in arrays)
+
+    def append(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Add a page of decoded memory rows (``id``, ``content``,
+        ``importance``, ``created_at``), e.g. from a listing or an export."""
+        np = self._np
+        n = len(rows)
+        if not n:
+            return
+        hashes, counts = self._shingle_hashes([words(row["content"] or "") for row in rows])
+        self._ids.extend([row["id"] for row in rows])
+        self._signatures.extend(self._minhash(hashes, counts))
+        self._has_content.extend(counts > 0)
+        self._importance.extend(
+            np.fromiter((row.get("importance") or 0.0 for row in rows), np.float64, count=n)
+        )
+        self._created_at.extend(
+            parse_timestamps([row["created_at"] for row in rows]).astype(np.int64)
+        )
+
+    def _shingle_hashes(self, docs: list[list[str]]) -> tuple[Any, Any]:
+        """32-bit hashes of every ``shingle_size``-word window, and counts per doc.
+
+        A document shorter than the window is one shingle of all its words.
+        """
+        np = self._np
+        k = self.shingle_size
+        lengths = np.fromiter((len(d) for d in docs), dtype=np.int64, count=len(docs))
+        total = int(lengths.sum())
+        word_hashes = np.fromiter(
+            (zlib.crc32(w.encode("utf-8")) for doc in docs for w in doc),
+            dtype=np.uint64,
+            count=total,
+        )
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        position = np.arange(total)
+        doc_end = np.repeat(ends, lengths)
+        shingle = np.zeros(total, dtype=np.uint64)
+        for j in range(k):
+            inside = position + j < doc_end
+            shifted = np.zeros(total, dtype=np.uint64)
+            shifted[: total - j] = word_hashes[j:]
+            shingle = shingle * np.uint64(_BAND_MULTIPLIER) + np.where(inside, shifted, 0)
+        first = np.zeros(total, dtype=bool)
+        first[starts[lengths > 0]] = True
+        valid = (position + k <= doc_end) | (first & (np.repeat(lengths, lengths) < k))
+        counts = np.maximum(lengths - k + 1, (lengths > 0).astype(np.int64))
+        return (shingle[valid] ^ (shingle[valid] >> np.uint64(32))) & np.uint64(0xFFFFFFFF), counts
+
+    def _minhash(self, hashes: Any, counts: Any) -> Any:
+        """b-bit MinHash signatures, one row per document."""
+        np = self._np
+        signatures = np.full((len(counts), self.num_perm), 0xFF, dtype=np.uint8)
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        doc = 0
+        while doc < len(counts):
+            # Take whole documents until the block holds HASH_BLOCK shingles.
+            last = max(int(np.searchsorted(ends, starts[doc] + HASH_BLOCK, "right")), doc + 1)
+            block = np.flatnonzero(counts[doc:last]) + doc
+            if len(block):
+                lo, hi = int(starts[block[0]]), int(ends[block[-1]])
+                permuted = (self._a * hashes[lo:hi] + self._b) >> np.uint64(32)
+                mins = np.minimum.reduceat(permuted, starts[block] - lo, axis=1)
+                signatures[block] = (mins.T & 0xFF).astype(np.uint8)
+            doc = last
+        return signatures
+
+    def find(self, *, keep: str = "newest") -> DuplicateReport:
+        """Cluster near-duplicates and choose a survivor per cluster.
+
+        Args:
+            keep: Among equally important memories, keep the "newest" or
+                "oldest" one
+
+        Returns:
+            DuplicateReport with one DuplicateCluster per group of duplicates
+        """
+        if keep not in ("newest", "oldest"):
+            raise ValueError(f"keep must be newest or oldest, got {keep!r}")
+        np = self._np
+        n = len(self)
+        signatures = self._signatures.view()
+        src, dst = self._verified_pairs(signatures)
+        if not len(src):
+            return DuplicateReport([], n)
+
+        sparse = optional_scipy_sparse()
+        if sparse is not None:
+            from scipy.sparse.csgraph import connected_components  # type: ignore[import-untyped]
+
+            graph = sparse.csr_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n, n))
+            _, labels = connected_components(graph, directed=False)
+        else:
+            labels = _label_propagation(np, n, src, dst)
+
+        members = np.flatnonzero(np.bincount(labels, minlength=n)[labels] > 1)
+        created_at = self._created_at.view()[members]
+        order = members[
+            np.lexsort(
+                (
+                    -created_at if keep == "newest" else created_at,
+                    -self._importance.view()[members],
+                    labels[members],
+                )
+            )
+        ]
+        grouped = labels[order]
+        starts = np.flatnonzero(np.r_[True, grouped[1:] != grouped[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        clusters = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            group = order[start:end]
+            while len(group) > 1:
+                survivor, rest = group[0], group[1:]
+                close = self._similarity(signatures[survivor], signatures[rest]) >= self.threshold
+                if close.any():
+                    clusters.append(DuplicateCluster(
+                        self._ids.get(int(survivor)),
+                        [self._ids.get(int(i)) for i in rest[close]],
+                    ))
+                group = rest[~close]
+        return DuplicateReport(clusters, n)
+
+    @staticmethod
+    def _similarity(a: Any, b: Any) -> Any:
+        """Estimated Jaccard similarity between b-bit signatures (broadcasts)."""
+        # Under b-bit MinHash unrelated values still match with probability 1/256.
+        chance = 1.0 / 256
+        return ((a == b).mean(axis=-1) - chance) / (1 - chance)
+
+    def _verified_pairs(self, signatures: Any) -> tuple[Any, Any]:
+        """Candidate pairs from LSH bands whose estimated similarity passes."""
+        np = self._np
+        candidates = np.flatnonzero(self._has_content.view())
+        if len(candidates) < 2:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+        anchors, others = [], []
+        for band in range(self.bands):
+            columns = signatures[candidates, band * self.rows : (band + 1) * self.rows]
+            keys = np.zeros(len(candidates), dtype=np.uint64)
+            for column in columns.T:
+                keys = keys * np.uint64(_BAND_MULTIPLIER) + column
+            order = np.argsort(keys, kind="stable")
+            sorted_keys = keys[order]
+            same = sorted_keys[1:] == sorted_keys[:-1]
+            if not same.any():
+                continue
+            # Compare every member of a bucket with the bucket's first member.
+            run_start = np.maximum.accumulate(
+                np.where(np.r_[True, ~same], np.arange(len(order)), 0)
+            )
+            followers = np.flatnonzero(np.r_[False, same])
+            anchors.append(candidates[order[run_start[followers]]])
+            others.append(candidates[order[followers]])
+        if not anchors:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty
+
+        n = len(self)
+        pair_codes = np.unique(np.concatenate(anchors) * n + np.concatenate(others))
+        src, dst = pair_codes // n, pair_codes % n
+        keep = np.empty(len(src), dtype=bool)
+        step = max(1, HASH_BLOCK * 8 // self.num_perm)
+        for lo in range(0, len(src), step):
+            a, b = src[lo : lo + step], dst[lo : lo + step]
+            keep[lo : lo + step] = self._similarity(signatures[a], signatures[b]) >= self.threshold
+        return src[keep], dst[keep]
+
+
+def delete_duplicates(
+    client: "Keyoku",
+    report: DuplicateReport,
+    *,
+    chunk_size: int = 100,
+    max_workers: int = 4,
+    requests_per_second: Optional[float] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> int:
+    """Delete every non-survivor in ``report`` with chunked batch deletes.
+
+    Args:
+        client: Keyoku client
+        report: Result of NearDuplicateIndex.find() or memories.scan_duplicates()
+        chunk_size: Memory IDs per memories.batch_delete() call
+        max_workers: Concurrent batch deletes
+        requests_per_second: Optional cap on batch delete calls per second
+        progress: Optional callback called with (deleted, total)
+
+    Returns:
+        Number of memories deleted
+    """
+    ids = report.duplicate_ids
+    chunks = [ids[i : i + chunk_size] for i in range(0, len(ids), chunk_size)]
+    limiter = RateLimiter(requests_per_second)
+    lock = threading.Lock()
+    deleted = 0
+
+    def delete(chunk: list[str]) -> None:
+        nonlocal deleted
+        limiter.acquire()
+        client.memories.batch_delete(chunk)
+        with lock:
+            deleted += len(chunk)
+            done = deleted
+        if progress is not None:
+            progress(done, len(ids))
+
+    if chunks:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as pool:
+            list(pool.map(delete, chunks))
+    return deleted
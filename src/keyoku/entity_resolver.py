@@ -0,0 +1,212 @@
+"""Entity name resolution with a local index.
+
+``EntityResolver`` keeps every entity it has seen in two indexes over the
+normalized ``canonical_name`` (case-folded, whitespace collapsed):
+
+- a dict for exact lookups
+- a prefix trie for autocomplete
+
+Names that match exactly one indexed entity are answered locally. Anything
+else falls back to ``entities.search``, and the search results are indexed
+for next time.
+
+Example:
+    ```python
+    from keyoku.entity_resolver import EntityResolver
+
+    resolver = EntityResolver(client)
+    resolver.load(type="person")  # optional warm-up scan
+
+    alice, acme = resolver.resolve(["Alice Smith", "ACME corp"])
+    resolver.complete("ali", limit=5)
+    ```
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Iterable, Optional, Sequence
+
+from keyoku.models import Entity
+
+if TYPE_CHECKING:
+    from keyoku.client import Keyoku
+
+SEARCH_LIMIT = 5
+
+
+def normalize(name: str) -> str:
+    """Case-fold ``name`` and collapse runs of whitespace."""
+    return " ".join(name.split()).casefold()
+
+
+class _TrieNode:
+    __slots__ = ("children", "entity_ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.entity_ids: list[str] = []
+
+
+class EntityResolver:
+    """Resolves entity names locally, falling back to entities.search."""
+
+    def __init__(self, client: "Keyoku", *, max_workers: int = 8):
+        """Initialize the resolver with an empty index.
+
+        Args:
+            client: Keyoku client used for scans and search fallbacks
+            max_workers: Maximum concurrent search requests in resolve()
+        """
+        self._client = client
+        self._max_workers = max_workers
+        self._entities: dict[str, Entity] = {}
+        self._exact: dict[str, list[str]] = {}
+        self._root = _TrieNode()
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def add(self, entities: Iterable[Entity]) -> None:
+        """Add entities to the index, replacing ones with the same ID.
+
+        Args:
+            entities: Entities to index
+        """
+        for entity in entities:
+            previous = self._entities.get(entity.id)
+            self._entities[entity.id] = entity
+            if previous is not None and normalize(previous.canonical_name) == normalize(
+                entity.canonical_name
+            ):
+                continue
+            if previous is not None:
+                self._unlink(previous)
+            key = normalize(entity.canonical_name)
+            self._exact.setdefault(key, []).append(entity.id)
+            node = self._root
+            for char in key:
+                node = node.children.setdefault(char, _TrieNode())
+            node.entity_ids.append(entity.id)
+
+    def load(self, *, type: Optional[str] = None) -> int:
+        """Index every entity, optionally of one type, with a paginated scan.
+
+        Args:
+            type: Filter by entity type
+
+        Returns:
+            Number of entities indexed
+        """
+        before = len(self._entities)
+        self.add(self._client.entities.iter_all(type=type))
+        return len(self._entities) - before
+
+    def lookup(self, name: str, *, type: Optional[str] = None) -> list[Entity]:
+        """Return indexed entities whose name matches ``name`` exactly.
+
+        Args:
+            name: Entity name, matched case-insensitively
+            type: Filter by entity type
+
+        Returns:
+            Matching entities (local only)
+        """
+        matches = [self._entities[i] for i in self._exact.get(normalize(name), [])]
+        if type:
+            matches = [e for e in matches if e.type == type]
+        return matches
+
+    def complete(self, prefix: str, *, type: Optional[str] = None, limit: int = 10) -> list[Entity]:
+        """Return indexed entities whose name starts with ``prefix``.
+
+        Shorter names come first, then names in alphabetical order.
+
+        Args:
+            prefix: Name prefix, matched case-insensitively
+            type: Filter by entity type
+            limit: Maximum results
+
+        Returns:
+            Matching entities (local only)
+        """
+        node = self._root
+        for char in normalize(prefix):
+            child = node.children.get(char)
+            if child is None:
+                return []
+            node = child
+
+        results: list[Entity] = []
+        level = [node]
+        while level and len(results) < limit:
+            for current in level:
+                for entity_id in current.entity_ids:
+                    entity = self._entities[entity_id]
+                    if not type or entity.type == type:
+                        results.append(entity)
+            level = [
+                current.children[char]
+                for current in level
+                for char in sorted(current.children)
+            ]
+        return results[:limit]
+
+    def resolve_one(self, name: str, *, type: Optional[str] = None) -> Optional[Entity]:
+        """Resolve one name; see resolve()."""
+        return self.resolve([name], type=type)[0]
+
+    def resolve(
+        self, names: Sequence[str], *, type: Optional[str] = None
+    ) -> list[Optional[Entity]]:
+        """Resolve names to entities.
+
+        A name that matches exactly one indexed entity is answered locally.
+        The remaining distinct names are searched concurrently; results are
+        indexed and the exact name match is preferred over the top hit.
+
+        Args:
+            names: Entity names
+            type: Filter by entity type
+
+        Returns:
+            One entity or None per name, in input order
+        """
+        resolved: dict[str, Optional[Entity]] = {}
+        remote: list[str] = []
+        for name in names:
+            key = normalize(name)
+            if key in resolved or key in remote:
+                continue
+            matches = self.lookup(name, type=type)
+            if len(matches) == 1:
+                resolved[key] = matches[0]
+            else:
+                remote.append(key)
+
+        def search(key: str) -> list[Entity]:
+            return self._client.entities.search(key, limit=SEARCH_LIMIT, type=type)
+
+        if remote:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                found = list(pool.map(search, remote))
+            for key, results in zip(remote, found):
+                self.add(results)
+                exact = [e for e in results if normalize(e.canonical_name) == key]
+                best = exact or results
+                resolved[key] = best[0] if best else None
+
+        return [resolved[normalize(name)] for name in names]
+
+    def _unlink(self, entity: Entity) -> None:
+        key = normalize(entity.canonical_name)
+        ids = self._exact.get(key, [])
+        if entity.id in ids:
+            ids.remove(entity.id)
+        if not ids:
+            self._exact.pop(key, None)
+        node: Optional[_TrieNode] = self._root
+        for char in key:
+            node = node.children.get(char) if node else None
+        if node is not None and entity.id in node.entity_ids:
+            node.entity_ids.remove(entity.id)
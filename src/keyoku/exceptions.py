@@ -49,3 +49,8 @@ class RateLimitError(KeyokuError):
 class ServerError(KeyokuError):
     """Raised when server returns 5xx error."""
     pass
+
+
+class IntegrityError(KeyokuError):
+    """Raised when downloaded data does not match its expected size or checksum."""
+    pass
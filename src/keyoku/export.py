@@ -0,0 +1,254 @@
+"""Incremental parsing of GDPR export files.
+
+The export is JSONL: one JSON object per line. Each object names its record
+kind under ``"record_type"`` (or ``"kind"``), with the record fields either
+under ``"data"`` or inline next to the kind::
+
+    {"record_type": "memory", "data": {"id": "mem_1", "content": "...", ...}}
+    {"record_type": "entity", "id": "ent_1", "canonical_name": "Alice", ...}
+
+``JSONLDecoder`` turns a stream of byte chunks into decoded objects, handling
+lines split across chunk boundaries, and ``parse_record`` maps each object to
+a typed model or lightweight record.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import threading
+from typing import Any, AsyncIterator, Iterator, Optional, TypeVar, Union
+
+from pydantic import BaseModel
+
+from keyoku.models import AuditLog, Entity, Memory, Relationship, Schema
+from keyoku.records import EntityRecord, MemoryRecord, RelationshipRecord
+
+T = TypeVar("T")
+
+KIND_KEYS = ("record_type", "kind")
+
+MODELS: dict[str, type[BaseModel]] = {
+    "memory": Memory,
+    "entity": Entity,
+    "relationship": Relationship,
+    "schema": Schema,
+    "audit_log": AuditLog,
+}
+
+RECORDS: dict[str, Any] = {
+    "memory": MemoryRecord,
+    "entity": EntityRecord,
+    "relationship": RelationshipRecord,
+}
+
+ParsedRecord = Union[BaseModel, MemoryRecord, EntityRecord, RelationshipRecord, "ExportRecord"]
+
+
+class ExportRecord:
+    """An export line of a kind without a dedicated model, or in raw mode."""
+
+    __slots__ = ("kind", "data")
+
+    def __init__(self, kind: str, data: dict[str, Any]):
+        self.kind = kind
+        self.data = data
+
+    def __repr__(self) -> str:
+        return f"ExportRecord(kind={self.kind!r})"
+
+
+class JSONLDecoder:
+    """Incrementally decodes JSONL from byte chunks.
+
+    Example:
+        ```python
+        decoder = JSONLDecoder()
+        for chunk in chunks:
+            for obj in decoder.feed(chunk):
+                ...
+        for obj in decoder.close():
+            ...
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self.lines = 0
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add a chunk and return the objects on every line it completes."""
+        self._buffer += chunk
+        end = self._buffer.rfind(b"\n")
+        if end < 0:
+            return []
+        complete = bytes(self._buffer[:end])
+        del self._buffer[: end + 1]
+        return self._decode(complete.split(b"\n"))
+
+    def close(self) -> list[Any]:
+        """Return the object on a final line that has no trailing newline."""
+        remainder = bytes(self._buffer)
+        self._buffer.clear()
+        return self._decode([remainder])
+
+    def _decode(self, lines: list[bytes]) -> list[Any]:
+        out = []
+        for line in lines:
+            self.lines += 1
+            if line.strip():
+                out.append(json.loads(line))
+        return out
+
+
+def split_record(obj: dict[str, Any]) -> tuple[str, dict[str, Any]]:
+    """Split a decoded export line into its kind and its fields."""
+    kind = ""
+    for key in KIND_KEYS:
+        if key in obj:
+            kind = obj[key]
+            break
+    if "data" in obj and isinstance(obj["data"], dict):
+        return kind, obj["data"]
+    return kind, {k: v for k, v in obj.items() if k not in KIND_KEYS}
+
+
+def parse_record(obj: dict[str, Any], *, raw: bool = False) -> ParsedRecord:
+    """Map a decoded export line to a model, record or ExportRecord.
+
+    Args:
+        obj: Decoded JSON object from one export line
+        raw: Return lightweight records instead of validated models
+
+    Returns:
+        A model (or record when raw) for known kinds, otherwise ExportRecord
+    """
+    kind, data = split_record(obj)
+    if raw:
+        record_cls = RECORDS.get(kind)
+        return record_cls(data) if record_cls else ExportRecord(kind, data)
+    model = MODELS.get(kind)
+    return model(**data) if model else ExportRecord(kind, data)
+
+
+def iter_objects(chunks: Iterator[bytes]) -> Iterator[dict[str, Any]]:
+    """Decode an iterator of JSONL byte chunks into JSON objects."""
+    decoder = JSONLDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_objects(chunks: AsyncIterator[bytes]) -> AsyncIterator[dict[str, Any]]:
+    """Decode an async iterator of JSONL byte chunks into JSON objects."""
+    decoder = JSONLDecoder()
+    async for chunk in chunks:
+        for obj in decoder.feed(chunk):
+            yield obj
+    for obj in decoder.close():
+        yield obj
+
+
+def iter_records(chunks: Iterator[bytes], *, raw: bool = False) -> Iterator[ParsedRecord]:
+    """Parse an iterator of JSONL byte chunks into records."""
+    for obj in iter_objects(chunks):
+        yield parse_record(obj, raw=raw)
+
+
+async def aiter_records(
+    chunks: AsyncIterator[bytes], *, raw: bool = False
+) -> AsyncIterator[ParsedRecord]:
+    """Parse an async iterator of JSONL byte chunks into records."""
+    async for obj in aiter_objects(chunks):
+        yield parse_record(obj, raw=raw)
+
+
+_DONE = object()
+
+
+def prefetch(source: Iterator[T], size: int) -> Iterator[T]:
+    """Read ``source`` ahead in a background thread, holding at most ``size`` items.
+
+    Lets the consumer work on one item while the next ones are being read.
+    Exceptions raised by ``source`` are re-raised in the consumer.
+    """
+    if size <= 0:
+        yield from source
+        return
+
+    buffer: queue.Queue[Any] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(e)
+        finally:
+            close = getattr(source, "close", None)
+            if close:
+                close()
+
+    thread = threading.Thread(target=produce, name="keyoku-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+async def aprefetch(source: AsyncIterator[T], size: int) -> AsyncIterator[T]:
+    """Read ``source`` ahead in a background task, holding at most ``size`` items."""
+    if size <= 0:
+        async for item in source:
+            yield item
+        return
+
+    buffer: asyncio.Queue[Any] = asyncio.Queue(maxsize=size)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await buffer.put(item)
+            await buffer.put(_DONE)
+        except Exception as e:
+            await buffer.put(e)
+
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        task.cancel()
+        try:
+            await task
+        except (asyncio.CancelledError, Exception):
+            pass
+        aclose: Optional[Any] = getattr(source, "aclose", None)
+        if aclose:
+            await aclose()
@@ -0,0 +1,192 @@
+"""Graph analytics over a local GraphSnapshot.
+
+Install with: pip install keyoku[scipy] (or keyoku[numpy] for the NumPy-only
+fallbacks)
+
+The API has no analytics endpoints, so these run in-process on the CSR
+arrays of a ``GraphSnapshot``:
+
+- ``pagerank``: power iteration on the column-stochastic transition matrix
+- ``degree_centrality``: in, out or total degree, optionally normalized
+- ``connected_components``: weakly connected components
+
+SciPy sparse matrices are used when SciPy is installed; otherwise the same
+computations run on NumPy ``bincount`` and label propagation. Results are
+dicts keyed by ``Entity.id``.
+
+Example:
+    ```python
+    from keyoku.graph_analytics import pagerank
+
+    snapshot = client.graph.snapshot()
+    scores = pagerank(snapshot)
+    top = sorted(scores, key=scores.get, reverse=True)[:10]
+    ```
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+from keyoku._optional import optional_scipy_sparse, require_numpy
+
+if TYPE_CHECKING:
+    from keyoku.graph_snapshot import GraphSnapshot
+
+
+def _keyed(snapshot: "GraphSnapshot", values: Any) -> dict[str, Any]:
+    return dict(zip(snapshot.entity_ids, values.tolist()))
+
+
+def pagerank(
+    snapshot: "GraphSnapshot",
+    *,
+    damping: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    relationship_types: Optional[list[str]] = None,
+) -> dict[str, float]:
+    """Compute PageRank over outgoing relationships.
+
+    Entities without outgoing relationships spread their rank uniformly.
+    Parallel relationships between the same pair count once per relationship.
+
+    Args:
+        snapshot: Graph snapshot
+        damping: Probability of following a relationship at each step
+        tol: Stop when the L1 change between iterations falls below this
+        max_iter: Maximum number of iterations
+        relationship_types: Only follow these relationship types
+
+    Returns:
+        Mapping of entity ID to score; scores sum to 1
+    """
+    np = require_numpy()
+    n = len(snapshot)
+    if not n:
+        return {}
+    src, dst = snapshot.edge_arrays(relationship_types)
+    out_degree = np.bincount(src, minlength=n).astype(np.float64)
+    dangling = out_degree == 0
+    inv_degree = np.divide(1.0, out_degree, out=np.zeros(n), where=~dangling)
+
+    sparse = optional_scipy_sparse()
+    if sparse is not None:
+        transition = sparse.csr_matrix(
+            (inv_degree[src], (dst, src)), shape=(n, n), dtype=np.float64
+        )
+
+        def step(rank: Any) -> Any:
+            return transition @ rank
+
+    else:
+        weights = inv_degree[src]
+
+        def step(rank: Any) -> Any:
+            return np.bincount(dst, weights=rank[src] * weights, minlength=n)
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        spread = rank[dangling].sum() / n
+        updated = damping * (step(rank) + spread) + (1.0 - damping) / n
+        delta = float(np.abs(updated - rank).sum())
+        rank = updated
+        if delta < tol:
+            break
+    return _keyed(snapshot, rank / rank.sum())
+
+
+def degree_centrality(
+    snapshot: "GraphSnapshot",
+    *,
+    direction: str = "both",
+    normalized: bool = True,
+    relationship_types: Optional[list[str]] = None,
+) -> dict[str, float]:
+    """Compute degree centrality.
+
+    Args:
+        snapshot: Graph snapshot
+        direction: "outgoing", "incoming", or "both"
+        normalized: Divide by the maximum possible degree (n - 1)
+        relationship_types: Only count these relationship types
+
+    Returns:
+        Mapping of entity ID to degree (or normalized degree)
+    """
+    np = require_numpy()
+    n = len(snapshot)
+    if not n:
+        return {}
+    src, dst = snapshot.edge_arrays(relationship_types)
+    if direction == "outgoing":
+        degree = np.bincount(src, minlength=n)
+    elif direction == "incoming":
+        degree = np.bincount(dst, minlength=n)
+    elif direction == "both":
+        degree = np.bincount(src, minlength=n) + np.bincount(dst, minlength=n)
+    else:
+        raise ValueError(f"direction must be outgoing, incoming or both, got {direction!r}")
+    degree = degree.astype(np.float64)
+    if normalized and n > 1:
+        degree /= n - 1
+    return _keyed(snapshot, degree)
+
+
+def connected_components(
+    snapshot: "GraphSnapshot",
+    *,
+    relationship_types: Optional[list[str]] = None,
+) -> dict[str, int]:
+    """Label weakly connected components.
+
+    Component labels are dense integers, numbered by the first entity (in
+    snapshot order) that belongs to each component.
+
+    Args:
+        snapshot: Graph snapshot
+        relationship_types: Only follow these relationship types
+
+    Returns:
+        Mapping of entity ID to component label
+    """
+    np = require_numpy()
+    n = len(snapshot)
+    if not n:
+        return {}
+    src, dst = snapshot.edge_arrays(relationship_types)
+
+    sparse = optional_scipy_sparse()
+    if sparse is not None:
+        from scipy.sparse.csgraph import connected_components as scipy_components  # type: ignore[import-untyped]
+
+        graph = sparse.csr_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), shape=(n, n))
+        _, labels = scipy_components(graph, directed=True, connection="weak")
+    else:
+        labels = _label_propagation(np, n, src, dst)
+
+    # Renumber so component ids follow the first entity of each component.
+    _, first = np.unique(labels, return_index=True)
+    order = np.argsort(first)
+    dense = np.empty(len(order), dtype=np.int64)
+    dense[order] = np.arange(len(order))
+    _, inverse = np.unique(labels, return_inverse=True)
+    return _keyed(snapshot, dense[inverse.reshape(-1)])
+
+
+def _label_propagation(np: Any, n: int, src: Any, dst: Any) -> Any:
+    """Min-label hooking with pointer jumping; each entity ends on its component's root."""
+    labels = np.arange(n, dtype=np.int64)
+    while True:
+        low = np.minimum(labels[src], labels[dst])
+        hooked = labels.copy()
+        np.minimum.at(hooked, labels[src], low)
+        np.minimum.at(hooked, labels[dst], low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
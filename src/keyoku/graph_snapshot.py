@@ -0,0 +1,535 @@
+"""Local knowledge-graph snapshots for in-process traversal.
+
+Install with: pip install keyoku[numpy]
+
+``GraphSnapshot`` holds every entity and relationship of a tenant and keeps
+the edges as CSR (compressed sparse row) adjacency arrays:
+
+- entities are numbered ``0..n-1`` in load order
+- ``out_indptr[i]:out_indptr[i + 1]`` slices ``out_indices`` (target entity
+  indices) and ``out_edges`` (relationship indices) for entity ``i``; the
+  ``in_*`` arrays hold the same for incoming edges
+- relationship types are interned into int32 ``type_codes``
+
+Traversals expand a whole BFS frontier per NumPy operation, so path finding
+and k-hop queries need no API round-trips once the snapshot is loaded.
+``refresh()`` keeps a loaded snapshot current by replaying entity and
+relationship changes from the audit log.
+
+Example:
+    ```python
+    snapshot = client.graph.snapshot()
+
+    path = snapshot.find_path("ent_a", "ent_b", max_depth=4)
+    nearby = snapshot.neighborhood(["ent_a"], depth=2, relationship_types=["works_with"])
+
+    snapshot.refresh()  # apply changes since the last load/refresh
+    ```
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, Sequence, TypeVar
+
+from keyoku._optional import require_numpy
+from keyoku._pagination import DEFAULT_PAGE_SIZE, fetch_pages
+from keyoku.compact import StringPool
+from keyoku.exceptions import NotFoundError
+from keyoku.models import AuditLog, Entity, Relationship
+from keyoku.records import format_datetime
+from keyoku.resources.graph import Neighborhood, PathResult
+
+if TYPE_CHECKING:
+    from keyoku.client import Keyoku
+
+DIRECTIONS = ("outgoing", "incoming", "both")
+AUDIT_PAGE_SIZE = 100
+DEFAULT_MAX_CHANGES = 1000
+# Audit queries start this far before the sync point, so clock skew between
+# client and server and entries committed late cannot drop changes. Entries
+# the overlap brings back again are skipped by ID.
+SYNC_OVERLAP = timedelta(seconds=60)
+
+T = TypeVar("T")
+
+
+def _csr(np: Any, rows: Any, cols: Any, n: int) -> tuple[Any, Any, Any]:
+    """Group edges by ``rows`` into (indptr, indices, edge ids)."""
+    order = np.argsort(rows, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rows, minlength=n), out=indptr[1:])
+    return indptr, cols[order].astype(np.int32), order.astype(np.int64)
+
+
+def _gather(np: Any, indptr: Any, indices: Any, edges: Any, frontier: Any) -> tuple[Any, Any, Any]:
+    """Return (from, to, edge) for every edge leaving the frontier nodes."""
+    starts = indptr[frontier]
+    counts = indptr[frontier + 1] - starts
+    total = int(counts.sum())
+    if not total:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty, empty
+    run_starts = np.cumsum(counts) - counts
+    positions = np.repeat(starts - run_starts, counts) + np.arange(total)
+    return np.repeat(frontier, counts), indices[positions], edges[positions]
+
+
+class SnapshotRefresh:
+    """Summary of a GraphSnapshot.refresh() call."""
+
+    def __init__(
+        self,
+        *,
+        entities_updated: int = 0,
+        entities_removed: int = 0,
+        relationships_updated: int = 0,
+        relationships_removed: int = 0,
+        full_rebuild: bool = False,
+    ):
+        self.entities_updated = entities_updated
+        self.entities_removed = entities_removed
+        self.relationships_updated = relationships_updated
+        self.relationships_removed = relationships_removed
+        self.full_rebuild = full_rebuild
+
+    def __repr__(self) -> str:
+        if self.full_rebuild:
+            return "SnapshotRefresh(full rebuild)"
+        return (
+            f"SnapshotRefresh(entities +{self.entities_updated}/-{self.entities_removed}, "
+            f"relationships +{self.relationships_updated}/-{self.relationships_removed})"
+        )
+
+
+class GraphSnapshot:
+    """An in-memory copy of the knowledge graph with CSR adjacency."""
+
+    def __init__(self, entities: Iterable[Entity], relationships: Iterable[Relationship]):
+        """Build a snapshot from entities and relationships.
+
+        Relationships whose endpoints are not among ``entities`` are kept but
+        left out of the adjacency arrays.
+
+        Args:
+            entities: All entities of the graph
+            relationships: All relationships of the graph
+        """
+        self._np = require_numpy()
+        self._entities: dict[str, Entity] = {e.id: e for e in entities}
+        self._relationships: dict[str, Relationship] = {r.id: r for r in relationships}
+        self._client: Optional["Keyoku"] = None
+        self._page_size = DEFAULT_PAGE_SIZE
+        self._max_workers = 8
+        self.synced_at: Optional[datetime] = None
+        # Audit entries applied within SYNC_OVERLAP of the newest one, per
+        # resource type, as {id: created_at}.
+        self._applied: dict[str, dict[str, datetime]] = {}
+        self.rebuild()
+
+    @classmethod
+    def load(
+        cls,
+        client: "Keyoku",
+        *,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = 8,
+    ) -> "GraphSnapshot":
+        """Fetch every entity and relationship and build a snapshot.
+
+        Args:
+            client: Keyoku client
+            page_size: Items requested per page
+            max_workers: Pages fetched concurrently
+
+        Returns:
+            The loaded snapshot
+        """
+        snapshot = cls([], [])
+        snapshot.reload(client, page_size=page_size, max_workers=max_workers)
+        return snapshot
+
+    def reload(
+        self,
+        client: Optional["Keyoku"] = None,
+        *,
+        page_size: Optional[int] = None,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Replace the snapshot contents with a full fetch from the API.
+
+        Args:
+            client: Keyoku client (defaults to the one used by load())
+            page_size: Items requested per page (defaults to the last one used)
+            max_workers: Pages fetched concurrently (defaults to the last one used)
+        """
+        client = client or self._client
+        page_size = page_size or self._page_size
+        max_workers = max_workers or self._max_workers
+        if client is None:
+            raise ValueError("reload() needs a client for snapshots not created by load()")
+        synced_at = datetime.now(timezone.utc)
+        entities = fetch_pages(
+            lambda limit, offset: client.entities.list(limit=limit, offset=offset),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+        relationships = fetch_pages(
+            lambda limit, offset: client.relationships.list(limit=limit, offset=offset),
+            page_size=page_size,
+            max_workers=max_workers,
+        )
+        self._entities = {e.id: e for e in entities}
+        self._relationships = {r.id: r for r in relationships}
+        self._client = client
+        self._page_size = page_size
+        self._max_workers = max_workers
+        self.synced_at = synced_at
+        self._applied = {}
+        self.rebuild()
+
+    def refresh(self, *, max_changes: int = DEFAULT_MAX_CHANGES) -> SnapshotRefresh:
+        """Apply entity and relationship changes recorded since the last sync.
+
+        Audit log entries are read for the ``entity`` and ``relationship``
+        resource types, from shortly before the newest entry already applied,
+        so entries committed late with an older timestamp are still seen.
+        Entries not applied by an earlier refresh are acted on: deleted
+        objects are dropped, created or updated ones are re-fetched
+        concurrently (a 404 counts as a delete), and the CSR arrays are
+        rebuilt once if anything changed.
+
+        The snapshot is reloaded in full instead when the log has gaps: an
+        entry without a resource ID, pages that no longer add up to the
+        reported total, or more than ``max_changes`` entries.
+
+        Args:
+            max_changes: Audit entries above which a full reload is cheaper
+
+        Returns:
+            SnapshotRefresh describing what changed
+        """
+        if self._client is None or self.synced_at is None:
+            raise ValueError("refresh() is only available on snapshots created by load()")
+        started_at = datetime.now(timezone.utc)
+
+        entity_logs = self._audit_changes("entity", max_changes)
+        relationship_logs = self._audit_changes("relationship", max_changes)
+        if entity_logs is None or relationship_logs is None:
+            self.reload()
+            return SnapshotRefresh(full_rebuild=True)
+
+        client = self._client
+        removed_entities, entities = self._apply(entity_logs, client.entities.get)
+        removed_relationships, relationships = self._apply(
+            relationship_logs, client.relationships.get
+        )
+        for entity_id in removed_entities:
+            self._entities.pop(entity_id, None)
+        self._entities.update((e.id, e) for e in entities)
+        for relationship_id in removed_relationships:
+            self._relationships.pop(relationship_id, None)
+        self._relationships.update((r.id, r) for r in relationships)
+
+        for resource_type, logs in (("entity", entity_logs), ("relationship", relationship_logs)):
+            applied = self._applied.setdefault(resource_type, {})
+            applied.update((log.id, log.created_at) for log in logs)
+            if applied:
+                cutoff = max(applied.values()) - SYNC_OVERLAP
+                self._applied[resource_type] = {
+                    i: t for i, t in applied.items() if t >= cutoff
+                }
+        self.synced_at = started_at
+        if removed_entities or entities or removed_relationships or relationships:
+            self.rebuild()
+        return SnapshotRefresh(
+            entities_updated=len(entities),
+            entities_removed=len(removed_entities),
+            relationships_updated=len(relationships),
+            relationships_removed=len(removed_relationships),
+        )
+
+    def _audit_changes(self, resource_type: str, max_changes: int) -> Optional[list[AuditLog]]:
+        """Read audit entries not applied yet, or None on a gap."""
+        assert self._client is not None and self.synced_at is not None
+        applied = self._applied.get(resource_type, {})
+        since = (max(applied.values()) if applied else self.synced_at) - SYNC_OVERLAP
+        logs: list[AuditLog] = []
+        offset = 0
+        while True:
+            page = self._client.audit.list(
+                resource_type=resource_type,
+                start_date=format_datetime(since),
+                limit=AUDIT_PAGE_SIZE,
+                offset=offset,
+            )
+            if page.total > max_changes:
+                return None
+            logs.extend(page.audit_logs)
+            offset += len(page.audit_logs)
+            if not page.has_more or not page.audit_logs:
+                break
+        if len(logs) < page.total or any(log.resource_id is None for log in logs):
+            return None
+        return [log for log in logs if log.id not in applied]
+
+    def _apply(
+        self, logs: list[AuditLog], get: Callable[[str], T]
+    ) -> tuple[list[str], list[T]]:
+        """Split changed IDs into deletions and freshly fetched objects."""
+        latest: dict[str, AuditLog] = {}
+        for log in sorted(logs, key=lambda log: log.created_at):
+            latest[log.resource_id] = log  # type: ignore[index]
+
+        removed = [rid for rid, log in latest.items() if log.operation.endswith("delete")]
+        changed = [rid for rid, log in latest.items() if not log.operation.endswith("delete")]
+
+        def fetch(resource_id: str) -> Optional[T]:
+            try:
+                return get(resource_id)
+            except NotFoundError:
+                return None
+
+        fetched: list[T] = []
+        if changed:
+            with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+                for resource_id, obj in zip(changed, pool.map(fetch, changed)):
+                    if obj is None:
+                        removed.append(resource_id)
+                    else:
+                        fetched.append(obj)
+        return removed, fetched
+
+    def rebuild(self) -> None:
+        """Recompute entity indices, type codes and CSR arrays."""
+        np = self._np
+        self.entity_ids: list[str] = list(self._entities)
+        self._index = {entity_id: i for i, entity_id in enumerate(self.entity_ids)}
+        self.relationship_ids: list[str] = list(self._relationships)
+        self.relationship_types = StringPool()
+
+        count = len(self.relationship_ids)
+        rels = self._relationships.values()
+        src = np.fromiter((self._index.get(r.source_entity_id, -1) for r in rels), np.int64, count)
+        dst = np.fromiter((self._index.get(r.target_entity_id, -1) for r in rels), np.int64, count)
+        self.type_codes = self.relationship_types.encode([r.relationship_type for r in rels])
+
+        n = len(self.entity_ids)
+        linked = np.flatnonzero((src >= 0) & (dst >= 0))
+        self.out_indptr, self.out_indices, out_edges = _csr(np, src[linked], dst[linked], n)
+        self.in_indptr, self.in_indices, in_edges = _csr(np, dst[linked], src[linked], n)
+        self.out_edges = linked[out_edges]
+        self.in_edges = linked[in_edges]
+
+    def __len__(self) -> int:
+        return len(self.entity_ids)
+
+    @property
+    def num_relationships(self) -> int:
+        return len(self.relationship_ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the adjacency arrays."""
+        arrays = (
+            self.out_indptr, self.out_indices, self.out_edges,
+            self.in_indptr, self.in_indices, self.in_edges, self.type_codes,
+        )
+        return sum(int(a.nbytes) for a in arrays)
+
+    def edge_arrays(self, relationship_types: Optional[list[str]] = None) -> tuple[Any, Any]:
+        """Return (source, target) entity index arrays of the linked edges.
+
+        Args:
+            relationship_types: Only include these relationship types
+
+        Returns:
+            Two int64 arrays of equal length
+        """
+        np = self._np
+        src = np.repeat(np.arange(len(self.entity_ids), dtype=np.int64), np.diff(self.out_indptr))
+        dst = self.out_indices.astype(np.int64)
+        mask = self._edge_mask(relationship_types)
+        if mask is not None:
+            keep = mask[self.out_edges]
+            src, dst = src[keep], dst[keep]
+        return src, dst
+
+    def entity(self, entity_id: str) -> Optional[Entity]:
+        """Return the entity with ``entity_id``, if present."""
+        return self._entities.get(entity_id)
+
+    def relationship(self, relationship_id: str) -> Optional[Relationship]:
+        """Return the relationship with ``relationship_id``, if present."""
+        return self._relationships.get(relationship_id)
+
+    def find_path(
+        self,
+        from_entity: str,
+        to_entity: str,
+        *,
+        max_depth: int = 5,
+        relationship_types: Optional[list[str]] = None,
+        direction: str = "both",
+    ) -> Optional[PathResult]:
+        """Find the shortest path between two entities locally.
+
+        Args:
+            from_entity: Source entity ID
+            to_entity: Target entity ID
+            max_depth: Maximum path length to search
+            relationship_types: Only traverse these relationship types
+            direction: "outgoing", "incoming", or "both"
+
+        Returns:
+            PathResult if path found, None otherwise
+        """
+        source = self._index.get(from_entity)
+        target = self._index.get(to_entity)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return PathResult([self._entities[from_entity]], [])
+
+        dist, parent, parent_edge = self._bfs(
+            [source], max_depth, direction, relationship_types, target=target
+        )
+        if dist[target] < 0:
+            return None
+
+        nodes, edges = [target], []
+        while nodes[-1] != source:
+            edges.append(int(parent_edge[nodes[-1]]))
+            nodes.append(int(parent[nodes[-1]]))
+        return PathResult(
+            [self._entities[self.entity_ids[i]] for i in reversed(nodes)],
+            [self._relationships[self.relationship_ids[i]] for i in reversed(edges)],
+        )
+
+    def bfs(
+        self,
+        entity_ids: Sequence[str],
+        *,
+        max_depth: Optional[int] = None,
+        relationship_types: Optional[list[str]] = None,
+        direction: str = "outgoing",
+    ) -> dict[str, int]:
+        """Breadth-first search from one or more entities.
+
+        Args:
+            entity_ids: Start entity IDs; unknown IDs are ignored
+            max_depth: Maximum number of hops (unbounded if None)
+            relationship_types: Only traverse these relationship types
+            direction: "outgoing", "incoming", or "both"
+
+        Returns:
+            Mapping of every reached entity ID to its hop count, nearest first
+        """
+        sources = [self._index[e] for e in entity_ids if e in self._index]
+        dist, _, _ = self._bfs(sources, max_depth, direction, relationship_types)
+        np = self._np
+        reached = np.flatnonzero(dist >= 0)
+        reached = reached[np.argsort(dist[reached], kind="stable")]
+        return {self.entity_ids[i]: int(dist[i]) for i in reached}
+
+    def neighborhood(
+        self,
+        entity_ids: Sequence[str],
+        *,
+        depth: int = 1,
+        relationship_types: Optional[list[str]] = None,
+        direction: str = "both",
+    ) -> Neighborhood:
+        """Return the entities within ``depth`` hops, including the seeds.
+
+        Same result as ``client.graph.neighborhood()``, computed locally: the
+        relationships are those followed from an entity less than ``depth``
+        hops away, and nothing is ever truncated.
+
+        Args:
+            entity_ids: Seed entity IDs; unknown IDs are ignored
+            depth: Maximum number of hops
+            relationship_types: Only traverse these relationship types
+            direction: "outgoing", "incoming", or "both"
+
+        Returns:
+            Neighborhood with entities ordered by hop count
+        """
+        np = self._np
+        sources = [self._index[e] for e in entity_ids if e in self._index]
+        dist, _, _ = self._bfs(sources, depth, direction, relationship_types)
+        reached = np.flatnonzero(dist >= 0)
+        reached = reached[np.argsort(dist[reached], kind="stable")]
+
+        src, dst = self.edge_arrays()
+        edges = self.out_edges
+        expanded = (dist >= 0) & (dist < depth)
+        if direction == "outgoing":
+            keep = expanded[src] & (dist[dst] >= 0)
+        elif direction == "incoming":
+            keep = expanded[dst] & (dist[src] >= 0)
+        else:
+            keep = (expanded[src] & (dist[dst] >= 0)) | (expanded[dst] & (dist[src] >= 0))
+        mask = self._edge_mask(relationship_types)
+        if mask is not None:
+            keep &= mask[edges]
+
+        return Neighborhood(
+            [self._entities[self.entity_ids[i]] for i in reached],
+            [self._relationships[self.relationship_ids[i]] for i in np.sort(edges[keep])],
+            {self.entity_ids[i]: int(dist[i]) for i in reached},
+        )
+
+    def _edge_mask(self, relationship_types: Optional[list[str]]) -> Any:
+        if not relationship_types:
+            return None
+        codes = [self.relationship_types.code(t) for t in relationship_types]
+        return self._np.isin(self.type_codes, codes)
+
+    def _expand(self, frontier: Any, direction: str) -> tuple[Any, Any, Any]:
+        np = self._np
+        if direction == "outgoing":
+            return _gather(np, self.out_indptr, self.out_indices, self.out_edges, frontier)
+        if direction == "incoming":
+            return _gather(np, self.in_indptr, self.in_indices, self.in_edges, frontier)
+        out = _gather(np, self.out_indptr, self.out_indices, self.out_edges, frontier)
+        inc = _gather(np, self.in_indptr, self.in_indices, self.in_edges, frontier)
+        return tuple(np.concatenate(pair) for pair in zip(out, inc))
+
+    def _bfs(
+        self,
+        sources: Sequence[int],
+        max_depth: Optional[int],
+        direction: str,
+        relationship_types: Optional[list[str]],
+        *,
+        target: Optional[int] = None,
+    ) -> tuple[Any, Any, Any]:
+        """Level-synchronous BFS returning (distance, parent, parent edge) arrays."""
+        if direction not in DIRECTIONS:
+            raise ValueError(f"direction must be one of {DIRECTIONS}, got {direction!r}")
+        np = self._np
+        n = len(self.entity_ids)
+        dist = np.full(n, -1, dtype=np.int32)
+        parent = np.full(n, -1, dtype=np.int64)
+        parent_edge = np.full(n, -1, dtype=np.int64)
+        mask = self._edge_mask(relationship_types)
+
+        frontier = np.unique(np.asarray(sources, dtype=np.int64))
+        dist[frontier] = 0
+        depth = 0
+        while len(frontier) and (max_depth is None or depth < max_depth):
+            depth += 1
+            origin, reached, edges = self._expand(frontier, direction)
+            keep = dist[reached] < 0
+            if mask is not None:
+                keep &= mask[edges]
+            reached, first = np.unique(reached[keep], return_index=True)
+            dist[reached] = depth
+            parent[reached] = origin[keep][first]
+            parent_edge[reached] = edges[keep][first]
+            if target is not None and dist[target] >= 0:
+                break
+            frontier = reached
+        return dist, parent, parent_edge
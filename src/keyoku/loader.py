@@ -0,0 +1,327 @@
+"""Request batching for get() calls.
+
+Code that calls ``get(id)`` inside loops or from many coroutines tends to
+send one request per call, often for the same IDs. The loaders here gather
+those calls into batches:
+
+- ``AsyncLoader`` collects the keys requested during one event-loop tick
+- ``BatchLoader`` collects the keys requested by any thread within a short
+  time window
+
+Each batch is deduplicated and sent as one bulk call when a ``batch_fetch``
+is given, or otherwise as a bounded burst of concurrent single fetches. A key
+that is already in flight joins the pending request instead of sending a new
+one. Results and errors are fanned back out to every caller.
+
+Example:
+    ```python
+    async with AsyncKeyoku(api_key="...") as client:
+        memories = await asyncio.gather(*(client.loaders.memories.load(i) for i in ids))
+
+    client = Keyoku(api_key="...")
+    entities = client.loaders.entities.load_many(entity_ids)
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from keyoku.models import Entity, Memory, Relationship
+
+if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
+    from keyoku.client import Keyoku
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_WINDOW = 0.005
+
+
+class AsyncLoader(Generic[K, V]):
+    """Batches ``load(key)`` calls made during the same event-loop tick."""
+
+    def __init__(
+        self,
+        fetch: Callable[[K], Awaitable[V]],
+        *,
+        batch_fetch: Optional[Callable[[list[K]], Awaitable[Sequence[V]]]] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the loader.
+
+        Args:
+            fetch: Coroutine function fetching one key
+            batch_fetch: Optional coroutine function fetching many keys at
+                once, returning values in key order
+            max_concurrency: Maximum single fetches in flight per batch
+        """
+        self._fetch = fetch
+        self._batch_fetch = batch_fetch
+        self._max_concurrency = max_concurrency
+        self._queued: dict[K, asyncio.Future[V]] = {}
+        self._in_flight: dict[K, asyncio.Future[V]] = {}
+        self._scheduled = False
+        # The event loop only keeps weak references to tasks.
+        self._tasks: set[asyncio.Future[None]] = set()
+
+    async def load(self, key: K) -> V:
+        """Load one key, sharing the request with other callers in this tick.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            The loaded value
+        """
+        future = self._queued.get(key) or self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._queued[key] = future
+            if not self._scheduled:
+                self._scheduled = True
+                loop.call_soon(self._dispatch)
+        # Shield so one cancelled caller does not cancel the shared request.
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V]:
+        """Load several keys in one batch.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Values in key order
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        batch, self._queued = self._queued, {}
+        self._scheduled = False
+        self._in_flight.update(batch)
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: dict[K, asyncio.Future[V]]) -> None:
+        keys = list(batch)
+        try:
+            if self._batch_fetch is not None:
+                try:
+                    values = _check_count(keys, await self._batch_fetch(keys))
+                except Exception as e:
+                    for future in batch.values():
+                        if not future.done():
+                            future.set_exception(e)
+                    return
+                for future, value in zip(batch.values(), values):
+                    if not future.done():
+                        future.set_result(value)
+                return
+
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+
+            async def resolve(key: K, future: asyncio.Future[V]) -> None:
+                async with semaphore:
+                    try:
+                        value = await self._fetch(key)
+                    except Exception as e:
+                        if not future.done():
+                            future.set_exception(e)
+                    else:
+                        if not future.done():
+                            future.set_result(value)
+
+            await asyncio.gather(*(resolve(key, future) for key, future in batch.items()))
+        finally:
+            for key in keys:
+                self._in_flight.pop(key, None)
+
+
+class BatchLoader(Generic[K, V]):
+    """Batches ``load(key)`` calls made from any thread within a short window."""
+
+    def __init__(
+        self,
+        fetch: Callable[[K], V],
+        *,
+        batch_fetch: Optional[Callable[[list[K]], Sequence[V]]] = None,
+        window: float = DEFAULT_WINDOW,
+        max_workers: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        """Initialize the loader.
+
+        Args:
+            fetch: Function fetching one key
+            batch_fetch: Optional function fetching many keys at once,
+                returning values in key order
+            window: Seconds to wait for more keys after the first one
+            max_workers: Maximum single fetches in flight
+        """
+        self._fetch = fetch
+        self._batch_fetch = batch_fetch
+        self._window = window
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._queued: dict[K, Future[V]] = {}
+        self._in_flight: dict[K, Future[V]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+
+    def load(self, key: K) -> V:
+        """Load one key, sharing the request with other threads in this window.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            The loaded value
+        """
+        return self._enqueue(key).result()
+
+    def load_many(self, keys: Iterable[K]) -> list[V]:
+        """Load several keys in one batch, dispatched without waiting for the window.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            Values in key order
+        """
+        futures = [self._enqueue(key) for key in keys]
+        self._dispatch()
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        """Stop the worker threads used for single fetches.
+
+        Keys still waiting for their window fail with RuntimeError.
+        """
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _enqueue(self, key: K) -> Future[V]:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("loader is closed")
+            future = self._queued.get(key) or self._in_flight.get(key)
+            if future is None:
+                future = self._queued[key] = Future()
+                if self._timer is None:
+                    self._timer = threading.Timer(self._window, self._dispatch)
+                    self._timer.daemon = True
+                    self._timer.start()
+            return future
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            batch, self._queued = self._queued, {}
+            self._in_flight.update(batch)
+            if batch and self._batch_fetch is None and self._pool is None and not self._closed:
+                self._pool = ThreadPoolExecutor(max_workers=self._max_workers)
+            pool = self._pool
+        if not batch:
+            return
+
+        if self._batch_fetch is None:
+            items = list(batch.items())
+            for i, (key, future) in enumerate(items):
+                try:
+                    if pool is None:
+                        raise RuntimeError("loader is closed")
+                    pool.submit(self._resolve, key, future)
+                except RuntimeError as e:
+                    # close() shut the pool down under us; fail what is left.
+                    self._finish(k for k, _ in items[i:])
+                    for _, pending in items[i:]:
+                        pending.set_exception(e)
+                    return
+            return
+
+        keys = list(batch)
+        try:
+            values = _check_count(keys, self._batch_fetch(keys))
+        except Exception as e:
+            self._finish(keys)
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        self._finish(keys)
+        for future, value in zip(batch.values(), values):
+            future.set_result(value)
+
+    def _resolve(self, key: K, future: Future[V]) -> None:
+        try:
+            value = self._fetch(key)
+        except Exception as e:
+            self._finish([key])
+            future.set_exception(e)
+        else:
+            self._finish([key])
+            future.set_result(value)
+
+    def _finish(self, keys: Iterable[K]) -> None:
+        with self._lock:
+            for key in keys:
+                self._in_flight.pop(key, None)
+
+
+def _check_count(keys: list[K], values: Sequence[V]) -> Sequence[V]:
+    """Return ``values`` if it has one value per key, else raise ValueError."""
+    if len(values) != len(keys):
+        raise ValueError(f"batch_fetch returned {len(values)} values for {len(keys)} keys")
+    return values
+
+
+class Loaders:
+    """Batching loaders for the sync client's get() calls."""
+
+    def __init__(self, client: "Keyoku", *, window: float = DEFAULT_WINDOW):
+        self.memories: BatchLoader[str, Memory] = BatchLoader(
+            client.memories.get, window=window
+        )
+        self.entities: BatchLoader[str, Entity] = BatchLoader(
+            client.entities.get, window=window
+        )
+        self.relationships: BatchLoader[str, Relationship] = BatchLoader(
+            client.relationships.get, window=window
+        )
+
+    def close(self) -> None:
+        """Stop the loaders' worker threads."""
+        for loader in (self.memories, self.entities, self.relationships):
+            loader.close()
+
+
+class AsyncLoaders:
+    """Per-tick batching loaders for the async client's get() calls."""
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self.memories: AsyncLoader[str, Memory] = AsyncLoader(client.memories.get)
+        self.entities: AsyncLoader[str, Entity] = AsyncLoader(client.entities.get)
+        self.relationships: AsyncLoader[str, Relationship] = AsyncLoader(
+            client.relationships.get
+        )
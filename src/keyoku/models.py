@@ -141,12 +141,56 @@ class CleanupResponse(BaseModel):
     deleted_ids: Optional[list[str]] = None
 
 
+class CleanupPlanStep(BaseModel):
+    """One strategy's share of a cleanup.reduce_to() plan."""
+    strategy: str
+    candidates: int
+    planned: int
+
+
+class ReduceResult(BaseModel):
+    """Result of a cleanup.reduce_to() call."""
+    target_percentage: float
+    initial_usage: CleanupUsage
+    final_usage: CleanupUsage
+    plan: list[CleanupPlanStep]
+    deleted_count: int
+    deleted_by_strategy: dict[str, int]
+    reached: bool
+    dry_run: bool
+
+
 class ExportResponse(BaseModel):
     """Response from export request."""
     job_id: str
     status: str
 
 
+class ExportTimings(BaseModel):
+    """Seconds spent in each phase of an export."""
+    export: float
+    wait: float
+    download: float
+    total: float
+
+
+class ExportResult(BaseModel):
+    """Result of a completed export_to() call."""
+    job_id: str
+    bytes_written: int
+    sha256: str
+    timings: ExportTimings
+
+
+class ImportResult(BaseModel):
+    """Result of a data.import_from() call."""
+    memories_imported: int
+    batches: int
+    job_ids: list[str]
+    resumed_from_line: int
+    lines_read: int
+
+
 class AuditLog(BaseModel):
     """An audit log entry."""
     id: str
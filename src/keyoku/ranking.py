@@ -0,0 +1,205 @@
+"""Client-side ranking utilities for memory search results.
+
+Install with: pip install keyoku[numpy]
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional, Protocol, Sequence, TypeVar
+
+from keyoku._optional import require_numpy
+from keyoku.models import MemorySearchResult
+
+FUSION_METHODS = ("rrf", "score")
+DEFAULT_HALF_LIFE = 7 * 24 * 3600.0
+
+
+class Rankable(Protocol):
+    """A search hit: MemorySearchResult or a raw MemorySearchRecord."""
+
+    @property
+    def score(self) -> float: ...
+
+    @property
+    def importance(self) -> float: ...
+
+    @property
+    def created_at(self) -> datetime: ...
+
+
+RankableT = TypeVar("RankableT", bound=Rankable)
+
+
+def fuse_results(
+    result_lists: Sequence[Sequence[MemorySearchResult]],
+    *,
+    method: str = "rrf",
+    limit: int = 10,
+    k: int = 60,
+) -> list[MemorySearchResult]:
+    """Merge several ranked result lists into a single top-k list.
+
+    Results are deduplicated by memory ID. With ``method="rrf"`` each
+    occurrence contributes ``1 / (k + rank)`` (reciprocal rank fusion). With
+    ``method="score"`` scores are min-max normalized per list and summed.
+    The returned results carry the fused value in ``score``.
+
+    Args:
+        result_lists: Ranked result lists, best match first
+        method: Fusion method - "rrf" or "score"
+        limit: Maximum results to return
+        k: RRF smoothing constant
+
+    Returns:
+        Fused results ordered by descending fused score
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"Unknown fusion method {method!r}, expected one of {FUSION_METHODS}")
+
+    flat = [r for results in result_lists for r in results]
+    if not flat or limit <= 0:
+        return []
+
+    np = require_numpy()
+    lengths = np.fromiter((len(r) for r in result_lists), dtype=np.int64, count=len(result_lists))
+    offsets = np.cumsum(lengths) - lengths
+    ranks = np.arange(len(flat), dtype=np.int64) - np.repeat(offsets, lengths)
+
+    if method == "rrf":
+        contrib = 1.0 / (k + ranks + 1.0)
+    else:
+        scores = np.fromiter((r.score for r in flat), dtype=np.float64, count=len(flat))
+        starts = offsets[lengths > 0]
+        counts = lengths[lengths > 0]
+        lo = np.repeat(np.minimum.reduceat(scores, starts), counts)
+        hi = np.repeat(np.maximum.reduceat(scores, starts), counts)
+        span = hi - lo
+        contrib = np.divide(scores - lo, span, out=np.ones_like(scores), where=span > 0)
+
+    ids = np.array([r.id for r in flat], dtype=object)
+    _, inverse = np.unique(ids, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    fused = np.bincount(inverse, weights=contrib)
+
+    # Representative row per ID: the occurrence with the largest contribution
+    order = np.lexsort((-contrib, inverse))
+    group_starts = np.flatnonzero(np.r_[True, np.diff(inverse[order]) != 0])
+    best = order[group_starts]
+
+    top = np.argsort(-fused, kind="stable")[:limit]
+    return [
+        flat[int(best[i])].model_copy(update={"score": float(fused[i])})
+        for i in top
+    ]
+
+
+class Reranker:
+    """Re-score search results by a weighted mix of score, importance and recency.
+
+    The combined score of each result is::
+
+        score_weight * score
+        + importance_weight * importance
+        + recency_weight * 0.5 ** (age / half_life)
+
+    Example:
+        ```python
+        from keyoku.ranking import Reranker
+
+        reranker = Reranker(importance_weight=0.3, recency_weight=0.2, overfetch=3)
+
+        # Requests 30 results from the API and keeps the best 10
+        results = client.search("preferences", limit=10, rerank=reranker)
+        ```
+    """
+
+    def __init__(
+        self,
+        *,
+        score_weight: float = 1.0,
+        importance_weight: float = 0.0,
+        recency_weight: float = 0.0,
+        half_life: float = DEFAULT_HALF_LIFE,
+        overfetch: int = 1,
+    ):
+        """Initialize the reranker.
+
+        Args:
+            score_weight: Weight of the server similarity score
+            importance_weight: Weight of the memory importance
+            recency_weight: Weight of the time-decayed recency term
+            half_life: Age in seconds at which the recency term halves (default: 7 days)
+            overfetch: Factor by which searches over-fetch before reranking
+        """
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        if overfetch < 1:
+            raise ValueError("overfetch must be at least 1")
+        self.score_weight = score_weight
+        self.importance_weight = importance_weight
+        self.recency_weight = recency_weight
+        self.half_life = half_life
+        self.overfetch = overfetch
+
+    def scores(
+        self,
+        results: Sequence[Rankable],
+        *,
+        now: Optional[datetime] = None,
+    ) -> Any:
+        """Compute the combined score of each result as a NumPy array.
+
+        Args:
+            results: Search results to score
+            now: Reference time for recency (default: current UTC time)
+
+        Returns:
+            float64 array aligned with results
+        """
+        np = require_numpy()
+        n = len(results)
+        combined = np.zeros(n, dtype=np.float64)
+        if self.score_weight:
+            score = np.fromiter((r.score for r in results), dtype=np.float64, count=n)
+            combined += self.score_weight * score
+        if self.importance_weight:
+            importance = np.fromiter((r.importance for r in results), dtype=np.float64, count=n)
+            combined += self.importance_weight * importance
+        if self.recency_weight:
+            reference = (now or datetime.now(timezone.utc)).timestamp()
+            created = np.fromiter(
+                (r.created_at.timestamp() for r in results), dtype=np.float64, count=n
+            )
+            age = np.maximum(reference - created, 0.0)
+            combined += self.recency_weight * np.exp2(-age / self.half_life)
+        return combined
+
+    def rerank(
+        self,
+        results: Sequence[RankableT],
+        *,
+        limit: Optional[int] = None,
+        now: Optional[datetime] = None,
+    ) -> list[RankableT]:
+        """Reorder results by their combined score.
+
+        Args:
+            results: Search results to rerank
+            limit: Keep only the best ``limit`` results (default: all)
+            now: Reference time for recency (default: current UTC time)
+
+        Returns:
+            Results ordered by descending combined score
+        """
+        np = require_numpy()
+        n = len(results)
+        keep = n if limit is None else min(limit, n)
+        if keep <= 0:
+            return []
+        neg = -self.scores(results, now=now)
+
+        if keep < n:
+            candidates = np.argpartition(neg, keep - 1)[:keep]
+            order = candidates[np.argsort(neg[candidates], kind="stable")]
+        else:
+            order = np.argsort(neg, kind="stable")
+        return [results[int(i)] for i in order]
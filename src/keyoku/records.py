@@ -0,0 +1,187 @@
+"""Lightweight result records that skip pydantic validation.
+
+Records are returned by ``raw=True`` calls such as ``client.search(...)`` and
+``client.memories.list(...)``. They copy the decoded JSON fields into
+``__slots__`` attributes without validation, and parse timestamps lazily on
+first access. Call ``to_model()`` to get the equivalent pydantic model.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+from pydantic import TypeAdapter
+
+from keyoku.models import Entity, Memory, MemorySearchResult, Relationship
+
+_datetime_adapter: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+def parse_datetime(value: str) -> datetime:
+    """Parse an RFC 3339 timestamp as returned by the API."""
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # Nanosecond precision and other forms fromisoformat rejects on older Pythons
+        return _datetime_adapter.validate_python(value)
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a timestamp as RFC 3339 in UTC; naive values are taken as UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _lazy_datetime(slot: str) -> Any:
+    """Property that parses the timestamp stored in ``slot`` on first access."""
+
+    def getter(self: Any) -> Optional[datetime]:
+        value = getattr(self, slot)
+        if isinstance(value, str):
+            value = parse_datetime(value)
+            setattr(self, slot, value)
+        return value  # type: ignore[no-any-return]
+
+    return property(getter)
+
+
+class MemoryRecord:
+    """Unvalidated counterpart of Memory."""
+
+    __slots__ = ("id", "content", "type", "agent_id", "importance", "_created_at")
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.content: str = data["content"]
+        self.type: str = data["type"]
+        self.agent_id: str = data["agent_id"]
+        self.importance: float = data["importance"]
+        self._created_at: Any = data["created_at"]
+
+    created_at: datetime = _lazy_datetime("_created_at")
+
+    def to_model(self) -> Memory:
+        """Convert to a validated Memory."""
+        return Memory(
+            id=self.id,
+            content=self.content,
+            type=self.type,
+            agent_id=self.agent_id,
+            importance=self.importance,
+            created_at=self._created_at,
+        )
+
+    def __repr__(self) -> str:
+        return f"MemoryRecord(id={self.id!r}, type={self.type!r})"
+
+
+class MemorySearchRecord(MemoryRecord):
+    """Unvalidated counterpart of MemorySearchResult."""
+
+    __slots__ = ("score",)
+
+    def __init__(self, data: dict[str, Any]):
+        super().__init__(data)
+        self.score: float = data["score"]
+
+    def to_model(self) -> MemorySearchResult:  # type: ignore[override]
+        """Convert to a validated MemorySearchResult."""
+        return MemorySearchResult(
+            id=self.id,
+            content=self.content,
+            type=self.type,
+            agent_id=self.agent_id,
+            importance=self.importance,
+            score=self.score,
+            created_at=self._created_at,
+        )
+
+    def __repr__(self) -> str:
+        return f"MemorySearchRecord(id={self.id!r}, score={self.score!r})"
+
+
+class MemoryRecordPage:
+    """Unvalidated counterpart of ListMemoriesResponse."""
+
+    __slots__ = ("memories", "total", "has_more")
+
+    def __init__(self, data: dict[str, Any]):
+        self.memories = [MemoryRecord(m) for m in data["memories"]]
+        self.total: int = data["total"]
+        self.has_more: bool = data["has_more"]
+
+    def __repr__(self) -> str:
+        return f"MemoryRecordPage(memories={len(self.memories)}, total={self.total})"
+
+
+class EntityRecord:
+    """Unvalidated counterpart of Entity."""
+
+    __slots__ = ("id", "canonical_name", "type", "properties", "_created_at", "_updated_at")
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.canonical_name: str = data["canonical_name"]
+        self.type: str = data["type"]
+        self.properties: dict[str, Any] = data.get("properties") or {}
+        self._created_at: Any = data["created_at"]
+        self._updated_at: Any = data.get("updated_at")
+
+    created_at: datetime = _lazy_datetime("_created_at")
+    updated_at: Optional[datetime] = _lazy_datetime("_updated_at")
+
+    def to_model(self) -> Entity:
+        """Convert to a validated Entity."""
+        return Entity(
+            id=self.id,
+            canonical_name=self.canonical_name,
+            type=self.type,
+            properties=self.properties,
+            created_at=self._created_at,
+            updated_at=self._updated_at,
+        )
+
+    def __repr__(self) -> str:
+        return f"EntityRecord(id={self.id!r}, canonical_name={self.canonical_name!r})"
+
+
+class RelationshipRecord:
+    """Unvalidated counterpart of Relationship."""
+
+    __slots__ = (
+        "id",
+        "source_entity_id",
+        "target_entity_id",
+        "relationship_type",
+        "properties",
+        "_created_at",
+    )
+
+    def __init__(self, data: dict[str, Any]):
+        self.id: str = data["id"]
+        self.source_entity_id: str = data["source_entity_id"]
+        self.target_entity_id: str = data["target_entity_id"]
+        self.relationship_type: str = data["relationship_type"]
+        self.properties: dict[str, Any] = data.get("properties") or {}
+        self._created_at: Any = data["created_at"]
+
+    created_at: datetime = _lazy_datetime("_created_at")
+
+    def to_model(self) -> Relationship:
+        """Convert to a validated Relationship."""
+        return Relationship(
+            id=self.id,
+            source_entity_id=self.source_entity_id,
+            target_entity_id=self.target_entity_id,
+            relationship_type=self.relationship_type,
+            properties=self.properties,
+            created_at=self._created_at,
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"RelationshipRecord({self.source_entity_id!r} "
+            f"-[{self.relationship_type}]-> {self.target_entity_id!r})"
+        )
@@ -1,23 +1,28 @@
 """Keyoku API resources."""
 
-from keyoku.resources.memories import MemoriesResource
-from keyoku.resources.entities import EntitiesResource
-from keyoku.resources.relationships import RelationshipsResource
+from keyoku.resources.memories import AsyncMemoriesResource, MemoriesResource
+from keyoku.resources.entities import AsyncEntitiesResource, EntitiesResource
+from keyoku.resources.relationships import AsyncRelationshipsResource, RelationshipsResource
 from keyoku.resources.graph import GraphResource
 from keyoku.resources.schemas import SchemasResource
 from keyoku.resources.jobs import JobsResource
 from keyoku.resources.cleanup import CleanupResource
-from keyoku.resources.data import DataResource
-from keyoku.resources.audit import AuditResource
+from keyoku.resources.data import AsyncDataResource, DataResource
+from keyoku.resources.audit import AsyncAuditResource, AuditResource
 
 __all__ = [
     "MemoriesResource",
+    "AsyncMemoriesResource",
     "EntitiesResource",
+    "AsyncEntitiesResource",
     "RelationshipsResource",
+    "AsyncRelationshipsResource",
     "GraphResource",
     "SchemasResource",
     "JobsResource",
     "CleanupResource",
     "DataResource",
+    "AsyncDataResource",
     "AuditResource",
+    "AsyncAuditResource",
 ]
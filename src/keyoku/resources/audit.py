@@ -2,17 +2,190 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import asyncio
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional, Sequence, Union
 
-from keyoku.models import AuditLogsResponse
+from keyoku.models import AuditLog, AuditLogsResponse
+from keyoku.records import format_datetime, parse_datetime
 
 if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
     from keyoku.client import Keyoku
 
+FilePath = Union[str, "os.PathLike[str]"]
+Since = Union[datetime, str, None]
+AuditEntry = Union[AuditLog, dict[str, Any]]
+
+AUDIT_PAGE_SIZE = 100
+DEFAULT_POLL_INTERVAL = 2.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+# Each poll re-reads this much before the high-water mark, so entries that
+# are committed late or stamped by a skewed clock are still picked up.
+FOLLOW_OVERLAP = timedelta(seconds=5)
+DEFAULT_BACKFILL_WINDOW = timedelta(days=1)
+DEFAULT_MAX_WINDOW_ENTRIES = 2000
+# Windows are not split below this, however dense; they are paged instead.
+MIN_BACKFILL_WINDOW = timedelta(seconds=1)
+
+
+def _list_params(
+    *,
+    operation: Optional[str],
+    resource_type: Optional[str],
+    start_date: Optional[str],
+    end_date: Optional[str],
+    limit: int,
+    offset: int,
+) -> dict[str, Any]:
+    params: dict[str, Any] = {
+        "limit": limit,
+        "offset": offset,
+    }
+    if operation:
+        params["operation"] = operation
+    if resource_type:
+        params["resource_type"] = resource_type
+    if start_date:
+        params["start_date"] = start_date
+    if end_date:
+        params["end_date"] = end_date
+    return params
+
+
+def _as_datetime(value: Union[datetime, str]) -> datetime:
+    parsed = parse_datetime(value) if isinstance(value, str) else value
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _windows(
+    start: datetime, end: datetime, window: timedelta
+) -> Iterator[tuple[datetime, datetime]]:
+    lo = start
+    while lo < end:
+        hi = min(lo + window, end)
+        yield lo, hi
+        lo = hi
+
+
+def _backfill_range(
+    start: Union[datetime, str],
+    end: Since,
+    window: timedelta,
+    max_window_entries: int,
+    max_workers: int,
+) -> tuple[datetime, datetime]:
+    """Validate backfill arguments and return the (start, end) range."""
+    lo = _as_datetime(start)
+    hi = _as_datetime(end) if end is not None else datetime.now(timezone.utc)
+    if lo >= hi:
+        raise ValueError("start must be before end")
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+    if max_window_entries < 1 or max_workers < 1:
+        raise ValueError("max_window_entries and max_workers must be at least 1")
+    return lo, hi
+
+
+def _should_split(response: dict[str, Any], lo: datetime, hi: datetime, max_entries: int) -> bool:
+    return bool(response["total"] > max_entries and hi - lo > MIN_BACKFILL_WINDOW)
+
+
+def _window_entries(
+    rows: list[dict[str, Any]], lo: datetime, hi: datetime, raw: bool
+) -> list[AuditEntry]:
+    """Rows with ``lo <= created_at < hi``, deduplicated and sorted by (created_at, id).
+
+    The half-open bound keeps an entry on a window edge in exactly one window,
+    whether or not the API treats ``end_date`` as inclusive.
+    """
+    keyed = {}
+    for row in rows:
+        created_at = _as_datetime(row["created_at"])
+        if lo <= created_at < hi:
+            keyed[row["id"]] = (created_at, row)
+    ordered = sorted(keyed.values(), key=lambda item: (item[0], item[1]["id"]))
+    return [row if raw else AuditLog(**row) for _, row in ordered]
+
+
+class _FollowState:
+    """Position of a follow() stream: a (created_at, id) high-water mark.
+
+    IDs delivered within ``FOLLOW_OVERLAP`` of the mark are remembered so the
+    overlap window can be re-read without repeating them. Entries older than
+    ``floor`` (the original ``since``) are never delivered.
+    """
+
+    def __init__(self, since: datetime, path: Optional[FilePath]):
+        self.created_at = since
+        self.id = ""
+        self.floor = since
+        self.recent: dict[str, datetime] = {}
+        self._path = path
+
+    @classmethod
+    def open(cls, since: Since, path: Optional[FilePath]) -> "_FollowState":
+        """Resume from ``path`` if it exists, else start at ``since`` (default: now)."""
+        start = _as_datetime(since) if since is not None else datetime.now(timezone.utc)
+        state = cls(start, path)
+        if path and os.path.exists(path):
+            with open(path) as f:
+                saved = json.load(f)
+            state.created_at = parse_datetime(saved["created_at"])
+            state.id = saved["id"]
+            state.floor = parse_datetime(saved["floor"])
+            state.recent = {i: parse_datetime(t) for i, t in saved["recent"].items()}
+        return state
+
+    def window_start(self) -> str:
+        return format_datetime(self.created_at - FOLLOW_OVERLAP)
+
+    def new_entries(self, logs: Sequence[AuditLog]) -> list[AuditLog]:
+        """Entries not yet delivered, oldest first."""
+        fresh = {
+            log.id: log
+            for log in logs
+            if log.id not in self.recent and _as_datetime(log.created_at) >= self.floor
+        }
+        return sorted(fresh.values(), key=lambda log: (_as_datetime(log.created_at), log.id))
+
+    def advance(self, log: AuditLog) -> None:
+        created_at = _as_datetime(log.created_at)
+        self.recent[log.id] = created_at
+        if (created_at, log.id) > (self.created_at, self.id):
+            self.created_at, self.id = created_at, log.id
+
+    def prune(self) -> None:
+        cutoff = self.created_at - FOLLOW_OVERLAP
+        self.recent = {i: t for i, t in self.recent.items() if t >= cutoff}
+
+    def save(self) -> None:
+        if not self._path:
+            return
+        tmp = f"{os.fspath(self._path)}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "created_at": format_datetime(self.created_at),
+                    "id": self.id,
+                    "floor": format_datetime(self.floor),
+                    "recent": {i: format_datetime(t) for i, t in self.recent.items()},
+                },
+                f,
+            )
+        os.replace(tmp, self._path)
+
 
 class AuditResource:
     """Resource for audit log operations."""
 
+    _sleep = staticmethod(time.sleep)
+
     def __init__(self, client: "Keyoku"):
         self._client = client
 
@@ -39,18 +212,368 @@ class AuditResource:
         Returns:
             AuditLogsResponse with logs, total count, and pagination info
         """
-        params: dict[str, Any] = {
-            "limit": limit,
-            "offset": offset,
-        }
-        if operation:
-            params["operation"] = operation
-        if resource_type:
-            params["resource_type"] = resource_type
-        if start_date:
-            params["start_date"] = start_date
-        if end_date:
-            params["end_date"] = end_date
-
+        params = _list_params(
+            operation=operation,
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+        )
         response = self._client.request("GET", "/v1/audit-logs", params=params)
         return AuditLogsResponse(**response)
+
+    def follow(
+        self,
+        *,
+        since: Since = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        operation: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        checkpoint: Optional[FilePath] = None,
+    ) -> Iterator[AuditLog]:
+        """Yield audit log entries as they are written, oldest first, forever.
+
+        Each poll reads the entries since the (created_at, id) high-water mark
+        (less a short overlap for late writes) and yields the ones not yet
+        delivered. Polls that find nothing double the wait up to
+        ``max_poll_interval``; new entries reset it to ``poll_interval``.
+
+        With ``checkpoint``, the position is written to that file (atomically)
+        after each batch and when the generator is closed, and an existing
+        file is resumed from instead of ``since``. If the process dies without
+        closing the generator, entries yielded since the last save are yielded
+        again on resume.
+
+        Args:
+            since: Start time as a datetime or RFC3339 string (default: now)
+            poll_interval: Seconds between polls while entries keep arriving
+            max_poll_interval: Upper bound for the idle backoff
+            operation: Filter by operation type
+            resource_type: Filter by resource type
+            checkpoint: Optional JSON file holding the stream position
+
+        Yields:
+            AuditLog entries
+        """
+        state = _FollowState.open(since, checkpoint)
+        delay = poll_interval
+        try:
+            while True:
+                entries = state.new_entries(
+                    self._read_window(state.window_start(), operation, resource_type)
+                )
+                for log in entries:
+                    state.advance(log)
+                    yield log
+                if entries:
+                    state.prune()
+                    state.save()
+                    delay = poll_interval
+                else:
+                    delay = min(delay * 2, max_poll_interval)
+                self._sleep(delay)
+        finally:
+            state.save()
+
+    def backfill(
+        self,
+        start: Union[datetime, str],
+        end: Since = None,
+        *,
+        window: timedelta = DEFAULT_BACKFILL_WINDOW,
+        max_window_entries: int = DEFAULT_MAX_WINDOW_ENTRIES,
+        max_workers: int = 4,
+        operation: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        raw: bool = False,
+    ) -> Iterator[AuditEntry]:
+        """Yield every audit log entry in a date range, oldest first.
+
+        The range is split into ``window``-sized slices that are fetched
+        concurrently, each paged independently. A slice whose first page
+        reports more than ``max_window_entries`` is halved and refetched, so
+        dense periods do not turn into long serial offset walks. Slices are
+        yielded in time order; at most ``2 * max_workers`` are held in memory.
+
+        Args:
+            start: Start of the range (inclusive), datetime or RFC3339 string
+            end: End of the range (exclusive, default: now)
+            window: Initial slice length
+            max_window_entries: Split slices with more entries than this
+            max_workers: Maximum concurrent requests
+            operation: Filter by operation type
+            resource_type: Filter by resource type
+            raw: Yield the decoded JSON dicts instead of AuditLog models
+
+        Yields:
+            AuditLog entries (or dicts when raw)
+        """
+        lo, hi = _backfill_range(start, end, window, max_window_entries, max_workers)
+        return self._backfill(
+            _windows(lo, hi, window), max_window_entries, max_workers, operation, resource_type, raw
+        )
+
+    def _backfill(
+        self,
+        windows: Iterator[tuple[datetime, datetime]],
+        max_window_entries: int,
+        max_workers: int,
+        operation: Optional[str],
+        resource_type: Optional[str],
+        raw: bool,
+    ) -> Iterator[AuditEntry]:
+        pending: deque[tuple[datetime, datetime, Future[Optional[Sequence[AuditEntry]]]]] = deque()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+
+            def submit(lo: datetime, hi: datetime) -> None:
+                pending.append((lo, hi, pool.submit(
+                    self._read_range, lo, hi, max_window_entries, operation, resource_type, raw
+                )))
+
+            try:
+                while True:
+                    while len(pending) < 2 * max_workers:
+                        bounds = next(windows, None)
+                        if bounds is None:
+                            break
+                        submit(*bounds)
+                    if not pending:
+                        return
+                    lo, hi, future = pending.popleft()
+                    entries = future.result()
+                    if entries is None:
+                        mid = lo + (hi - lo) / 2
+                        submit(lo, mid)
+                        submit(mid, hi)
+                        pending.rotate(2)
+                        continue
+                    yield from entries
+            finally:
+                for _, _, future in pending:
+                    future.cancel()
+
+    def _read_range(
+        self,
+        lo: datetime,
+        hi: datetime,
+        max_window_entries: int,
+        operation: Optional[str],
+        resource_type: Optional[str],
+        raw: bool,
+    ) -> Optional[Sequence[AuditEntry]]:
+        """Entries in ``[lo, hi)``, or None if the window should be split."""
+        rows: list[dict[str, Any]] = []
+        while True:
+            params = _list_params(
+                operation=operation,
+                resource_type=resource_type,
+                start_date=format_datetime(lo),
+                end_date=format_datetime(hi),
+                limit=AUDIT_PAGE_SIZE,
+                offset=len(rows),
+            )
+            response = self._client.request("GET", "/v1/audit-logs", params=params)
+            if not rows and _should_split(response, lo, hi, max_window_entries):
+                return None
+            rows.extend(response["audit_logs"])
+            if not response["has_more"] or not response["audit_logs"]:
+                return _window_entries(rows, lo, hi, raw)
+
+    def _read_window(
+        self, start_date: str, operation: Optional[str], resource_type: Optional[str]
+    ) -> Sequence[AuditLog]:
+        """Every entry since ``start_date``, across pages."""
+        logs: list[AuditLog] = []
+        while True:
+            page = self.list(
+                operation=operation,
+                resource_type=resource_type,
+                start_date=start_date,
+                limit=AUDIT_PAGE_SIZE,
+                offset=len(logs),
+            )
+            logs.extend(page.audit_logs)
+            if not page.has_more or not page.audit_logs:
+                return logs
+
+
+class AsyncAuditResource:
+    """Async resource for audit log operations."""
+
+    _sleep = staticmethod(asyncio.sleep)
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self._client = client
+
+    async def list(
+        self,
+        *,
+        operation: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> AuditLogsResponse:
+        """List audit logs with optional filtering.
+
+        See AuditResource.list().
+        """
+        params = _list_params(
+            operation=operation,
+            resource_type=resource_type,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit,
+            offset=offset,
+        )
+        response = await self._client.request("GET", "/v1/audit-logs", params=params)
+        return AuditLogsResponse(**response)
+
+    async def follow(
+        self,
+        *,
+        since: Since = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_poll_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        operation: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        checkpoint: Optional[FilePath] = None,
+    ) -> AsyncIterator[AuditLog]:
+        """Yield audit log entries as they are written, oldest first, forever.
+
+        See AuditResource.follow().
+        """
+        state = _FollowState.open(since, checkpoint)
+        delay = poll_interval
+        try:
+            while True:
+                entries = state.new_entries(
+                    await self._read_window(state.window_start(), operation, resource_type)
+                )
+                for log in entries:
+                    state.advance(log)
+                    yield log
+                if entries:
+                    state.prune()
+                    state.save()
+                    delay = poll_interval
+                else:
+                    delay = min(delay * 2, max_poll_interval)
+                await self._sleep(delay)
+        finally:
+            state.save()
+
+    def backfill(
+        self,
+        start: Union[datetime, str],
+        end: Since = None,
+        *,
+        window: timedelta = DEFAULT_BACKFILL_WINDOW,
+        max_window_entries: int = DEFAULT_MAX_WINDOW_ENTRIES,
+        max_workers: int = 4,
+        operation: Optional[str] = None,
+        resource_type: Optional[str] = None,
+        raw: bool = False,
+    ) -> AsyncIterator[AuditEntry]:
+        """Yield every audit log entry in a date range, oldest first.
+
+        See AuditResource.backfill().
+        """
+        lo, hi = _backfill_range(start, end, window, max_window_entries, max_workers)
+        return self._backfill(
+            _windows(lo, hi, window), max_window_entries, max_workers, operation, resource_type, raw
+        )
+
+    async def _backfill(
+        self,
+        windows: Iterator[tuple[datetime, datetime]],
+        max_window_entries: int,
+        max_workers: int,
+        operation: Optional[str],
+        resource_type: Optional[str],
+        raw: bool,
+    ) -> AsyncIterator[AuditEntry]:
+        semaphore = asyncio.Semaphore(max_workers)
+        pending: deque[tuple[datetime, datetime, asyncio.Task[Optional[Sequence[AuditEntry]]]]] = (
+            deque()
+        )
+
+        async def read(lo: datetime, hi: datetime) -> Optional[Sequence[AuditEntry]]:
+            async with semaphore:
+                return await self._read_range(
+                    lo, hi, max_window_entries, operation, resource_type, raw
+                )
+
+        def submit(lo: datetime, hi: datetime) -> None:
+            pending.append((lo, hi, asyncio.ensure_future(read(lo, hi))))
+
+        try:
+            while True:
+                while len(pending) < 2 * max_workers:
+                    bounds = next(windows, None)
+                    if bounds is None:
+                        break
+                    submit(*bounds)
+                if not pending:
+                    return
+                lo, hi, task = pending.popleft()
+                entries = await task
+                if entries is None:
+                    mid = lo + (hi - lo) / 2
+                    submit(lo, mid)
+                    submit(mid, hi)
+                    pending.rotate(2)
+                    continue
+                for entry in entries:
+                    yield entry
+        finally:
+            for _, _, task in pending:
+                task.cancel()
+            await asyncio.gather(*(task for _, _, task in pending), return_exceptions=True)
+
+    async def _read_range(
+        self,
+        lo: datetime,
+        hi: datetime,
+        max_window_entries: int,
+        operation: Optional[str],
+        resource_type: Optional[str],
+        raw: bool,
+    ) -> Optional[Sequence[AuditEntry]]:
+        """Entries in ``[lo, hi)``, or None if the window should be split."""
+        rows: list[dict[str, Any]] = []
+        while True:
+            params = _list_params(
+                operation=operation,
+                resource_type=resource_type,
+                start_date=format_datetime(lo),
+                end_date=format_datetime(hi),
+                limit=AUDIT_PAGE_SIZE,
+                offset=len(rows),
+            )
+            response = await self._client.request("GET", "/v1/audit-logs", params=params)
+            if not rows and _should_split(response, lo, hi, max_window_entries):
+                return None
+            rows.extend(response["audit_logs"])
+            if not response["has_more"] or not response["audit_logs"]:
+                return _window_entries(rows, lo, hi, raw)
+
+    async def _read_window(
+        self, start_date: str, operation: Optional[str], resource_type: Optional[str]
+    ) -> Sequence[AuditLog]:
+        """Every entry since ``start_date``, across pages."""
+        logs: list[AuditLog] = []
+        while True:
+            page = await self.list(
+                operation=operation,
+                resource_type=resource_type,
+                start_date=start_date,
+                limit=AUDIT_PAGE_SIZE,
+                offset=len(logs),
+            )
+            logs.extend(page.audit_logs)
+            if not page.has_more or not page.audit_logs:
+                return logs
@@ -2,29 +2,95 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
 
-from keyoku.models import CleanupSuggestionsResponse, CleanupResponse, CleanupStrategy
+from keyoku._cache import StaleWhileRevalidate
+from keyoku._throttle import RateLimiter
+from keyoku.models import (
+    CleanupPlanStep,
+    CleanupSuggestionsResponse,
+    CleanupResponse,
+    CleanupStrategy,
+    CleanupUsage,
+    ReduceResult,
+)
 
 if TYPE_CHECKING:
     from keyoku.client import Keyoku
 
 
+MAX_CLEANUP_LIMIT = 1000
+# Least valuable memories first.
+DEFAULT_REDUCE_STRATEGIES: tuple[CleanupStrategy, ...] = (
+    CleanupStrategy.STALE,
+    CleanupStrategy.NEVER_ACCESSED,
+    CleanupStrategy.LOW_IMPORTANCE,
+    CleanupStrategy.OLDEST,
+)
+
+
+def _excess(usage: CleanupUsage, target_percentage: float) -> int:
+    """Memories to delete for usage to drop to ``target_percentage``."""
+    allowed = math.floor(usage.memories_limit * target_percentage / 100)
+    return max(usage.memories_stored - allowed, 0)
+
+
+class _Budget:
+    """Deletion allowance shared by concurrent workers."""
+
+    def __init__(self, total: int):
+        self.remaining = total
+        self._lock = threading.Lock()
+
+    def take(self, wanted: int) -> int:
+        with self._lock:
+            granted = min(wanted, self.remaining)
+            self.remaining -= granted
+            return granted
+
+    def refund(self, unused: int) -> None:
+        with self._lock:
+            self.remaining += unused
+
+
 class CleanupResource:
     """Resource for memory cleanup operations."""
 
     def __init__(self, client: "Keyoku"):
         self._client = client
+        self._suggestions_cache: StaleWhileRevalidate[CleanupSuggestionsResponse] = (
+            StaleWhileRevalidate(self._fetch_suggestions)
+        )
 
-    def suggestions(self) -> CleanupSuggestionsResponse:
+    def suggestions(
+        self,
+        *,
+        max_age: Optional[float] = None,
+        stale_while_revalidate: float = 60.0,
+    ) -> CleanupSuggestionsResponse:
         """Get cleanup suggestions for memory management.
 
         Returns strategies like stale, low_importance, oldest, never_accessed
         with counts of memories that would be affected.
 
+        Args:
+            max_age: Serve a cached result up to this many seconds old. None
+                (default) always asks the server.
+            stale_while_revalidate: For this many seconds past ``max_age``,
+                return the cached result at once and refresh it in the
+                background
+
         Returns:
             CleanupSuggestionsResponse with suggestions and current usage info
         """
+        if max_age is None:
+            return self._fetch_suggestions()
+        return self._suggestions_cache.get(max_age, stale_while_revalidate)
+
+    def _fetch_suggestions(self) -> CleanupSuggestionsResponse:
         response = self._client.request("GET", "/v1/memories/cleanup-suggestions")
         return CleanupSuggestionsResponse(**response)
 
@@ -56,3 +122,143 @@ class CleanupResource:
 
         response = self._client.request("POST", "/v1/memories/cleanup", json=data)
         return CleanupResponse(**response)
+
+    def reduce_to(
+        self,
+        target_percentage: float,
+        strategies: Sequence[CleanupStrategy | str] = DEFAULT_REDUCE_STRATEGIES,
+        *,
+        max_deletions: int = 10_000,
+        chunk_size: int = 100,
+        max_workers: int = 4,
+        requests_per_second: Optional[float] = None,
+        dry_run: bool = False,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> ReduceResult:
+        """Delete memories until usage drops to a target percentage of the quota.
+
+        Each pass dry-runs every strategy concurrently and plans how many
+        memories to take from each, in the given priority order; memories
+        matched by an earlier strategy are not counted again. The plan is
+        then executed in chunks of ``chunk_size``, with different strategies
+        running concurrently and each strategy's chunks running in sequence.
+        Passes repeat until usage reaches the target, nothing more can be
+        deleted, or ``max_deletions`` is used up. Deletions never exceed
+        ``max_deletions``. Once anything is deleted, cached ``suggestions()``
+        and ``stats()`` results are dropped.
+
+        Args:
+            target_percentage: Target usage, as a percentage of memories_limit
+            strategies: Strategies to use, highest priority first
+            max_deletions: Hard cap on memories deleted by this call
+            chunk_size: Memories deleted per execute() call (max: 1000)
+            max_workers: Strategies executed concurrently
+            requests_per_second: Optional cap on cleanup API calls per second
+            dry_run: Only plan; delete nothing
+            progress: Optional callback called with (deleted, goal), where goal
+                is the smaller of the excess and max_deletions
+
+        Returns:
+            ReduceResult with the plan, deletions per strategy and final usage
+        """
+        if not 0 <= target_percentage <= 100:
+            raise ValueError("target_percentage must be between 0 and 100")
+        if not 1 <= chunk_size <= MAX_CLEANUP_LIMIT:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_CLEANUP_LIMIT}")
+        if max_deletions < 0:
+            raise ValueError("max_deletions must not be negative")
+
+        names = [s.value if isinstance(s, CleanupStrategy) else s for s in strategies]
+        limiter = RateLimiter(requests_per_second)
+        budget = _Budget(max_deletions)
+        deleted_by = dict.fromkeys(names, 0)
+        lock = threading.Lock()
+
+        limiter.acquire()
+        initial = usage = self._fetch_suggestions().usage
+        goal = min(_excess(initial, target_percentage), max_deletions)
+        first_plan: Optional[list[CleanupPlanStep]] = None
+
+        def run(step: CleanupPlanStep) -> None:
+            left = step.planned
+            while left > 0:
+                limit = budget.take(min(chunk_size, left))
+                if not limit:
+                    return
+                limiter.acquire()
+                try:
+                    count = self.execute(step.strategy, limit=limit).deleted_count
+                except Exception:
+                    budget.refund(limit)
+                    raise
+                budget.refund(max(limit - count, 0))
+                with lock:
+                    deleted_by[step.strategy] += count
+                    done = sum(deleted_by.values())
+                if progress is not None:
+                    progress(done, goal)
+                if count < limit:
+                    return  # strategy has no more candidates
+                left -= count
+
+        try:
+            while True:
+                wanted = min(_excess(usage, target_percentage), budget.remaining)
+                if wanted <= 0:
+                    break
+                plan = self._plan(names, wanted, limiter, max_workers)
+                if first_plan is None:
+                    first_plan = plan
+                steps = [step for step in plan if step.planned]
+                if dry_run or not steps:
+                    break
+                before = sum(deleted_by.values())
+                with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(steps)))) as pool:
+                    list(pool.map(run, steps))
+                limiter.acquire()
+                usage = self._fetch_suggestions().usage
+                if sum(deleted_by.values()) == before:
+                    break
+        finally:
+            if sum(deleted_by.values()):
+                # Cached usage and suggestions no longer match the tenant.
+                self._suggestions_cache.invalidate()
+                self._client._stats_cache.invalidate()
+
+        return ReduceResult(
+            target_percentage=target_percentage,
+            initial_usage=initial,
+            final_usage=usage,
+            plan=first_plan or [],
+            deleted_count=sum(deleted_by.values()),
+            deleted_by_strategy=deleted_by,
+            reached=_excess(usage, target_percentage) == 0,
+            dry_run=dry_run,
+        )
+
+    def _plan(
+        self, names: list[str], wanted: int, limiter: RateLimiter, max_workers: int
+    ) -> list[CleanupPlanStep]:
+        """Dry-run every strategy and split ``wanted`` deletions between them."""
+
+        def dry_run(name: str) -> CleanupResponse:
+            limiter.acquire()
+            return self.execute(name, limit=min(wanted, MAX_CLEANUP_LIMIT), dry_run=True)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+            responses = list(pool.map(dry_run, names))
+
+        seen: set[str] = set()
+        remaining = wanted
+        plan = []
+        for name, response in zip(names, responses):
+            if response.deleted_ids is not None:
+                new = [i for i in response.deleted_ids if i not in seen]
+                seen.update(new)
+                candidates = len(new)
+            else:
+                candidates = response.deleted_count
+            planned = min(candidates, remaining)
+            remaining -= planned
+            plan.append(CleanupPlanStep(strategy=name, candidates=candidates, planned=planned))
+        return plan
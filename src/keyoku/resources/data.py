@@ -2,13 +2,275 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+    Optional,
+    Union,
+)
 
-from keyoku.models import ExportResponse
+import httpx
+
+from keyoku.columnar_export import DEFAULT_ROW_GROUP_SIZE, awrite_columnar, write_columnar
+from keyoku.exceptions import IntegrityError, KeyokuError
+from keyoku.export import (
+    ParsedRecord,
+    aiter_objects,
+    aiter_records,
+    aprefetch,
+    iter_objects,
+    iter_records,
+    prefetch,
+    split_record,
+)
+from keyoku.models import ExportResponse, ExportResult, ExportTimings, ImportResult
 
 if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
     from keyoku.client import Keyoku
 
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_PREFETCH = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_SEGMENTS = 4
+RETRY_BACKOFF = 0.5
+MAX_RETRY_BACKOFF = 10.0
+JOB_POLL_INTERVAL = 0.25
+JOB_POLL_BACKOFF = 1.5
+MAX_JOB_POLL_INTERVAL = 5.0
+DEFAULT_IMPORT_BATCH_SIZE = 100
+DEFAULT_IMPORT_CONCURRENCY = 4
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+"""Called with (bytes_received, total_bytes); total is None when unknown."""
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+FilePath = Union[str, "os.PathLike[str]"]
+
+
+def _download_path(job_id: str) -> str:
+    return f"/v1/data/export/{job_id}/download"
+
+
+def _content_length(response: httpx.Response) -> Optional[int]:
+    value = response.headers.get("Content-Length")
+    return int(value) if value and value.isdigit() else None
+
+
+def _download_headers(start: int, end: Optional[int] = None) -> dict[str, str]:
+    # Sizes, offsets and checksums all refer to the file itself, so ask for it
+    # uncompressed rather than httpx's default "gzip, deflate".
+    headers = {"Accept-Encoding": "identity"}
+    if start or end is not None:
+        headers["Range"] = f"bytes={start}-{'' if end is None else end}"
+    return headers
+
+
+def _is_encoded(response: httpx.Response) -> bool:
+    """Whether the server compressed the body despite ``Accept-Encoding: identity``."""
+    encoding: str = response.headers.get("Content-Encoding", "identity")
+    return encoding.lower() != "identity"
+
+
+def _total_size(response: httpx.Response) -> Optional[int]:
+    """Size of the whole export from a 200 or 206 response."""
+    if _is_encoded(response):
+        # Content-Length counts the compressed bytes, not the file.
+        return None
+    if response.status_code == 206:
+        _, _, total = response.headers.get("Content-Range", "").rpartition("/")
+        return int(total) if total.isdigit() else None
+    return _content_length(response)
+
+
+def _bytes_to_skip(response: httpx.Response, position: int, require_partial: bool) -> int:
+    """Bytes to discard when a ranged request was answered with the full file."""
+    if response.status_code == 206 and _is_encoded(response):
+        # Range offsets would refer to the compressed bytes, not the file.
+        raise KeyokuError("Server compressed a byte-range response", response.status_code)
+    if response.status_code == 206 or position == 0:
+        return 0
+    if require_partial:
+        raise KeyokuError("Server ignored the Range request", response.status_code)
+    return position
+
+
+def _retry_delay(attempt: int) -> float:
+    return float(min(RETRY_BACKOFF * 2**attempt, MAX_RETRY_BACKOFF))
+
+
+def _segment_bounds(size: int, segments: int) -> list[tuple[int, int]]:
+    """Split ``size`` bytes into inclusive (start, end) ranges."""
+    step = -(-size // segments)
+    return [(start, min(start + step, size) - 1) for start in range(0, size, step)]
+
+
+def _resume_offset(destination: FilePath, resume: bool) -> int:
+    if resume and os.path.exists(destination):
+        return os.path.getsize(destination)
+    return 0
+
+
+class _SegmentWriter:
+    """Writes byte ranges into a preallocated file from several workers.
+
+    Uses ``os.pwrite`` where available and a shared ``mmap`` otherwise.
+    """
+
+    def __init__(self, path: FilePath, size: int):
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0))
+        os.ftruncate(self._fd, size)
+        self._map: Optional[mmap.mmap] = None
+        if not hasattr(os, "pwrite") and size:
+            self._map = mmap.mmap(self._fd, size)
+
+    def write(self, offset: int, data: bytes) -> None:
+        if self._map is not None:
+            self._map[offset : offset + len(data)] = data
+            return
+        view = memoryview(data)
+        while view:
+            written = os.pwrite(self._fd, view, offset)
+            view = view[written:]
+            offset += written
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.flush()
+            self._map.close()
+        os.close(self._fd)
+
+
+class _ProgressCounter:
+    """Thread-safe aggregate progress for segmented downloads."""
+
+    def __init__(self, total: int, callback: Optional[ProgressCallback]):
+        self._total = total
+        self._callback = callback
+        self._done = 0
+        self._lock = threading.Lock()
+
+    def add(self, n: int) -> None:
+        if not self._callback:
+            return
+        with self._lock:
+            self._done += n
+            self._callback(self._done, self._total)
+
+
+class _DownloadCheck:
+    """Hashes streamed chunks and records the advertised size for verification."""
+
+    def __init__(self, progress: Optional[ProgressCallback]):
+        self.digest = hashlib.sha256()
+        self.content_length: Optional[int] = None
+        self._progress = progress
+
+    def on_progress(self, done: int, total: Optional[int]) -> None:
+        self.content_length = total
+        if self._progress:
+            self._progress(done, total)
+
+    def hashed(self, chunks: Iterator[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.digest.update(chunk)
+            yield chunk
+
+    async def ahashed(self, chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+        async for chunk in chunks:
+            self.digest.update(chunk)
+            yield chunk
+
+    def verify(self, size: int, expected: Optional[dict[str, Any]]) -> str:
+        """Check size and checksum against the response and job result."""
+        sha256 = self.digest.hexdigest()
+        if self.content_length is not None and size != self.content_length:
+            raise IntegrityError(
+                f"Downloaded {size} bytes, server announced {self.content_length}"
+            )
+        expected = expected or {}
+        expected_size = expected.get("size_bytes", expected.get("size"))
+        if expected_size is not None and size != int(expected_size):
+            raise IntegrityError(f"Downloaded {size} bytes, export job reported {expected_size}")
+        checksum = expected.get("sha256", expected.get("checksum"))
+        if checksum and str(checksum).lower().removeprefix("sha256:") != sha256:
+            raise IntegrityError("Export checksum mismatch")
+        return sha256
+
+
+class _ImportCheckpoint:
+    """Tracks the first source line not yet fully imported and persists it.
+
+    Batches cover contiguous line ranges and may finish out of order; the
+    checkpoint only advances past a batch once every earlier batch is done.
+    Ranges that finished ahead of an unfinished batch are saved as well, so
+    a resume after a failure skips them instead of importing them twice.
+    """
+
+    def __init__(self, path: Optional[FilePath], source: FilePath):
+        self._path = path
+        self._source = os.path.abspath(source)
+        self.line = 0
+        self.imported = 0
+        self._done_ahead: list[list[int]] = []
+        self._ranges: deque[list[Any]] = deque()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                state = json.load(f)
+            if state.get("source") == self._source:
+                self.line = int(state.get("line", 0))
+                self.imported = int(state.get("imported", 0))
+                self._done_ahead = [list(r) for r in state.get("completed", [])]
+        self._next_start = self.line
+
+    def is_done(self, line: int) -> bool:
+        """Whether ``line`` belongs to a batch that finished ahead of the checkpoint."""
+        return any(start <= line < end for start, end in self._done_ahead)
+
+    def add(self, end_line: int, count: int) -> list[Any]:
+        entry = [self._next_start, end_line, count, False]
+        self._next_start = end_line
+        self._ranges.append(entry)
+        return entry
+
+    def complete(self, entry: list[Any]) -> None:
+        entry[3] = True
+        self.imported += entry[2]
+        while self._ranges and self._ranges[0][3]:
+            self.line = self._ranges.popleft()[1]
+        self.save()
+
+    def save(self) -> None:
+        if not self._path:
+            return
+        ahead = [r for r in self._done_ahead if r[1] > self.line]
+        ahead += [[start, end] for start, end, _, done in self._ranges if done]
+        tmp = f"{os.fspath(self._path)}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(
+                {
+                    "source": self._source,
+                    "line": self.line,
+                    "imported": self.imported,
+                    "completed": ahead,
+                },
+                f,
+            )
+        os.replace(tmp, self._path)
+
 
 class DataResource:
     """Resource for GDPR data export operations."""
@@ -31,6 +293,9 @@ class DataResource:
     def download(self, job_id: str) -> bytes:
         """Download an export file after the export job completes.
 
+        The whole file is held in memory; use download_to() or
+        iter_download() for large exports.
+
         Args:
             job_id: The job ID from the export() call
 
@@ -38,7 +303,851 @@ class DataResource:
             The export file contents as bytes (JSONL format)
         """
         # Use the underlying httpx client directly for raw response
-        response = self._client._client.get(f"/v1/data/export/{job_id}/download")
+        response = self._client._client.get(_download_path(job_id))
+        if response.status_code != 200:
+            self._client._handle_response(response)
+        return response.content
+
+    def iter_download(
+        self,
+        job_id: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        offset: int = 0,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> Iterator[bytes]:
+        """Stream an export file as byte chunks.
+
+        Only one chunk is held in memory at a time. If the connection drops,
+        the download continues from the last received byte with an HTTP
+        Range request, up to ``max_retries`` times in a row.
+
+        Args:
+            job_id: The job ID from the export() call
+            chunk_size: Maximum size of each yielded chunk in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            offset: Byte offset to start from (to resume a partial download)
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Yields:
+            Chunks of the export file (JSONL format)
+        """
+        total: Optional[int] = None
+
+        def on_response(response: httpx.Response) -> None:
+            nonlocal total
+            total = _total_size(response)
+
+        received = offset
+        for chunk in self._iter_range(
+            job_id,
+            start=offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            on_response=on_response,
+        ):
+            received += len(chunk)
+            if progress:
+                progress(received, total)
+            yield chunk
+
+    def download_to(
+        self,
+        job_id: str,
+        destination: Destination,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        resume: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Stream an export file to a path or binary file object.
+
+        Args:
+            job_id: The job ID from the export() call
+            destination: File path, or a file object opened for binary writing
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            resume: If destination is a path that already exists, keep its
+                contents and download only the remaining bytes
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Returns:
+            Size of the downloaded file in bytes
+        """
+        if not isinstance(destination, (str, os.PathLike)):
+            chunks = self.iter_download(
+                job_id, chunk_size=chunk_size, progress=progress, max_retries=max_retries
+            )
+            return _write_chunks(destination, chunks)
+
+        offset = _resume_offset(destination, resume)
+        chunks = self.iter_download(
+            job_id,
+            chunk_size=chunk_size,
+            progress=progress,
+            offset=offset,
+            max_retries=max_retries,
+        )
+        with open(destination, "ab" if offset else "wb") as f:
+            return offset + _write_chunks(f, chunks)
+
+    def download_parallel(
+        self,
+        job_id: str,
+        path: FilePath,
+        *,
+        segments: int = DEFAULT_SEGMENTS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download an export file as concurrent byte ranges.
+
+        The file is preallocated and each segment is written at its offset
+        as it arrives. Falls back to download_to() when the server does not
+        support Range requests or does not report the file size.
+
+        Args:
+            job_id: The job ID from the export() call
+            path: Destination file path
+            segments: Number of concurrent range requests
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes),
+                possibly from worker threads
+            max_retries: Consecutive reconnect attempts per segment
+
+        Returns:
+            Size of the downloaded file in bytes
+        """
+        size = self._probe_size(job_id)
+        if size is None or segments <= 1 or size <= chunk_size:
+            return self.download_to(
+                job_id, path, chunk_size=chunk_size, progress=progress, max_retries=max_retries
+            )
+
+        counter = _ProgressCounter(size, progress)
+        writer = _SegmentWriter(path, size)
+        failed = threading.Event()
+
+        def fetch(bounds: tuple[int, int]) -> None:
+            start, end = bounds
+            position = start
+            for chunk in self._iter_range(
+                job_id,
+                start=start,
+                end=end,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+                require_partial=True,
+            ):
+                if failed.is_set():
+                    return
+                writer.write(position, chunk)
+                position += len(chunk)
+                counter.add(len(chunk))
+            if position != end + 1:
+                raise KeyokuError(f"Segment {start}-{end} ended at byte {position}")
+
+        try:
+            ranges = _segment_bounds(size, segments)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+                futures = [pool.submit(fetch, bounds) for bounds in ranges]
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                except BaseException:
+                    # Stop the other segments at their next chunk rather than
+                    # downloading the rest of the file before re-raising.
+                    failed.set()
+                    raise
+        finally:
+            writer.close()
+        return size
+
+    def export_to(
+        self,
+        destination: Destination,
+        *,
+        timeout: Optional[float] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> ExportResult:
+        """Start an export, wait for it to finish and stream it to a destination.
+
+        The job is polled with exponential backoff (0.25s growing to 5s).
+        The download is hashed while streaming and checked against the
+        Content-Length and any size or checksum reported in the job result.
+
+        Args:
+            destination: File path, or a file object opened for binary writing
+            timeout: Maximum seconds to wait for the export job (None = no timeout)
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Returns:
+            ExportResult with size, SHA-256 and per-phase timings
+
+        Raises:
+            IntegrityError: If the download does not match the expected size or checksum
+            TimeoutError: If the export job does not complete in time
+        """
+        from keyoku.client import JobHandle
+
+        started = time.perf_counter()
+        export = self.export()
+        exported = time.perf_counter()
+        job = JobHandle(self._client, export.job_id).wait(
+            poll_interval=JOB_POLL_INTERVAL,
+            backoff=JOB_POLL_BACKOFF,
+            max_poll_interval=MAX_JOB_POLL_INTERVAL,
+            timeout=timeout,
+        )
+        waited = time.perf_counter()
+
+        check = _DownloadCheck(progress)
+        chunks = check.hashed(self.iter_download(
+            export.job_id,
+            chunk_size=chunk_size,
+            progress=check.on_progress,
+            max_retries=max_retries,
+        ))
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "wb") as f:
+                size = _write_chunks(f, chunks)
+        else:
+            size = _write_chunks(destination, chunks)
+        downloaded = time.perf_counter()
+
+        return ExportResult(
+            job_id=export.job_id,
+            bytes_written=size,
+            sha256=check.verify(size, job.result),
+            timings=ExportTimings(
+                export=exported - started,
+                wait=waited - exported,
+                download=downloaded - waited,
+                total=downloaded - started,
+            ),
+        )
+
+    def iter_records(
+        self,
+        job_id: str,
+        *,
+        raw: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch_chunks: int = DEFAULT_PREFETCH,
+        progress: Optional[ProgressCallback] = None,
+    ) -> Iterator[ParsedRecord]:
+        """Stream an export file and parse it line by line.
+
+        Chunks are read ahead in a background thread (at most
+        ``prefetch_chunks`` at a time), so parsing overlaps with the network
+        and memory stays bounded regardless of export size.
+
+        Args:
+            job_id: The job ID from the export() call
+            raw: Yield lightweight records instead of validated models
+            chunk_size: Size of each downloaded chunk in bytes
+            prefetch_chunks: Chunks to read ahead (0 disables read-ahead)
+            progress: Optional callback called with (bytes_received, total_bytes)
+
+        Yields:
+            Memory, Entity, Relationship, ... models (or records when raw),
+            and ExportRecord for kinds without a model
+        """
+        chunks = self.iter_download(job_id, chunk_size=chunk_size, progress=progress)
+        return iter_records(prefetch(chunks, prefetch_chunks), raw=raw)
+
+    def download_columnar(
+        self,
+        job_id: str,
+        directory: FilePath,
+        *,
+        format: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch_chunks: int = DEFAULT_PREFETCH,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict[str, int]:
+        """Stream an export file into one Parquet or Arrow IPC file per record kind.
+
+        Lines are decoded as they arrive and buffered per kind for at most
+        ``row_group_size`` rows. Requires pyarrow (pip install keyoku[arrow]).
+
+        Args:
+            job_id: The job ID from the export() call
+            directory: Output directory (created if missing)
+            format: "parquet" or "arrow"
+            row_group_size: Rows per row group / record batch
+            chunk_size: Size of each downloaded chunk in bytes
+            prefetch_chunks: Chunks to read ahead (0 disables read-ahead)
+            progress: Optional callback called with (bytes_received, total_bytes)
+
+        Returns:
+            Rows written per record kind
+        """
+        chunks = self.iter_download(job_id, chunk_size=chunk_size, progress=progress)
+        return write_columnar(
+            iter_objects(prefetch(chunks, prefetch_chunks)),
+            directory,
+            format=format,
+            row_group_size=row_group_size,
+        )
+
+    def import_from(
+        self,
+        path: FilePath,
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+        concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+        checkpoint: Optional[FilePath] = None,
+    ) -> ImportResult:
+        """Load the memories of a JSONL export back into the current entity.
+
+        The file is read line by line. Consecutive memory records with the
+        same ``agent_id`` are grouped into ``/v1/memories/batch`` requests of
+        up to ``batch_size`` memories, with at most ``concurrency`` requests
+        in flight. Other record kinds are skipped.
+
+        With ``checkpoint`` set, the first line not yet imported (and any
+        batches that completed past it) is saved to that file after each
+        batch completes; calling import_from() again with the same
+        checkpoint resumes from there. If a batch fails, the batches still
+        in flight are waited for and recorded before the error is raised.
+
+        Args:
+            path: Path of a JSONL export file
+            batch_size: Memories per batch request
+            concurrency: Maximum batch requests in flight
+            checkpoint: Optional path of a JSON checkpoint file
+
+        Returns:
+            ImportResult with counts and the batch job IDs
+        """
+        state = _ImportCheckpoint(checkpoint, path)
+        resumed_from = state.line
+        imported_before = state.imported
+        job_ids: list[str] = []
+        batches = 0
+        in_flight: dict[Future[Any], list[Any]] = {}
+
+        def drain(block_until: int) -> None:
+            while len(in_flight) > block_until:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    entry = in_flight.pop(future)
+                    response = future.result()
+                    if isinstance(response, dict) and response.get("job_id"):
+                        job_ids.append(response["job_id"])
+                    state.complete(entry)
+
+        contents: list[str] = []
+        agent_id: Optional[str] = None
+        line_no = resumed_from
+
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+
+            def submit(end_line: int) -> None:
+                nonlocal contents, batches
+                drain(max(1, concurrency) - 1)
+                entry = state.add(end_line, len(contents))
+                future = pool.submit(
+                    self._client.memories.batch_create, contents, agent_id=agent_id
+                )
+                in_flight[future] = entry
+                contents = []
+                batches += 1
+
+            try:
+                with open(path, "rb") as f:
+                    for index, line in enumerate(f):
+                        if index < resumed_from or state.is_done(index):
+                            continue
+                        line_no = index + 1
+                        if not line.strip():
+                            continue
+                        kind, data = split_record(json.loads(line))
+                        if kind != "memory":
+                            continue
+                        record_agent = data.get("agent_id")
+                        if contents and record_agent != agent_id:
+                            submit(index)
+                        agent_id = record_agent
+                        contents.append(data["content"])
+                        if len(contents) >= batch_size:
+                            submit(line_no)
+                    if contents:
+                        submit(line_no)
+                drain(0)
+            finally:
+                # Batches already sent still reach the server; record the ones
+                # that succeed so a resume does not send them again.
+                for future in in_flight:
+                    future.cancel()
+                wait(in_flight)
+                for future, entry in in_flight.items():
+                    if not future.cancelled() and future.exception() is None:
+                        state.complete(entry)
+
+        if line_no > state.line:
+            state.line = line_no
+            state.save()
+
+        return ImportResult(
+            memories_imported=state.imported - imported_before,
+            batches=batches,
+            job_ids=job_ids,
+            resumed_from_line=resumed_from,
+            lines_read=line_no - resumed_from,
+        )
+
+    def _probe_size(self, job_id: str) -> Optional[int]:
+        """Return the export size if the server serves byte ranges."""
+        headers = _download_headers(0, 0)
+        with self._client._client.stream("GET", _download_path(job_id), headers=headers) as r:
+            if r.status_code == 206:
+                return _total_size(r)
+            if r.status_code != 200:
+                r.read()
+                self._client._handle_response(r)
+            return None
+
+    def _iter_range(
+        self,
+        job_id: str,
+        *,
+        start: int,
+        end: Optional[int] = None,
+        chunk_size: int,
+        max_retries: int,
+        require_partial: bool = False,
+        on_response: Optional[Callable[[httpx.Response], None]] = None,
+    ) -> Iterator[bytes]:
+        """Stream bytes ``start``..``end`` (inclusive), reconnecting on network errors."""
+        position = start
+        attempt = 0
+        while True:
+            headers = _download_headers(position, end)
+            try:
+                with self._client._client.stream(
+                    "GET", _download_path(job_id), headers=headers
+                ) as response:
+                    if response.status_code == 416 and position > 0:
+                        return
+                    if response.status_code not in (200, 206):
+                        response.read()
+                        self._client._handle_response(response)
+                    skip = _bytes_to_skip(response, position, require_partial)
+                    if on_response:
+                        on_response(response)
+                    body = (
+                        response.iter_bytes(chunk_size)
+                        if _is_encoded(response)
+                        else response.iter_raw(chunk_size)
+                    )
+                    for chunk in body:
+                        if skip:
+                            if len(chunk) <= skip:
+                                skip -= len(chunk)
+                                continue
+                            chunk, skip = chunk[skip:], 0
+                        position += len(chunk)
+                        attempt = 0
+                        yield chunk
+                    return
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                time.sleep(_retry_delay(attempt))
+                attempt += 1
+
+
+class AsyncDataResource:
+    """Async resource for GDPR data export operations."""
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self._client = client
+
+    async def export(self) -> ExportResponse:
+        """Start a GDPR data export job.
+
+        Returns:
+            ExportResponse with job_id and status
+        """
+        response = await self._client.request("GET", "/v1/data/export")
+        return ExportResponse(**response)
+
+    async def download(self, job_id: str) -> bytes:
+        """Download an export file after the export job completes.
+
+        Args:
+            job_id: The job ID from the export() call
+
+        Returns:
+            The export file contents as bytes (JSONL format)
+        """
+        response = await self._client._client.get(_download_path(job_id))
         if response.status_code != 200:
             self._client._handle_response(response)
         return response.content
+
+    async def iter_download(
+        self,
+        job_id: str,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        offset: int = 0,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> AsyncIterator[bytes]:
+        """Stream an export file as byte chunks.
+
+        Reconnects with an HTTP Range request after network errors, up to
+        ``max_retries`` times in a row.
+
+        Args:
+            job_id: The job ID from the export() call
+            chunk_size: Maximum size of each yielded chunk in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            offset: Byte offset to start from (to resume a partial download)
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Yields:
+            Chunks of the export file (JSONL format)
+        """
+        total: Optional[int] = None
+
+        def on_response(response: httpx.Response) -> None:
+            nonlocal total
+            total = _total_size(response)
+
+        received = offset
+        async for chunk in self._iter_range(
+            job_id,
+            start=offset,
+            chunk_size=chunk_size,
+            max_retries=max_retries,
+            on_response=on_response,
+        ):
+            received += len(chunk)
+            if progress:
+                progress(received, total)
+            yield chunk
+
+    async def download_to(
+        self,
+        job_id: str,
+        destination: Destination,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        resume: bool = False,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Stream an export file to a path or binary file object.
+
+        Args:
+            job_id: The job ID from the export() call
+            destination: File path, or a file object opened for binary writing
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            resume: If destination is a path that already exists, keep its
+                contents and download only the remaining bytes
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Returns:
+            Size of the downloaded file in bytes
+        """
+        if not isinstance(destination, (str, os.PathLike)):
+            chunks = self.iter_download(
+                job_id, chunk_size=chunk_size, progress=progress, max_retries=max_retries
+            )
+            return await _awrite_chunks(destination, chunks)
+
+        offset = _resume_offset(destination, resume)
+        chunks = self.iter_download(
+            job_id,
+            chunk_size=chunk_size,
+            progress=progress,
+            offset=offset,
+            max_retries=max_retries,
+        )
+        with open(destination, "ab" if offset else "wb") as f:
+            return offset + await _awrite_chunks(f, chunks)
+
+    async def download_parallel(
+        self,
+        job_id: str,
+        path: FilePath,
+        *,
+        segments: int = DEFAULT_SEGMENTS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> int:
+        """Download an export file as concurrent byte ranges.
+
+        See DataResource.download_parallel().
+
+        Args:
+            job_id: The job ID from the export() call
+            path: Destination file path
+            segments: Number of concurrent range requests
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            max_retries: Consecutive reconnect attempts per segment
+
+        Returns:
+            Size of the downloaded file in bytes
+        """
+        size = await self._probe_size(job_id)
+        if size is None or segments <= 1 or size <= chunk_size:
+            return await self.download_to(
+                job_id, path, chunk_size=chunk_size, progress=progress, max_retries=max_retries
+            )
+
+        counter = _ProgressCounter(size, progress)
+        writer = _SegmentWriter(path, size)
+
+        async def fetch(start: int, end: int) -> None:
+            position = start
+            async for chunk in self._iter_range(
+                job_id,
+                start=start,
+                end=end,
+                chunk_size=chunk_size,
+                max_retries=max_retries,
+                require_partial=True,
+            ):
+                writer.write(position, chunk)
+                position += len(chunk)
+                counter.add(len(chunk))
+            if position != end + 1:
+                raise KeyokuError(f"Segment {start}-{end} ended at byte {position}")
+
+        tasks = [
+            asyncio.ensure_future(fetch(start, end))
+            for start, end in _segment_bounds(size, segments)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # gather() leaves the other segments running when one fails; stop
+            # them before the file descriptor is closed under them.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.close()
+        return size
+
+    async def export_to(
+        self,
+        destination: Destination,
+        *,
+        timeout: Optional[float] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        progress: Optional[ProgressCallback] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> ExportResult:
+        """Start an export, wait for it to finish and stream it to a destination.
+
+        See DataResource.export_to().
+
+        Args:
+            destination: File path, or a file object opened for binary writing
+            timeout: Maximum seconds to wait for the export job (None = no timeout)
+            chunk_size: Size of each write in bytes
+            progress: Optional callback called with (bytes_received, total_bytes)
+            max_retries: Consecutive reconnect attempts after network errors
+
+        Returns:
+            ExportResult with size, SHA-256 and per-phase timings
+
+        Raises:
+            IntegrityError: If the download does not match the expected size or checksum
+            TimeoutError: If the export job does not complete in time
+        """
+        from keyoku.async_client import AsyncJobHandle
+
+        started = time.perf_counter()
+        export = await self.export()
+        exported = time.perf_counter()
+        job = await AsyncJobHandle(self._client, export.job_id).wait(
+            poll_interval=JOB_POLL_INTERVAL,
+            backoff=JOB_POLL_BACKOFF,
+            max_poll_interval=MAX_JOB_POLL_INTERVAL,
+            timeout=timeout,
+        )
+        waited = time.perf_counter()
+
+        check = _DownloadCheck(progress)
+        chunks = check.ahashed(self.iter_download(
+            export.job_id,
+            chunk_size=chunk_size,
+            progress=check.on_progress,
+            max_retries=max_retries,
+        ))
+        if isinstance(destination, (str, os.PathLike)):
+            with open(destination, "wb") as f:
+                size = await _awrite_chunks(f, chunks)
+        else:
+            size = await _awrite_chunks(destination, chunks)
+        downloaded = time.perf_counter()
+
+        return ExportResult(
+            job_id=export.job_id,
+            bytes_written=size,
+            sha256=check.verify(size, job.result),
+            timings=ExportTimings(
+                export=exported - started,
+                wait=waited - exported,
+                download=downloaded - waited,
+                total=downloaded - started,
+            ),
+        )
+
+    def iter_records(
+        self,
+        job_id: str,
+        *,
+        raw: bool = False,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch_chunks: int = DEFAULT_PREFETCH,
+        progress: Optional[ProgressCallback] = None,
+    ) -> AsyncIterator[ParsedRecord]:
+        """Stream an export file and parse it line by line.
+
+        Chunks are read ahead in a background task (at most
+        ``prefetch_chunks`` at a time).
+
+        Args:
+            job_id: The job ID from the export() call
+            raw: Yield lightweight records instead of validated models
+            chunk_size: Size of each downloaded chunk in bytes
+            prefetch_chunks: Chunks to read ahead (0 disables read-ahead)
+            progress: Optional callback called with (bytes_received, total_bytes)
+
+        Yields:
+            Memory, Entity, Relationship, ... models (or records when raw),
+            and ExportRecord for kinds without a model
+        """
+        chunks = self.iter_download(job_id, chunk_size=chunk_size, progress=progress)
+        return aiter_records(aprefetch(chunks, prefetch_chunks), raw=raw)
+
+    async def download_columnar(
+        self,
+        job_id: str,
+        directory: FilePath,
+        *,
+        format: str = "parquet",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        prefetch_chunks: int = DEFAULT_PREFETCH,
+        progress: Optional[ProgressCallback] = None,
+    ) -> dict[str, int]:
+        """Stream an export file into one Parquet or Arrow IPC file per record kind.
+
+        See DataResource.download_columnar().
+
+        Args:
+            job_id: The job ID from the export() call
+            directory: Output directory (created if missing)
+            format: "parquet" or "arrow"
+            row_group_size: Rows per row group / record batch
+            chunk_size: Size of each downloaded chunk in bytes
+            prefetch_chunks: Chunks to read ahead (0 disables read-ahead)
+            progress: Optional callback called with (bytes_received, total_bytes)
+
+        Returns:
+            Rows written per record kind
+        """
+        chunks = self.iter_download(job_id, chunk_size=chunk_size, progress=progress)
+        return await awrite_columnar(
+            aiter_objects(aprefetch(chunks, prefetch_chunks)),
+            directory,
+            format=format,
+            row_group_size=row_group_size,
+        )
+
+    async def _probe_size(self, job_id: str) -> Optional[int]:
+        """Return the export size if the server serves byte ranges."""
+        headers = _download_headers(0, 0)
+        async with self._client._client.stream(
+            "GET", _download_path(job_id), headers=headers
+        ) as r:
+            if r.status_code == 206:
+                return _total_size(r)
+            if r.status_code != 200:
+                await r.aread()
+                self._client._handle_response(r)
+            return None
+
+    async def _iter_range(
+        self,
+        job_id: str,
+        *,
+        start: int,
+        end: Optional[int] = None,
+        chunk_size: int,
+        max_retries: int,
+        require_partial: bool = False,
+        on_response: Optional[Callable[[httpx.Response], None]] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream bytes ``start``..``end`` (inclusive), reconnecting on network errors."""
+        position = start
+        attempt = 0
+        while True:
+            headers = _download_headers(position, end)
+            try:
+                async with self._client._client.stream(
+                    "GET", _download_path(job_id), headers=headers
+                ) as response:
+                    if response.status_code == 416 and position > 0:
+                        return
+                    if response.status_code not in (200, 206):
+                        await response.aread()
+                        self._client._handle_response(response)
+                    skip = _bytes_to_skip(response, position, require_partial)
+                    if on_response:
+                        on_response(response)
+                    body = (
+                        response.aiter_bytes(chunk_size)
+                        if _is_encoded(response)
+                        else response.aiter_raw(chunk_size)
+                    )
+                    async for chunk in body:
+                        if skip:
+                            if len(chunk) <= skip:
+                                skip -= len(chunk)
+                                continue
+                            chunk, skip = chunk[skip:], 0
+                        position += len(chunk)
+                        attempt = 0
+                        yield chunk
+                    return
+            except httpx.TransportError:
+                if attempt >= max_retries:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+                attempt += 1
+
+
+def _write_chunks(f: IO[bytes], chunks: Iterator[bytes]) -> int:
+    written = 0
+    for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
+
+
+async def _awrite_chunks(f: IO[bytes], chunks: AsyncIterator[bytes]) -> int:
+    written = 0
+    async for chunk in chunks:
+        f.write(chunk)
+        written += len(chunk)
+    return written
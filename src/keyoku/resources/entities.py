@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import builtins
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Literal, Optional, Union, overload
 
+from keyoku._pagination import DEFAULT_PAGE_SIZE, aiter_pages, iter_pages
 from keyoku.models import Entity, Relationship
+from keyoku.records import EntityRecord
 
 if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
     from keyoku.client import Keyoku
 
 
@@ -16,19 +20,41 @@ class EntitiesResource:
     def __init__(self, client: "Keyoku"):
         self._client = client
 
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        type: Optional[str] = ...,
+        raw: Literal[False] = ...,
+    ) -> list[Entity]: ...
+
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        type: Optional[str] = ...,
+        raw: Literal[True],
+    ) -> list[EntityRecord]: ...
+
     def list(
         self,
         *,
         limit: int = 50,
         offset: int = 0,
         type: Optional[str] = None,
-    ) -> list[Entity]:
+        raw: bool = False,
+    ) -> Union[list[Entity], list[EntityRecord]]:
         """List all entities.
 
         Args:
             limit: Maximum number of entities to return
             offset: Number of entities to skip
             type: Filter by entity type
+            raw: Return lightweight EntityRecord objects without validation
 
         Returns:
             List of entities
@@ -38,8 +64,33 @@ class EntitiesResource:
             params["type"] = type
 
         response = self._client.request("GET", "/v1/entities", params=params)
+        if raw:
+            return [EntityRecord(e) for e in response.get("entities", [])]
         return [Entity(**e) for e in response.get("entities", [])]
 
+    def iter_all(
+        self,
+        *,
+        type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Entity]:
+        """Iterate over every entity, paginating automatically.
+
+        The next page is fetched in the background while the current one is
+        consumed; iteration ends after the first short page.
+
+        Args:
+            type: Filter by entity type
+            page_size: Entities requested per page
+
+        Yields:
+            Entities in server order
+        """
+        return iter_pages(
+            lambda limit, offset: self.list(limit=limit, offset=offset, type=type),
+            page_size=page_size,
+        )
+
     def search(
         self,
         query: str,
@@ -73,8 +124,9 @@ class EntitiesResource:
         Returns:
             The entity
         """
-        response = self._client.request("GET", f"/v1/entities/{entity_id}")
-        return Entity(**response)
+        return self._client.conditional_get(
+            f"/v1/entities/{entity_id}", lambda response: Entity(**response)
+        )
 
     def relationships(
         self,
@@ -103,3 +155,95 @@ class EntitiesResource:
             params=params,
         )
         return [Relationship(**r) for r in response.get("relationships", [])]
+
+
+class AsyncEntitiesResource:
+    """Async resource for knowledge graph entity operations."""
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self._client = client
+
+    async def list(
+        self,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        type: Optional[str] = None,
+    ) -> list[Entity]:
+        """List all entities.
+
+        Args:
+            limit: Maximum number of entities to return
+            offset: Number of entities to skip
+            type: Filter by entity type
+
+        Returns:
+            List of entities
+        """
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if type:
+            params["type"] = type
+
+        response = await self._client.request("GET", "/v1/entities", params=params)
+        return [Entity(**e) for e in response.get("entities", [])]
+
+    def iter_all(
+        self,
+        *,
+        type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Entity]:
+        """Iterate over every entity, paginating automatically.
+
+        Args:
+            type: Filter by entity type
+            page_size: Entities requested per page
+
+        Yields:
+            Entities in server order
+        """
+        return aiter_pages(
+            lambda limit, offset: self.list(limit=limit, offset=offset, type=type),
+            page_size=page_size,
+        )
+
+    async def get(self, entity_id: str) -> Entity:
+        """Get a specific entity by ID.
+
+        Args:
+            entity_id: The entity ID
+
+        Returns:
+            The entity
+        """
+        return await self._client.conditional_get(
+            f"/v1/entities/{entity_id}", lambda response: Entity(**response)
+        )
+
+    async def relationships(
+        self,
+        entity_id: str,
+        *,
+        direction: str = "both",
+        type: Optional[str] = None,
+    ) -> builtins.list[Relationship]:
+        """Get relationships for an entity.
+
+        Args:
+            entity_id: The entity ID
+            direction: "incoming", "outgoing", or "both"
+            type: Filter by relationship type
+
+        Returns:
+            List of relationships
+        """
+        params: dict[str, Any] = {"direction": direction}
+        if type:
+            params["type"] = type
+
+        response = await self._client.request(
+            "GET",
+            f"/v1/entities/{entity_id}/relationships",
+            params=params,
+        )
+        return [Relationship(**r) for r in response.get("relationships", [])]
@@ -1,11 +1,17 @@
 """Graph resource for Keyoku API."""
 
-from typing import TYPE_CHECKING, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Optional, Sequence
 
+from keyoku._cache import MISSING, TTLCache
+from keyoku.exceptions import NotFoundError
 from keyoku.models import Entity, Relationship
 
 if TYPE_CHECKING:
     from keyoku.client import Keyoku
+    from keyoku.graph_snapshot import GraphSnapshot
+
+PATH_CACHE_TTL = 300.0
 
 
 class PathResult:
@@ -23,11 +29,35 @@ class PathResult:
         return f"PathResult({path_str})"
 
 
+class Neighborhood:
+    """Entities and relationships within a few hops of a set of seeds."""
+
+    def __init__(
+        self,
+        entities: list[Entity],
+        relationships: list[Relationship],
+        depths: dict[str, int],
+        truncated: bool = False,
+    ):
+        self.entities = entities
+        self.relationships = relationships
+        self.depths = depths
+        self.truncated = truncated
+
+    def __repr__(self) -> str:
+        suffix = ", truncated" if self.truncated else ""
+        return (
+            f"Neighborhood({len(self.entities)} entities, "
+            f"{len(self.relationships)} relationships{suffix})"
+        )
+
+
 class GraphResource:
     """Resource for knowledge graph traversal operations."""
 
     def __init__(self, client: "Keyoku"):
         self._client = client
+        self.path_cache: TTLCache[Optional[PathResult]] = TTLCache(ttl=PATH_CACHE_TTL)
 
     def find_path(
         self,
@@ -65,3 +95,172 @@ class GraphResource:
         relationships = [Relationship(**r) for r in response.get("relationships", [])]
 
         return PathResult(entities, relationships)
+
+    def find_paths(
+        self,
+        pairs: Sequence[tuple[str, str]],
+        *,
+        max_depth: int = 5,
+        relationship_types: Optional[list[str]] = None,
+        symmetric: bool = True,
+        max_workers: int = 8,
+    ) -> list[Optional[PathResult]]:
+        """Find shortest paths for many entity pairs.
+
+        Repeated pairs are requested once, and with ``symmetric`` a pair and
+        its reverse share one request (the reverse path is the same path read
+        backwards). Uncached pairs are fetched concurrently. Results, including
+        "no path", are kept in ``path_cache`` for PATH_CACHE_TTL seconds.
+
+        Args:
+            pairs: (from_entity, to_entity) tuples
+            max_depth: Maximum path length to search
+            relationship_types: Only traverse these relationship types
+            symmetric: Treat paths as undirected when deduplicating pairs
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            One PathResult or None per input pair, in input order
+        """
+        types = tuple(sorted(relationship_types)) if relationship_types else ()
+
+        def key(pair: tuple[str, str]) -> tuple[Any, ...]:
+            source, target = pair
+            if symmetric and target < source:
+                source, target = target, source
+            return (source, target, max_depth, types)
+
+        results: dict[tuple[Any, ...], Optional[PathResult]] = {}
+        missing: dict[tuple[Any, ...], tuple[str, str]] = {}
+        for pair in pairs:
+            k = key(pair)
+            if k in results or k in missing:
+                continue
+            cached = self.path_cache.get(k)
+            if cached is MISSING:
+                missing[k] = (k[0], k[1])
+            else:
+                results[k] = cached
+
+        def fetch(pair: tuple[str, str]) -> Optional[PathResult]:
+            return self.find_path(
+                pair[0],
+                pair[1],
+                max_depth=max_depth,
+                relationship_types=relationship_types,
+            )
+
+        if missing:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                for k, path in zip(missing, pool.map(fetch, missing.values())):
+                    self.path_cache.set(k, path)
+                    results[k] = path
+
+        aligned: list[Optional[PathResult]] = []
+        for pair in pairs:
+            path = results[key(pair)]
+            if path is not None and symmetric and pair[1] < pair[0]:
+                path = PathResult(path.entities[::-1], path.relationships[::-1])
+            aligned.append(path)
+        return aligned
+
+    def neighborhood(
+        self,
+        seeds: Sequence[str],
+        *,
+        depth: int = 1,
+        direction: str = "both",
+        relationship_types: Optional[list[str]] = None,
+        max_nodes: int = 500,
+        max_edges: int = 2000,
+        max_workers: int = 8,
+    ) -> Neighborhood:
+        """Expand the graph breadth-first around a set of seed entities.
+
+        Each level's relationships are fetched concurrently, visited entities
+        are skipped, and all reached entities are loaded in one concurrent
+        batch at the end. Expansion stops adding entities or relationships
+        once ``max_nodes`` or ``max_edges`` is reached.
+
+        Args:
+            seeds: Entity IDs to start from
+            depth: Number of hops to expand
+            direction: "incoming", "outgoing", or "both"
+            relationship_types: Only follow these relationship types
+            max_nodes: Maximum number of entities, seeds included
+            max_edges: Maximum number of relationships
+            max_workers: Maximum concurrent requests
+
+        Returns:
+            Neighborhood with entities in BFS order and their hop counts
+        """
+        entities_resource = self._client.entities
+        allowed = set(relationship_types or ())
+        type_filter = next(iter(allowed)) if len(allowed) == 1 else None
+
+        depths: dict[str, int] = {}
+        for seed in seeds:
+            if len(depths) < max_nodes:
+                depths.setdefault(seed, 0)
+        relationships: dict[str, Relationship] = {}
+        truncated = len(depths) < len(set(seeds))
+
+        def expand(entity_id: str) -> list[Relationship]:
+            return entities_resource.relationships(
+                entity_id, direction=direction, type=type_filter
+            )
+
+        def load(entity_id: str) -> Optional[Entity]:
+            try:
+                return entities_resource.get(entity_id)
+            except NotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            frontier = list(depths)
+            for level in range(1, depth + 1):
+                if not frontier:
+                    break
+                next_frontier: list[str] = []
+                for found in pool.map(expand, frontier):
+                    for rel in found:
+                        if rel.id in relationships:
+                            continue
+                        if allowed and rel.relationship_type not in allowed:
+                            continue
+                        if len(relationships) >= max_edges:
+                            truncated = True
+                            break
+                        for entity_id in (rel.source_entity_id, rel.target_entity_id):
+                            if entity_id in depths:
+                                continue
+                            if len(depths) >= max_nodes:
+                                truncated = True
+                                break
+                            depths[entity_id] = level
+                            next_frontier.append(entity_id)
+                        if rel.source_entity_id in depths and rel.target_entity_id in depths:
+                            relationships[rel.id] = rel
+                frontier = next_frontier
+
+            loaded = list(pool.map(load, depths))
+
+        entities = [e for e in loaded if e is not None]
+        return Neighborhood(entities, list(relationships.values()), depths, truncated)
+
+    def snapshot(self, *, page_size: int = 100, max_workers: int = 8) -> "GraphSnapshot":
+        """Load the whole graph into a local snapshot for in-process traversal.
+
+        Entity and relationship pages are fetched concurrently. Requires
+        numpy (pip install keyoku[numpy]).
+
+        Args:
+            page_size: Items requested per page
+            max_workers: Pages fetched concurrently
+
+        Returns:
+            GraphSnapshot with local find_path, bfs and neighborhood queries
+        """
+        from keyoku.graph_snapshot import GraphSnapshot
+
+        return GraphSnapshot.load(self._client, page_size=page_size, max_workers=max_workers)
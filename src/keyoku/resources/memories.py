@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import builtins
+from typing import TYPE_CHECKING, Any, Iterator, Literal, Optional, Union, overload
 
+from keyoku.columnar import MemoryColumnBuilder, MemoryColumns
+from keyoku.compact import CompactMemoryStore
+from keyoku.dedup import DEFAULT_NUM_PERM, DEFAULT_THRESHOLD, DuplicateReport, NearDuplicateIndex
 from keyoku.models import ListMemoriesResponse, Memory
+from keyoku.records import MemoryRecordPage
 
 if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
     from keyoku.client import Keyoku
 
 
@@ -16,29 +22,206 @@ class MemoriesResource:
     def __init__(self, client: "Keyoku"):
         self._client = client
 
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        agent_id: Optional[str] = ...,
+        raw: Literal[False] = ...,
+    ) -> ListMemoriesResponse: ...
+
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        agent_id: Optional[str] = ...,
+        raw: Literal[True],
+    ) -> MemoryRecordPage: ...
+
     def list(
         self,
         *,
         limit: int = 50,
         offset: int = 0,
         agent_id: Optional[str] = None,
-    ) -> ListMemoriesResponse:
+        raw: bool = False,
+    ) -> Union[ListMemoriesResponse, MemoryRecordPage]:
         """List all memories.
 
         Args:
             limit: Maximum number of memories to return
             offset: Number of memories to skip
             agent_id: Filter by agent ID
+            raw: Return a lightweight MemoryRecordPage without validation
 
         Returns:
             ListMemoriesResponse with memories and pagination info
         """
+        response = self._list_page(limit=limit, offset=offset, agent_id=agent_id)
+        if raw:
+            return MemoryRecordPage(response)
+        return ListMemoriesResponse(**response)
+
+    def list_columns(
+        self,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        agent_id: Optional[str] = None,
+    ) -> MemoryColumns:
+        """List one page of memories as columns.
+
+        Requires NumPy (pip install keyoku[numpy]).
+
+        Args:
+            limit: Maximum number of memories to return
+            offset: Number of memories to skip
+            agent_id: Filter by agent ID
+
+        Returns:
+            MemoryColumns for the page (``score`` is NaN)
+        """
+        response = self._list_page(limit=limit, offset=offset, agent_id=agent_id)
+        return MemoryColumns.from_rows(response["memories"])
+
+    def scan_columns(
+        self,
+        *,
+        page_size: int = 100,
+        agent_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> MemoryColumns:
+        """Page through all memories into preallocated column buffers.
+
+        The buffers are sized from the ``total`` of the first page and grow
+        if more rows arrive. Requires NumPy (pip install keyoku[numpy]).
+
+        Args:
+            page_size: Memories requested per page
+            agent_id: Filter by agent ID
+            max_rows: Stop after this many rows (default: all)
+
+        Returns:
+            MemoryColumns for every memory scanned
+        """
+        builder: Optional[MemoryColumnBuilder] = None
+        for rows, capacity in self._scan_pages(
+            page_size=page_size, agent_id=agent_id, max_rows=max_rows
+        ):
+            if builder is None:
+                builder = MemoryColumnBuilder(capacity=capacity)
+            builder.append(rows)
+        return (builder or MemoryColumnBuilder(capacity=1)).build()
+
+    def scan_compact(
+        self,
+        *,
+        page_size: int = 100,
+        agent_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> CompactMemoryStore:
+        """Page through all memories into a CompactMemoryStore.
+
+        Repeated ``type`` and ``agent_id`` values are interned, timestamps
+        are stored as int64 and content shares one buffer. Requires NumPy
+        (pip install keyoku[numpy]).
+
+        Args:
+            page_size: Memories requested per page
+            agent_id: Filter by agent ID
+            max_rows: Stop after this many rows (default: all)
+
+        Returns:
+            CompactMemoryStore holding every memory scanned
+        """
+        store: Optional[CompactMemoryStore] = None
+        for rows, capacity in self._scan_pages(
+            page_size=page_size, agent_id=agent_id, max_rows=max_rows
+        ):
+            if store is None:
+                store = CompactMemoryStore(capacity=capacity)
+            store.append(rows)
+        return store or CompactMemoryStore(capacity=1)
+
+    def scan_duplicates(
+        self,
+        *,
+        threshold: float = DEFAULT_THRESHOLD,
+        num_perm: int = DEFAULT_NUM_PERM,
+        keep: str = "newest",
+        page_size: int = 100,
+        agent_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> DuplicateReport:
+        """Page through all memories and cluster near-duplicates.
+
+        Content is MinHashed page by page and not kept; see keyoku.dedup.
+        Requires NumPy (pip install keyoku[numpy]).
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity of duplicates
+            num_perm: MinHash permutations per memory
+            keep: Among equally important duplicates, keep the "newest" or
+                "oldest" one
+            page_size: Memories requested per page
+            agent_id: Filter by agent ID
+            max_rows: Stop after this many rows (default: all)
+
+        Returns:
+            DuplicateReport with the survivor and duplicates of each cluster
+        """
+        index: Optional[NearDuplicateIndex] = None
+        for rows, capacity in self._scan_pages(
+            page_size=page_size, agent_id=agent_id, max_rows=max_rows
+        ):
+            if index is None:
+                index = NearDuplicateIndex(
+                    threshold=threshold, num_perm=num_perm, capacity=capacity
+                )
+            index.append(rows)
+        index = index or NearDuplicateIndex(threshold=threshold, num_perm=num_perm)
+        return index.find(keep=keep)
+
+    def _scan_pages(
+        self,
+        *,
+        page_size: int,
+        agent_id: Optional[str] = None,
+        max_rows: Optional[int] = None,
+    ) -> Iterator[tuple[builtins.list[dict[str, Any]], int]]:
+        """Yield undecoded pages with the expected total row count."""
+        offset = 0
+        capacity = 0
+        while max_rows is None or offset < max_rows:
+            limit = page_size if max_rows is None else min(page_size, max_rows - offset)
+            response = self._list_page(limit=limit, offset=offset, agent_id=agent_id)
+            rows = response["memories"]
+            if not capacity:
+                total = response.get("total") or len(rows)
+                capacity = max(1, total if max_rows is None else min(total, max_rows))
+            yield rows, capacity
+            offset += len(rows)
+            if not rows or not response.get("has_more"):
+                break
+
+    def _list_page(
+        self,
+        *,
+        limit: int,
+        offset: int,
+        agent_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Fetch one undecoded page of memories."""
         params: dict[str, Any] = {"limit": limit, "offset": offset}
         if agent_id:
             params["agent_id"] = agent_id
 
-        response = self._client.request("GET", "/v1/memories", params=params)
-        return ListMemoriesResponse(**response)
+        response: dict[str, Any] = self._client.request("GET", "/v1/memories", params=params)
+        return response
 
     def get(self, memory_id: str) -> Memory:
         """Get a specific memory by ID.
@@ -106,3 +289,30 @@ class MemoriesResource:
             "/v1/memories/batch",
             json={"ids": memory_ids},
         )
+
+
+class AsyncMemoriesResource:
+    """Async resource for memory operations."""
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self._client = client
+
+    async def get(self, memory_id: str) -> Memory:
+        """Get a specific memory by ID.
+
+        Args:
+            memory_id: The memory ID
+
+        Returns:
+            The memory
+        """
+        response = await self._client.request("GET", f"/v1/memories/{memory_id}")
+        return Memory(**response)
+
+    async def delete(self, memory_id: str) -> None:
+        """Delete a specific memory.
+
+        Args:
+            memory_id: The memory ID to delete
+        """
+        await self._client.request("DELETE", f"/v1/memories/{memory_id}")
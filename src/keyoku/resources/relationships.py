@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Literal, Optional, Union, overload
 
+from keyoku._pagination import DEFAULT_PAGE_SIZE, aiter_pages, iter_pages
 from keyoku.models import Relationship
+from keyoku.records import RelationshipRecord
 
 if TYPE_CHECKING:
+    from keyoku.async_client import AsyncKeyoku
     from keyoku.client import Keyoku
 
 
@@ -16,19 +19,41 @@ class RelationshipsResource:
     def __init__(self, client: "Keyoku"):
         self._client = client
 
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        type: Optional[str] = ...,
+        raw: Literal[False] = ...,
+    ) -> list[Relationship]: ...
+
+    @overload
+    def list(
+        self,
+        *,
+        limit: int = ...,
+        offset: int = ...,
+        type: Optional[str] = ...,
+        raw: Literal[True],
+    ) -> list[RelationshipRecord]: ...
+
     def list(
         self,
         *,
         limit: int = 50,
         offset: int = 0,
         type: Optional[str] = None,
-    ) -> list[Relationship]:
+        raw: bool = False,
+    ) -> Union[list[Relationship], list[RelationshipRecord]]:
         """List all relationships.
 
         Args:
             limit: Maximum number of relationships to return
             offset: Number of relationships to skip
             type: Filter by relationship type
+            raw: Return lightweight RelationshipRecord objects without validation
 
         Returns:
             List of relationships
@@ -38,8 +63,33 @@ class RelationshipsResource:
             params["type"] = type
 
         response = self._client.request("GET", "/v1/relationships", params=params)
+        if raw:
+            return [RelationshipRecord(r) for r in response.get("relationships", [])]
         return [Relationship(**r) for r in response.get("relationships", [])]
 
+    def iter_all(
+        self,
+        *,
+        type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> Iterator[Relationship]:
+        """Iterate over every relationship, paginating automatically.
+
+        The next page is fetched in the background while the current one is
+        consumed; iteration ends after the first short page.
+
+        Args:
+            type: Filter by relationship type
+            page_size: Relationships requested per page
+
+        Yields:
+            Relationships in server order
+        """
+        return iter_pages(
+            lambda limit, offset: self.list(limit=limit, offset=offset, type=type),
+            page_size=page_size,
+        )
+
     def get(self, relationship_id: str) -> Relationship:
         """Get a specific relationship by ID.
 
@@ -51,3 +101,66 @@ class RelationshipsResource:
         """
         response = self._client.request("GET", f"/v1/relationships/{relationship_id}")
         return Relationship(**response)
+
+
+class AsyncRelationshipsResource:
+    """Async resource for knowledge graph relationship operations."""
+
+    def __init__(self, client: "AsyncKeyoku"):
+        self._client = client
+
+    async def list(
+        self,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        type: Optional[str] = None,
+    ) -> list[Relationship]:
+        """List all relationships.
+
+        Args:
+            limit: Maximum number of relationships to return
+            offset: Number of relationships to skip
+            type: Filter by relationship type
+
+        Returns:
+            List of relationships
+        """
+        params: dict[str, Any] = {"limit": limit, "offset": offset}
+        if type:
+            params["type"] = type
+
+        response = await self._client.request("GET", "/v1/relationships", params=params)
+        return [Relationship(**r) for r in response.get("relationships", [])]
+
+    def iter_all(
+        self,
+        *,
+        type: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Relationship]:
+        """Iterate over every relationship, paginating automatically.
+
+        Args:
+            type: Filter by relationship type
+            page_size: Relationships requested per page
+
+        Yields:
+            Relationships in server order
+        """
+        return aiter_pages(
+            lambda limit, offset: self.list(limit=limit, offset=offset, type=type),
+            page_size=page_size,
+        )
+
+    async def get(self, relationship_id: str) -> Relationship:
+        """Get a specific relationship by ID.
+
+        Args:
+            relationship_id: The relationship ID
+
+        Returns:
+            The relationship
+        """
+        response = await self._client.request("GET", f"/v1/relationships/{relationship_id}")
+        return Relationship(**response)
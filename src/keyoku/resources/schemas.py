@@ -20,8 +20,10 @@ class SchemasResource:
         Returns:
             List of schemas
         """
-        response = self._client.request("GET", "/v1/schemas")
-        return [Schema(**s) for s in response.get("schemas", [])]
+        return self._client.conditional_get(
+            "/v1/schemas",
+            lambda response: [Schema(**s) for s in response.get("schemas", [])],
+        )
 
     def get(self, schema_id: str) -> Schema:
         """Get a specific schema by ID.
@@ -32,8 +34,9 @@ class SchemasResource:
         Returns:
             The schema
         """
-        response = self._client.request("GET", f"/v1/schemas/{schema_id}")
-        return Schema(**response)
+        return self._client.conditional_get(
+            f"/v1/schemas/{schema_id}", lambda response: Schema(**response)
+        )
 
     def create(
         self,
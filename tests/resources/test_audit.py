@@ -0,0 +1,223 @@
+"""Tests for Audit resource."""
+
+import itertools
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import AsyncKeyoku, Keyoku
+from keyoku.records import parse_datetime
+
+AUDIT_URL = "https://api.keyoku.dev/v1/audit-logs"
+SINCE = "2024-01-01T10:00:00Z"
+
+
+def _log(log_id: str, created_at: str) -> dict:
+    return {
+        "id": log_id,
+        "operation": "memory.create",
+        "resource_type": "memory",
+        "resource_id": f"mem_{log_id}",
+        "created_at": created_at,
+    }
+
+
+class FakeAuditServer:
+    """Serves stored entries at or after start_date, one small page at a time."""
+
+    def __init__(self, logs: list[dict]):
+        self.logs = logs
+        self.start_dates: list[str] = []
+
+    def page(self, request):
+        start = request.url.params["start_date"]
+        offset = int(request.url.params["offset"])
+        self.start_dates.append(start)
+        since = parse_datetime(start)
+        matching = sorted(
+            (log for log in self.logs if parse_datetime(log["created_at"]) >= since),
+            key=lambda log: log["created_at"],
+        )
+        chunk = matching[offset : offset + 2]
+        return Response(
+            200,
+            json={
+                "audit_logs": chunk,
+                "total": len(matching),
+                "has_more": offset + 2 < len(matching),
+            },
+        )
+
+
+class FakeAuditRangeServer:
+    """Serves entries with start_date <= created_at <= end_date, in no particular order."""
+
+    def __init__(self, logs: list[dict]):
+        self.logs = logs
+        self.windows: list[tuple[datetime, datetime]] = []
+
+    def page(self, request):
+        lo = parse_datetime(request.url.params["start_date"])
+        hi = parse_datetime(request.url.params["end_date"])
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        if offset == 0:
+            self.windows.append((lo, hi))
+        matching = [log for log in self.logs if lo <= parse_datetime(log["created_at"]) <= hi]
+        matching.reverse()
+        return Response(
+            200,
+            json={
+                "audit_logs": matching[offset : offset + limit],
+                "total": len(matching),
+                "has_more": offset + limit < len(matching),
+            },
+        )
+
+
+def _backfill_logs() -> list[dict]:
+    """One entry per day plus a dense day 2 with an entry exactly on midnight."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    times = [start + timedelta(days=d, hours=12) for d in range(3)]
+    times += [start + timedelta(days=1, minutes=7 * i) for i in range(150)]
+    return [
+        _log(f"log_{i:03d}", t.isoformat().replace("+00:00", "Z"))
+        for i, t in enumerate(sorted(times))
+    ]
+
+
+class TestAuditBackfill:
+    """Tests for client.audit.backfill()."""
+
+    @respx.mock
+    def test_dense_windows_are_split_and_merged_in_order(self, client: Keyoku):
+        """Test every entry is yielded once, in order, with dense days subdivided."""
+        logs = _backfill_logs()
+        server = FakeAuditRangeServer(logs)
+        respx.get(AUDIT_URL).mock(side_effect=server.page)
+
+        result = list(client.audit.backfill(
+            "2024-01-01T00:00:00Z", "2024-01-04T00:00:00Z", max_window_entries=50
+        ))
+
+        assert [log.id for log in result] == [log["id"] for log in logs]
+        assert min(hi - lo for lo, hi in server.windows) < timedelta(days=1)
+        assert max(hi - lo for lo, hi in server.windows) == timedelta(days=1)
+
+    @respx.mock
+    def test_raw_and_invalid_arguments(self, client: Keyoku):
+        """Test raw yields dicts and bad ranges fail before any request."""
+        server = FakeAuditRangeServer(_backfill_logs()[:3])
+        respx.get(AUDIT_URL).mock(side_effect=server.page)
+
+        rows = list(client.audit.backfill(
+            "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z", window=timedelta(hours=6), raw=True
+        ))
+
+        assert [row["id"] for row in rows] == ["log_000"]
+        assert len(server.windows) == 4
+        with pytest.raises(ValueError):
+            client.audit.backfill("2024-01-02T00:00:00Z", "2024-01-01T00:00:00Z")
+        with pytest.raises(ValueError):
+            client.audit.backfill("2024-01-01T00:00:00Z", window=timedelta(0))
+
+
+class TestAuditFollow:
+    """Tests for client.audit.follow()."""
+
+    @respx.mock
+    def test_overlap_is_deduped_and_idle_polls_back_off(self, client: Keyoku):
+        """Test late writes inside the overlap are delivered once, and idle waits double."""
+        server = FakeAuditServer(
+            [
+                _log("log_early", "2024-01-01T09:59:58Z"),
+                _log("log_1", "2024-01-01T10:00:01Z"),
+                _log("log_2", "2024-01-01T10:00:02Z"),
+                _log("log_3", "2024-01-01T10:00:03Z"),
+            ]
+        )
+        respx.get(AUDIT_URL).mock(side_effect=server.page)
+        delays = []
+
+        def sleep(delay):
+            delays.append(delay)
+            if len(delays) == 1:
+                server.logs.append(_log("log_late", "2024-01-01T10:00:02.500000Z"))
+                server.logs.append(_log("log_4", "2024-01-01T10:00:04Z"))
+            elif len(delays) == 4:
+                server.logs.append(_log("log_5", "2024-01-01T10:00:05Z"))
+
+        client.audit._sleep = sleep
+        stream = client.audit.follow(since=SINCE, poll_interval=1, max_poll_interval=3)
+        seen = [log.id for log in itertools.islice(stream, 6)]
+        stream.close()
+
+        assert seen == ["log_1", "log_2", "log_3", "log_late", "log_4", "log_5"]
+        assert delays == [1, 1, 2, 3]
+        assert server.start_dates[0] == "2024-01-01T09:59:55Z"
+        assert server.start_dates[-1] == "2024-01-01T09:59:59Z"
+
+    @respx.mock
+    def test_checkpoint_resumes_after_restart(self, client: Keyoku, tmp_path):
+        """Test a new stream resumes from the checkpoint instead of replaying."""
+        path = tmp_path / "audit.json"
+        server = FakeAuditServer([_log("log_1", "2024-01-01T10:00:01Z")])
+        respx.get(AUDIT_URL).mock(side_effect=server.page)
+        client.audit._sleep = lambda delay: None
+
+        stream = client.audit.follow(since=SINCE, checkpoint=path)
+        assert next(stream).id == "log_1"
+        stream.close()
+        saved = json.loads(path.read_text())
+        assert saved["id"] == "log_1"
+
+        server.logs.append(_log("log_2", "2024-01-01T10:00:02Z"))
+        resumed = client.audit.follow(since="2020-01-01T00:00:00Z", checkpoint=path)
+        assert next(resumed).id == "log_2"
+        resumed.close()
+        assert not (tmp_path / "audit.json.tmp").exists()
+
+
+@respx.mock
+async def test_async_follow(api_key: str):
+    """Test the async generator pages, dedupes and stops cleanly."""
+    server = FakeAuditServer([_log(f"log_{i}", f"2024-01-01T10:00:0{i}Z") for i in range(1, 4)])
+    respx.get(AUDIT_URL).mock(side_effect=server.page)
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+        server.logs.append(_log("log_4", "2024-01-01T10:00:04Z"))
+
+    async with AsyncKeyoku(api_key=api_key) as client:
+        client.audit._sleep = sleep
+        seen = []
+        async for log in client.audit.follow(since=SINCE, poll_interval=0.5):
+            seen.append(log.id)
+            if len(seen) == 4:
+                break
+
+    assert seen == ["log_1", "log_2", "log_3", "log_4"]
+    assert delays == [0.5]
+
+
+@respx.mock
+async def test_async_backfill(api_key: str):
+    """Test the async backfill matches the sync ordering and splitting."""
+    logs = _backfill_logs()
+    server = FakeAuditRangeServer(logs)
+    respx.get(AUDIT_URL).mock(side_effect=server.page)
+
+    async with AsyncKeyoku(api_key=api_key) as client:
+        seen = [
+            log.id
+            async for log in client.audit.backfill(
+                "2024-01-01T00:00:00Z", "2024-01-04T00:00:00Z", max_window_entries=50
+            )
+        ]
+
+    assert seen == [log["id"] for log in logs]
+    assert min(hi - lo for lo, hi in server.windows) < timedelta(days=1)
@@ -0,0 +1,134 @@
+"""Tests for Cleanup resource."""
+
+import json
+import threading
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+
+SUGGESTIONS_URL = "https://api.keyoku.dev/v1/memories/cleanup-suggestions"
+CLEANUP_URL = "https://api.keyoku.dev/v1/memories/cleanup"
+
+
+class FakeCleanupServer:
+    """In-memory tenant of 1000 memories with a quota of 1000."""
+
+    def __init__(self):
+        ids = [f"mem_{i}" for i in range(1000)]
+        self.stored = set(ids)
+        # stale overlaps never_accessed; oldest covers everything.
+        self.pools = {"stale": ids[:60], "never_accessed": ids[40:100], "oldest": ids}
+        self.executed = []
+        self.lock = threading.Lock()
+
+    def suggestions(self, request):
+        with self.lock:
+            return Response(
+                200,
+                json={
+                    "suggestions": [],
+                    "usage": {
+                        "memories_stored": len(self.stored),
+                        "memories_limit": 1000,
+                        "percentage": len(self.stored) // 10,
+                    },
+                },
+            )
+
+    def cleanup(self, request):
+        body = json.loads(request.content)
+        with self.lock:
+            pool = [i for i in self.pools.get(body["strategy"], []) if i in self.stored]
+            picked = pool[: body["limit"]]
+            if not body["dry_run"]:
+                self.executed.append((body["strategy"], body["limit"]))
+                self.stored.difference_update(picked)
+            return Response(200, json={"deleted_count": len(picked), "deleted_ids": picked})
+
+    def mock(self):
+        respx.get(SUGGESTIONS_URL).mock(side_effect=self.suggestions)
+        respx.post(CLEANUP_URL).mock(side_effect=self.cleanup)
+
+
+class TestReduceTo:
+    """Tests for client.cleanup.reduce_to()."""
+
+    @respx.mock
+    def test_reaches_target_in_chunks(self, client: Keyoku):
+        """Test strategies are planned without overlap and executed in chunks."""
+        server = FakeCleanupServer()
+        server.mock()
+        progress = []
+
+        result = client.cleanup.reduce_to(
+            80,
+            ["stale", "never_accessed", "oldest"],
+            chunk_size=50,
+            progress=lambda done, goal: progress.append((done, goal)),
+        )
+
+        assert [(s.strategy, s.candidates, s.planned) for s in result.plan] == [
+            ("stale", 60, 60),
+            ("never_accessed", 40, 40),
+            ("oldest", 100, 100),
+        ]
+        assert result.reached
+        assert result.final_usage.memories_stored == 800
+        assert result.deleted_count == 200
+        assert max(limit for _, limit in server.executed) <= 50
+        assert max(progress) == (200, 200)
+
+    @respx.mock
+    def test_deleting_invalidates_cached_usage(self, client: Keyoku):
+        """Test cached suggestions and stats are not served after a reduction."""
+        server = FakeCleanupServer()
+        server.mock()
+        stats = respx.get("https://api.keyoku.dev/v1/stats").mock(
+            return_value=Response(200, json={"total_memories": 1000, "by_type": {}})
+        )
+        before = client.cleanup.suggestions(max_age=60)
+        client.stats(max_age=60)
+
+        client.cleanup.reduce_to(90, ["stale", "oldest"])
+
+        assert before.usage.memories_stored == 1000
+        assert client.cleanup.suggestions(max_age=60).usage.memories_stored == 900
+        client.stats(max_age=60)
+        assert stats.call_count == 2
+
+    @respx.mock
+    def test_dry_run_deletes_nothing(self, client: Keyoku):
+        """Test dry_run returns the plan only."""
+        server = FakeCleanupServer()
+        server.mock()
+
+        result = client.cleanup.reduce_to(90, ["stale", "oldest"], dry_run=True)
+
+        assert result.dry_run and not result.reached
+        assert [s.planned for s in result.plan] == [60, 40]
+        assert server.executed == []
+        assert len(server.stored) == 1000
+
+    @respx.mock
+    def test_max_deletions_is_a_hard_cap(self, client: Keyoku):
+        """Test concurrent strategies never delete more than max_deletions."""
+        server = FakeCleanupServer()
+        server.mock()
+
+        result = client.cleanup.reduce_to(
+            50, ["stale", "never_accessed", "oldest"], max_deletions=75, chunk_size=10
+        )
+
+        assert result.deleted_count == 75
+        assert len(server.stored) == 925
+        assert not result.reached
+
+    def test_invalid_arguments(self, client: Keyoku):
+        """Test out-of-range arguments are rejected before any request."""
+        with pytest.raises(ValueError):
+            client.cleanup.reduce_to(150)
+        with pytest.raises(ValueError):
+            client.cleanup.reduce_to(50, chunk_size=5000)
@@ -0,0 +1,632 @@
+"""Tests for Data resource."""
+
+import asyncio
+import gzip
+import hashlib
+import io
+import json
+import threading
+import time
+
+import httpx
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import AsyncKeyoku, Keyoku
+from keyoku.exceptions import IntegrityError, KeyokuError, NotFoundError, ServerError
+from keyoku.models import Entity, Memory, Relationship
+from keyoku.records import EntityRecord, MemoryRecord, RelationshipRecord
+
+DOWNLOAD_URL = "https://api.keyoku.dev/v1/data/export/job_123/download"
+EXPORT_BYTES = b"".join(
+    b'{"record_type": "memory", "id": "mem_%d"}\n' % i for i in range(200)
+)
+
+
+class TestDataResource:
+    """Tests for client.data operations."""
+
+    @respx.mock
+    def test_export(self, client: Keyoku):
+        """Test starting an export job."""
+        respx.get("https://api.keyoku.dev/v1/data/export").mock(
+            return_value=Response(200, json={"job_id": "job_123", "status": "pending"})
+        )
+
+        result = client.data.export()
+
+        assert result.job_id == "job_123"
+
+    @respx.mock
+    def test_download(self, client: Keyoku):
+        """Test downloading an export into memory."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+
+        assert client.data.download("job_123") == EXPORT_BYTES
+
+    @respx.mock
+    def test_iter_download_chunks_and_progress(self, client: Keyoku):
+        """Test streaming download yields bounded chunks and reports progress."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        progress = []
+
+        chunks = list(
+            client.data.iter_download(
+                "job_123", chunk_size=1024, progress=lambda done, total: progress.append(done)
+            )
+        )
+
+        assert b"".join(chunks) == EXPORT_BYTES
+        assert max(len(c) for c in chunks) <= 1024
+        assert progress[-1] == len(EXPORT_BYTES)
+        assert progress == sorted(progress)
+
+    @respx.mock
+    def test_download_to_path(self, client: Keyoku, tmp_path):
+        """Test streaming download to a file path."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+
+        written = client.data.download_to("job_123", path)
+
+        assert written == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+
+    @respx.mock
+    def test_download_to_file_object(self, client: Keyoku):
+        """Test streaming download to a binary file object."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        buffer = io.BytesIO()
+
+        client.data.download_to("job_123", buffer, chunk_size=100)
+
+        assert buffer.getvalue() == EXPORT_BYTES
+
+    @respx.mock
+    def test_iter_download_error(self, client: Keyoku):
+        """Test streaming download raises API errors."""
+        respx.get(DOWNLOAD_URL).mock(
+            return_value=Response(404, json={"error": {"message": "Export not found"}})
+        )
+
+        with pytest.raises(NotFoundError):
+            list(client.data.iter_download("job_123"))
+
+
+class TestAsyncDataResource:
+    """Tests for AsyncKeyoku.data operations."""
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_iter_download(self, api_key: str):
+        """Test async streaming download."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        progress = []
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            chunks = [
+                chunk
+                async for chunk in client.data.iter_download(
+                    "job_123", chunk_size=512, progress=lambda d, t: progress.append((d, t))
+                )
+            ]
+
+        assert b"".join(chunks) == EXPORT_BYTES
+        assert progress[-1] == (len(EXPORT_BYTES), len(EXPORT_BYTES))
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_download_to_path(self, api_key: str, tmp_path):
+        """Test async streaming download to a file path."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            written = await client.data.download_to("job_123", path)
+
+        assert written == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+
+
+RECORDS_BYTES = (
+    b'{"record_type": "memory", "data": {"id": "mem_1", "content": "Likes tea", '
+    b'"type": "preference", "agent_id": "default", "importance": 0.7, '
+    b'"created_at": "2024-01-15T10:30:00Z"}}\n'
+    b'{"record_type": "entity", "data": {"id": "ent_1", "canonical_name": "Alice", '
+    b'"type": "person", "created_at": "2024-01-10T08:00:00Z"}}\n'
+    b'{"record_type": "relationship", "data": {"id": "rel_1", "source_entity_id": "ent_1", '
+    b'"target_entity_id": "ent_2", "relationship_type": "knows", '
+    b'"created_at": "2024-01-12T14:00:00Z"}}\n'
+)
+
+
+class TestExportRecords:
+    """Tests for parsing streamed exports."""
+
+    @respx.mock
+    def test_iter_records(self, client: Keyoku):
+        """Test records are parsed from small chunks."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=RECORDS_BYTES))
+
+        records = list(client.data.iter_records("job_123", chunk_size=16))
+
+        assert [type(r) for r in records] == [Memory, Entity, Relationship]
+        assert records[1].canonical_name == "Alice"
+
+    @respx.mock
+    def test_iter_records_raw(self, client: Keyoku):
+        """Test raw mode yields lightweight records."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=RECORDS_BYTES))
+
+        records = list(client.data.iter_records("job_123", raw=True, prefetch_chunks=0))
+
+        assert [type(r) for r in records] == [MemoryRecord, EntityRecord, RelationshipRecord]
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_iter_records(self, api_key: str):
+        """Test async record parsing."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=RECORDS_BYTES))
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            records = [r async for r in client.data.iter_records("job_123", chunk_size=32)]
+
+        assert [r.id for r in records] == ["mem_1", "ent_1", "rel_1"]
+
+
+class _FlakyStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Response body that drops the connection after some bytes."""
+
+    def __init__(self, data: bytes, fail_after: int):
+        self._data = data
+        self._fail_after = fail_after
+
+    def __iter__(self):
+        yield self._data[: self._fail_after]
+        raise httpx.ReadError("connection reset")
+
+    async def __aiter__(self):
+        yield self._data[: self._fail_after]
+        raise httpx.ReadError("connection reset")
+
+
+def _serve_ranges(data: bytes, *, fail_first_after: int = -1):
+    """Side effect that serves Range requests and can fail the first response."""
+    state = {"calls": 0}
+
+    def handler(request):
+        state["calls"] += 1
+        if state["calls"] == 1 and fail_first_after >= 0:
+            return Response(200, stream=_FlakyStream(data, fail_first_after))
+        header = request.headers.get("Range")
+        if not header:
+            return Response(200, content=data)
+        start_s, _, end_s = header.removeprefix("bytes=").partition("-")
+        start = int(start_s)
+        end = int(end_s) if end_s else len(data) - 1
+        if start >= len(data):
+            return Response(416)
+        return Response(
+            206,
+            content=data[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(data)}"},
+        )
+
+    return handler
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """Retry immediately in tests."""
+    monkeypatch.setattr("keyoku.resources.data.RETRY_BACKOFF", 0.0)
+
+
+class TestResumableDownloads:
+    """Tests for resumable and ranged downloads."""
+
+    @respx.mock
+    def test_reconnects_after_network_error(self, client: Keyoku):
+        """Test a dropped connection resumes from the last received byte."""
+        route = respx.get(DOWNLOAD_URL).mock(
+            side_effect=_serve_ranges(EXPORT_BYTES, fail_first_after=1000)
+        )
+
+        data = b"".join(client.data.iter_download("job_123", chunk_size=100))
+
+        assert data == EXPORT_BYTES
+        assert route.calls[1].request.headers["Range"] == "bytes=1000-"
+
+    @respx.mock
+    def test_gives_up_after_max_retries(self, client: Keyoku):
+        """Test network errors are raised once retries are exhausted."""
+        respx.get(DOWNLOAD_URL).mock(
+            side_effect=lambda request: Response(200, stream=_FlakyStream(EXPORT_BYTES, 10))
+        )
+
+        with pytest.raises(httpx.ReadError):
+            list(client.data.iter_download("job_123", max_retries=2))
+
+    @respx.mock
+    def test_server_ignoring_range_skips_received_bytes(self, client: Keyoku):
+        """Test a 200 reply to a resumed request discards bytes already received."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+
+        data = b"".join(client.data.iter_download("job_123", offset=500))
+
+        assert data == EXPORT_BYTES[500:]
+
+    @respx.mock
+    def test_download_to_resume(self, client: Keyoku, tmp_path):
+        """Test resume continues an existing partial file."""
+        route = respx.get(DOWNLOAD_URL).mock(side_effect=_serve_ranges(EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+        path.write_bytes(EXPORT_BYTES[:3000])
+
+        size = client.data.download_to("job_123", path, resume=True)
+
+        assert size == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+        assert route.calls[0].request.headers["Range"] == "bytes=3000-"
+
+    @respx.mock
+    def test_download_to_resume_complete_file(self, client: Keyoku, tmp_path):
+        """Test resuming a complete file downloads nothing."""
+        respx.get(DOWNLOAD_URL).mock(side_effect=_serve_ranges(EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+        path.write_bytes(EXPORT_BYTES)
+
+        assert client.data.download_to("job_123", path, resume=True) == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+
+    @respx.mock
+    def test_download_parallel(self, client: Keyoku, tmp_path):
+        """Test segmented download assembles the file from ranges."""
+        route = respx.get(DOWNLOAD_URL).mock(side_effect=_serve_ranges(EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+        progress = []
+
+        size = client.data.download_parallel(
+            "job_123", path, segments=3, chunk_size=256, progress=lambda d, t: progress.append(d)
+        )
+
+        assert size == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+        assert route.call_count == 4
+        assert max(progress) == len(EXPORT_BYTES)
+
+    @respx.mock
+    def test_download_parallel_without_range_support(self, client: Keyoku, tmp_path):
+        """Test segmented download falls back to a single stream."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+        path = tmp_path / "export.jsonl"
+
+        assert client.data.download_parallel("job_123", path, chunk_size=256) == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+
+    @respx.mock
+    def test_ranged_requests_ask_for_identity_encoding(self, client: Keyoku, tmp_path):
+        """Test the probe, resumes and segments all request uncompressed bytes."""
+        serve = _serve_ranges(EXPORT_BYTES)
+        route = respx.get(DOWNLOAD_URL).mock(
+            side_effect=lambda request: (
+                serve(request)
+                if request.headers["Accept-Encoding"] == "identity"
+                else Response(500)
+            )
+        )
+        path = tmp_path / "export.jsonl"
+        path.write_bytes(EXPORT_BYTES[:3000])
+
+        assert client.data.download_to("job_123", path, resume=True) == len(EXPORT_BYTES)
+        size = client.data.download_parallel(
+            "job_123", tmp_path / "p.jsonl", segments=3, chunk_size=256
+        )
+        assert size == len(EXPORT_BYTES)
+        assert (tmp_path / "p.jsonl").read_bytes() == EXPORT_BYTES
+        assert route.calls[1].request.headers["Range"] == "bytes=0-0"
+
+    @respx.mock
+    def test_compressed_range_response_is_rejected(self, client: Keyoku, tmp_path):
+        """Test a gzip-encoded 206 is not appended at a compressed offset."""
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(
+            206,
+            content=gzip.compress(EXPORT_BYTES[3000:]),
+            headers={
+                "Content-Encoding": "gzip",
+                "Content-Range": f"bytes 3000-{len(EXPORT_BYTES) - 1}/{len(EXPORT_BYTES)}",
+            },
+        ))
+        path = tmp_path / "export.jsonl"
+        path.write_bytes(EXPORT_BYTES[:3000])
+
+        with pytest.raises(KeyokuError):
+            client.data.download_to("job_123", path, resume=True)
+        assert path.read_bytes() == EXPORT_BYTES[:3000]
+
+    def test_parallel_failure_stops_other_segments(self, client: Keyoku, tmp_path):
+        """Test a failed segment stops the others instead of letting them finish."""
+        finished = []
+
+        def iter_range(job_id, *, start, end, **kwargs):
+            if start == 0:
+                raise ServerError("boom", status_code=500)
+            try:
+                for _ in range(2000):
+                    time.sleep(0.001)
+                    yield b""
+            finally:
+                finished.append(start)
+
+        client.data._probe_size = lambda job_id: len(EXPORT_BYTES)
+        client.data._iter_range = iter_range
+        started = time.monotonic()
+        with pytest.raises(ServerError):
+            client.data.download_parallel(
+                "job_123", tmp_path / "export.jsonl", segments=4, chunk_size=256
+            )
+        assert len(finished) == 3
+        assert time.monotonic() - started < 1.0
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_reconnect_and_parallel(self, api_key: str, tmp_path):
+        """Test async resumable and segmented downloads."""
+        respx.get(DOWNLOAD_URL).mock(
+            side_effect=_serve_ranges(EXPORT_BYTES, fail_first_after=700)
+        )
+        path = tmp_path / "export.jsonl"
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            data = b"".join(
+                [c async for c in client.data.iter_download("job_123", chunk_size=100)]
+            )
+            size = await client.data.download_parallel(
+                "job_123", path, segments=4, chunk_size=256
+            )
+
+        assert data == EXPORT_BYTES
+        assert size == len(EXPORT_BYTES)
+        assert path.read_bytes() == EXPORT_BYTES
+
+    @pytest.mark.asyncio
+    async def test_async_parallel_failure_stops_other_segments(self, api_key: str, tmp_path):
+        """Test a failed segment cancels the others before the file is closed."""
+        stopped = []
+
+        async def probe_size(job_id):
+            return len(EXPORT_BYTES)
+
+        async def iter_range(job_id, *, start, end, **kwargs):
+            if start == 0:
+                raise ServerError("boom", status_code=500)
+            try:
+                while True:
+                    await asyncio.sleep(0)
+                    yield b""
+            finally:
+                stopped.append(start)
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            client.data._probe_size = probe_size
+            client.data._iter_range = iter_range
+            with pytest.raises(ServerError):
+                await client.data.download_parallel(
+                    "job_123", tmp_path / "export.jsonl", segments=4, chunk_size=256
+                )
+            assert len(stopped) == 3
+
+
+def _job(status: str, result: dict = None) -> dict:
+    job = {"id": "job_123", "status": status, "created_at": "2024-01-15T10:30:00Z"}
+    if result is not None:
+        job["result"] = result
+    return job
+
+
+class TestExportTo:
+    """Tests for export_to()."""
+
+    @pytest.fixture(autouse=True)
+    def fast_polling(self, monkeypatch):
+        """Poll jobs without sleeping."""
+        monkeypatch.setattr("keyoku.resources.data.JOB_POLL_INTERVAL", 0.0)
+
+    def _mock_export(self, result: dict) -> None:
+        respx.get("https://api.keyoku.dev/v1/data/export").mock(
+            return_value=Response(200, json={"job_id": "job_123", "status": "pending"})
+        )
+        respx.get("https://api.keyoku.dev/v1/jobs/job_123").mock(
+            side_effect=[
+                Response(200, json=_job("processing")),
+                Response(200, json=_job("completed", result)),
+            ]
+        )
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(200, content=EXPORT_BYTES))
+
+    @respx.mock
+    def test_export_to_path(self, client: Keyoku, tmp_path):
+        """Test export_to starts, waits for and downloads the export."""
+        digest = hashlib.sha256(EXPORT_BYTES).hexdigest()
+        self._mock_export({"size": len(EXPORT_BYTES), "sha256": digest})
+        path = tmp_path / "export.jsonl"
+
+        result = client.data.export_to(path)
+
+        assert path.read_bytes() == EXPORT_BYTES
+        assert result.job_id == "job_123"
+        assert result.bytes_written == len(EXPORT_BYTES)
+        assert result.sha256 == digest
+        assert result.timings.total >= result.timings.download
+
+    @respx.mock
+    def test_export_to_checksum_mismatch(self, client: Keyoku):
+        """Test export_to raises when the checksum does not match."""
+        self._mock_export({"sha256": "0" * 64})
+
+        with pytest.raises(IntegrityError):
+            client.data.export_to(io.BytesIO())
+
+    @respx.mock
+    def test_export_to_size_mismatch(self, client: Keyoku):
+        """Test export_to raises when the size does not match."""
+        self._mock_export({"size": 1})
+
+        with pytest.raises(IntegrityError):
+            client.data.export_to(io.BytesIO())
+
+    @respx.mock
+    def test_export_to_requests_identity_encoding(self, client: Keyoku):
+        """Test the download is requested uncompressed so it can be size-checked."""
+        digest = hashlib.sha256(EXPORT_BYTES).hexdigest()
+        self._mock_export({"size": len(EXPORT_BYTES), "sha256": digest})
+        compressed = gzip.compress(EXPORT_BYTES)
+        route = respx.get(DOWNLOAD_URL).mock(
+            side_effect=lambda request: (
+                Response(200, content=EXPORT_BYTES)
+                if request.headers["Accept-Encoding"] == "identity"
+                else Response(200, content=compressed, headers={"Content-Encoding": "gzip"})
+            )
+        )
+        buffer = io.BytesIO()
+
+        result = client.data.export_to(buffer)
+
+        assert buffer.getvalue() == EXPORT_BYTES
+        assert result.sha256 == digest
+        assert route.calls[0].request.headers["Accept-Encoding"] == "identity"
+
+    @respx.mock
+    def test_export_to_gzip_encoded_anyway(self, client: Keyoku):
+        """Test a compressed body is decoded and not checked against its Content-Length."""
+        digest = hashlib.sha256(EXPORT_BYTES).hexdigest()
+        self._mock_export({"size": len(EXPORT_BYTES), "sha256": digest})
+        respx.get(DOWNLOAD_URL).mock(return_value=Response(
+            200, content=gzip.compress(EXPORT_BYTES), headers={"Content-Encoding": "gzip"}
+        ))
+        buffer = io.BytesIO()
+
+        assert client.data.export_to(buffer).sha256 == digest
+        assert buffer.getvalue() == EXPORT_BYTES
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_async_export_to(self, api_key: str):
+        """Test async export_to."""
+        self._mock_export({})
+        buffer = io.BytesIO()
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            result = await client.data.export_to(buffer)
+
+        assert buffer.getvalue() == EXPORT_BYTES
+        assert result.sha256 == hashlib.sha256(EXPORT_BYTES).hexdigest()
+
+
+BATCH_URL = "https://api.keyoku.dev/v1/memories/batch"
+
+
+def _write_export(path, agents: list) -> None:
+    lines = [b'{"record_type": "schema", "id": "schema_1", "name": "s"}\n']
+    for i, agent in enumerate(agents):
+        record = {"record_type": "memory", "id": f"mem_{i}", "content": f"m{i}", "agent_id": agent}
+        lines.append(json.dumps(record).encode() + b"\n")
+    path.write_bytes(b"".join(lines))
+
+
+class TestImportFrom:
+    """Tests for client.data.import_from()."""
+
+    @respx.mock
+    def test_import_groups_by_agent(self, client: Keyoku, tmp_path):
+        """Test memories are batched per run of agent_id."""
+        source = tmp_path / "export.jsonl"
+        _write_export(source, ["a", "a", "a", "b", "a"])
+        route = respx.post(BATCH_URL).mock(return_value=Response(200, json={"job_id": "job_b"}))
+
+        result = client.data.import_from(source, batch_size=2, concurrency=2)
+
+        bodies = [json.loads(call.request.content) for call in route.calls]
+        batches = sorted(
+            (body["agent_id"], tuple(m["content"] for m in body["memories"])) for body in bodies
+        )
+        assert batches == [
+            ("a", ("m0", "m1")),
+            ("a", ("m2",)),
+            ("a", ("m4",)),
+            ("b", ("m3",)),
+        ]
+        assert result.memories_imported == 5
+        assert result.batches == 4
+        assert result.job_ids == ["job_b"] * 4
+        assert result.lines_read == 6
+
+    @respx.mock
+    def test_import_resumes_from_checkpoint(self, client: Keyoku, tmp_path):
+        """Test an interrupted import resumes after the last completed batch."""
+        source = tmp_path / "export.jsonl"
+        checkpoint = tmp_path / "import.json"
+        _write_export(source, ["a"] * 5)
+        route = respx.post(BATCH_URL).mock(
+            side_effect=[
+                Response(200, json={"job_id": "job_1"}),
+                Response(500, json={"error": "boom"}),
+            ]
+        )
+
+        with pytest.raises(ServerError):
+            client.data.import_from(source, batch_size=2, concurrency=1, checkpoint=checkpoint)
+
+        assert json.loads(checkpoint.read_text())["line"] == 3
+
+        route.side_effect = None
+        route.return_value = Response(200, json={"job_id": "job_2"})
+        result = client.data.import_from(source, batch_size=2, concurrency=1, checkpoint=checkpoint)
+
+        contents = [
+            [m["content"] for m in json.loads(call.request.content)["memories"]]
+            for call in route.calls[2:]
+        ]
+        assert contents == [["m2", "m3"], ["m4"]]
+        assert result.resumed_from_line == 3
+        assert result.memories_imported == 3
+        assert json.loads(checkpoint.read_text())["imported"] == 5
+
+    @respx.mock
+    def test_batches_in_flight_at_failure_are_not_resent(self, client: Keyoku, tmp_path):
+        """Test a batch that finishes after an earlier one fails is skipped on resume."""
+        source = tmp_path / "export.jsonl"
+        checkpoint = tmp_path / "import.json"
+        _write_export(source, ["a"] * 3)
+
+        m1_sent = threading.Event()
+
+        def first_run(request):
+            content = json.loads(request.content)["memories"][0]["content"]
+            if content == "m0":
+                # Fail only once m1 is on the wire, so it is in flight, not queued.
+                m1_sent.wait(5)
+                return Response(500, json={"error": "boom"})
+            m1_sent.set()
+            time.sleep(0.1)
+            return Response(200, json={"job_id": f"job_{content}"})
+
+        route = respx.post(BATCH_URL).mock(side_effect=first_run)
+        with pytest.raises(ServerError):
+            client.data.import_from(source, batch_size=1, concurrency=2, checkpoint=checkpoint)
+
+        saved = json.loads(checkpoint.read_text())
+        assert saved["line"] == 0
+        assert saved["completed"] == [[2, 3]]
+
+        route.side_effect = None
+        route.return_value = Response(200, json={"job_id": "job_2"})
+        result = client.data.import_from(source, batch_size=1, concurrency=2, checkpoint=checkpoint)
+
+        resent = [json.loads(c.request.content)["memories"][0]["content"] for c in route.calls[2:]]
+        assert resent == ["m0", "m2"]
+        assert result.memories_imported == 2
+        assert json.loads(checkpoint.read_text()) | {"source": None} == {
+            "source": None, "line": 4, "imported": 3, "completed": []
+        }
@@ -4,7 +4,7 @@ import pytest
 import respx
 from httpx import Response
 
-from keyoku import Keyoku
+from keyoku import AsyncKeyoku, Keyoku
 from keyoku.models import Entity, Relationship
 
 
@@ -106,3 +106,48 @@ class TestEntitiesResource:
         url = str(route.calls[0].request.url)
         assert "direction=outgoing" in url
         assert "type=knows" in url
+
+
+def _entities_page(request):
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    ids = range(offset, min(offset + limit, 5))
+    return Response(
+        200,
+        json={
+            "entities": [
+                {
+                    "id": f"ent_{i}",
+                    "canonical_name": f"Entity {i}",
+                    "type": "person",
+                    "created_at": "2024-01-10T08:00:00Z",
+                }
+                for i in ids
+            ]
+        },
+    )
+
+
+class TestEntitiesIterAll:
+    """Tests for entities.iter_all()."""
+
+    @respx.mock
+    def test_iter_all_paginates_until_short_page(self, client: Keyoku):
+        """Test iteration walks pages and stops after a short page."""
+        route = respx.get("https://api.keyoku.dev/v1/entities").mock(side_effect=_entities_page)
+
+        entities = list(client.entities.iter_all(type="person", page_size=2))
+
+        assert [e.id for e in entities] == [f"ent_{i}" for i in range(5)]
+        assert route.call_count == 3
+        assert all(call.request.url.params["type"] == "person" for call in route.calls)
+
+    @respx.mock
+    async def test_async_iter_all(self, api_key: str):
+        """Test the async iterator yields every entity."""
+        respx.get("https://api.keyoku.dev/v1/entities").mock(side_effect=_entities_page)
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            ids = [e.id async for e in client.entities.iter_all(page_size=5)]
+
+        assert ids == [f"ent_{i}" for i in range(5)]
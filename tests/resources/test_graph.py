@@ -91,3 +91,128 @@ class TestGraphResource:
         result = client.graph.find_path("ent_a", "ent_b")
 
         assert "John Doe" in repr(result)
+
+
+def _entity(entity_id: str) -> dict:
+    return {
+        "id": entity_id,
+        "canonical_name": entity_id.upper(),
+        "type": "person",
+        "created_at": "2024-01-10T08:00:00Z",
+    }
+
+
+def _rel(rel_id: str, source: str, target: str, type: str = "knows") -> dict:
+    return {
+        "id": rel_id,
+        "source_entity_id": source,
+        "target_entity_id": target,
+        "relationship_type": type,
+        "created_at": "2024-01-12T14:00:00Z",
+    }
+
+
+# a - b - c - d, plus a - e (works_with)
+GRAPH = {
+    "a": [_rel("r_ab", "a", "b"), _rel("r_ae", "a", "e", "works_with")],
+    "b": [_rel("r_ab", "a", "b"), _rel("r_bc", "b", "c")],
+    "c": [_rel("r_bc", "b", "c"), _rel("r_cd", "c", "d")],
+    "d": [_rel("r_cd", "c", "d")],
+    "e": [_rel("r_ae", "a", "e", "works_with")],
+}
+
+
+@pytest.fixture
+def mock_graph():
+    with respx.mock:
+        relationships = respx.get(
+            url__regex=r"https://api.keyoku.dev/v1/entities/(?P<eid>\w+)/relationships"
+        ).mock(
+            side_effect=lambda request, eid: Response(200, json={"relationships": GRAPH[eid]})
+        )
+        entities = respx.get(url__regex=r"https://api.keyoku.dev/v1/entities/(?P<eid>\w+)$").mock(
+            side_effect=lambda request, eid: Response(200, json=_entity(eid))
+        )
+        yield relationships, entities
+
+
+class TestNeighborhood:
+    """Tests for client.graph.neighborhood()."""
+
+    def test_two_hops(self, client: Keyoku, mock_graph):
+        """Test level-by-level expansion with visited nodes deduplicated."""
+        relationships, entities = mock_graph
+
+        result = client.graph.neighborhood(["a"], depth=2)
+
+        assert result.depths == {"a": 0, "b": 1, "e": 1, "c": 2}
+        assert {r.id for r in result.relationships} == {"r_ab", "r_ae", "r_bc"}
+        assert [e.id for e in result.entities] == ["a", "b", "e", "c"]
+        assert relationships.call_count == 3
+        assert entities.call_count == 4
+        assert not result.truncated
+
+    def test_type_filter(self, client: Keyoku, mock_graph):
+        """Test relationship types limit the expansion."""
+        relationships, _ = mock_graph
+
+        result = client.graph.neighborhood(["a"], depth=3, relationship_types=["knows"])
+
+        assert list(result.depths) == ["a", "b", "c", "d"]
+        assert relationships.calls[0].request.url.params["type"] == "knows"
+
+    def test_limits(self, client: Keyoku, mock_graph):
+        """Test max_nodes bounds the fan-out."""
+        result = client.graph.neighborhood(["a"], depth=3, max_nodes=2)
+
+        assert list(result.depths) == ["a", "b"]
+        assert [r.id for r in result.relationships] == ["r_ab"]
+        assert result.truncated
+
+
+class TestFindPaths:
+    """Tests for client.graph.find_paths()."""
+
+    @respx.mock
+    def test_dedupes_and_aligns(self, client: Keyoku):
+        """Test repeated and reversed pairs share one request."""
+
+        def path(request):
+            source, target = request.url.params["from"], request.url.params["to"]
+            if target == "z":
+                return Response(200, json={"path": False})
+            return Response(
+                200,
+                json={
+                    "path": True,
+                    "entities": [_entity(source), _entity(target)],
+                    "relationships": [_rel(f"r_{source}{target}", source, target)],
+                },
+            )
+
+        route = respx.get("https://api.keyoku.dev/v1/graph/path").mock(side_effect=path)
+
+        results = client.graph.find_paths([("a", "b"), ("b", "a"), ("a", "b"), ("a", "z")])
+
+        assert route.call_count == 2
+        assert [e.id for e in results[0].entities] == ["a", "b"]
+        assert [e.id for e in results[1].entities] == ["b", "a"]
+        assert results[3] is None
+
+    @respx.mock
+    def test_memoizes_including_no_path(self, client: Keyoku):
+        """Test cached results, including negative ones, skip the API."""
+        route = respx.get("https://api.keyoku.dev/v1/graph/path").mock(
+            return_value=Response(200, json={"path": False})
+        )
+
+        client.graph.find_paths([("a", "b")], relationship_types=["knows"])
+        results = client.graph.find_paths([("b", "a")], relationship_types=["knows"])
+        client.graph.find_paths([("a", "b")], max_depth=3, relationship_types=["knows"])
+
+        assert results == [None]
+        assert route.call_count == 2
+
+        client.graph.path_cache.clear()
+        client.graph.find_paths([("a", "b")], relationship_types=["knows"])
+        assert route.call_count == 3
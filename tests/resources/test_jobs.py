@@ -57,3 +57,24 @@ class TestJobsResource:
 
         assert result.status == JobStatus.FAILED
         assert result.error == "Processing failed"
+
+    @respx.mock
+    def test_wait_with_backoff(
+        self, client: Keyoku, job_pending_response: dict, job_response: dict, monkeypatch
+    ):
+        """Test JobHandle.wait grows the poll interval up to the maximum."""
+        from keyoku.client import JobHandle
+
+        sleeps = []
+        monkeypatch.setattr("time.sleep", sleeps.append)
+        respx.get("https://api.keyoku.dev/v1/jobs/job_abc123").mock(
+            side_effect=[Response(200, json=job_pending_response)] * 4
+            + [Response(200, json=job_response)]
+        )
+
+        job = JobHandle(client, "job_abc123").wait(
+            poll_interval=1.0, backoff=2.0, max_poll_interval=5.0
+        )
+
+        assert job.status == JobStatus.COMPLETED
+        assert sleeps == [1.0, 2.0, 4.0, 5.0]
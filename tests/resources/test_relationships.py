@@ -4,7 +4,7 @@ import pytest
 import respx
 from httpx import Response
 
-from keyoku import Keyoku
+from keyoku import AsyncKeyoku, Keyoku
 from keyoku.models import Relationship
 
 
@@ -55,3 +55,49 @@ class TestRelationshipsResource:
         assert isinstance(result, Relationship)
         assert result.id == "rel_123456"
         assert result.properties["since"] == "2020"
+
+
+def _relationships_page(request):
+    offset = int(request.url.params["offset"])
+    limit = int(request.url.params["limit"])
+    return Response(
+        200,
+        json={
+            "relationships": [
+                {
+                    "id": f"rel_{i}",
+                    "source_entity_id": "ent_a",
+                    "target_entity_id": "ent_b",
+                    "relationship_type": "knows",
+                    "created_at": "2024-01-12T14:00:00Z",
+                }
+                for i in range(offset, min(offset + limit, 4))
+            ]
+        },
+    )
+
+
+class TestRelationshipsIterAll:
+    """Tests for relationships.iter_all()."""
+
+    @respx.mock
+    def test_iter_all_ends_on_empty_page(self, client: Keyoku):
+        """Test a final full page is followed by one empty lookahead page."""
+        route = respx.get("https://api.keyoku.dev/v1/relationships").mock(
+            side_effect=_relationships_page
+        )
+
+        relationships = list(client.relationships.iter_all(type="knows", page_size=2))
+
+        assert [r.id for r in relationships] == ["rel_0", "rel_1", "rel_2", "rel_3"]
+        assert [call.request.url.params["offset"] for call in route.calls] == ["0", "2", "4"]
+
+    @respx.mock
+    async def test_async_iter_all(self, api_key: str):
+        """Test the async iterator paginates with lookahead."""
+        respx.get("https://api.keyoku.dev/v1/relationships").mock(side_effect=_relationships_page)
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            ids = [r.id async for r in client.relationships.iter_all(page_size=3)]
+
+        assert ids == ["rel_0", "rel_1", "rel_2", "rel_3"]
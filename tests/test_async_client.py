@@ -1,5 +1,7 @@
 """Tests for async Keyoku client."""
 
+import asyncio
+
 import pytest
 import respx
 from httpx import Response
@@ -121,3 +123,60 @@ class TestAsyncKeyoku:
 
         # Client should be closed after context manager exits
         # This is implicitly tested - if close fails, the test would fail
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_federated_search(self, api_key: str, memory_search_response: dict):
+        """Test async federated search fans out per agent and dedupes results."""
+        pytest.importorskip("numpy")
+        route = respx.post("https://api.keyoku.dev/v1/memories/search").mock(
+            return_value=Response(200, json=memory_search_response)
+        )
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            results = await client.federated_search(
+                "preferences", agent_ids=["a1", "a2", "a3"], limit=5
+            )
+
+        assert route.call_count == 3
+        assert [r.id for r in results] == ["mem_abc123", "mem_def456"]
+        assert results[0].score == pytest.approx(3 / 61)
+
+    @pytest.mark.asyncio
+    async def test_federated_search_max_workers(self, api_key: str):
+        """Test async federated search keeps at most max_workers searches in flight."""
+        pytest.importorskip("numpy")
+        in_flight = peak = 0
+
+        async def search(query, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            client._search = search  # type: ignore[method-assign]
+            await client.federated_search(
+                "q", agent_ids=[f"a{i}" for i in range(10)], max_workers=3
+            )
+
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    @respx.mock
+    async def test_stats_conditional_get(self, api_key: str):
+        """Test async stats() serves the cached model on 304."""
+        respx.get("https://api.keyoku.dev/v1/stats").mock(
+            side_effect=[
+                Response(200, json={"total_memories": 3, "by_type": {}}, headers={"ETag": "W/1"}),
+                Response(304),
+            ]
+        )
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            first = await client.stats()
+            second = await client.stats()
+
+        assert second == first and second is not first
@@ -0,0 +1,67 @@
+"""Tests for audit log aggregation."""
+
+from datetime import datetime
+
+import pytest
+
+from keyoku.models import AuditLog
+
+np = pytest.importorskip("numpy")
+
+from keyoku.audit_analytics import count_audit_logs  # noqa: E402
+
+
+def _entry(operation: str, resource_type: str, created_at: str) -> dict:
+    return {
+        "id": f"{operation}-{created_at}",
+        "operation": operation,
+        "resource_type": resource_type,
+        "created_at": created_at,
+    }
+
+
+ENTRIES = [
+    _entry("memory.delete", "memory", "2024-01-01T10:05:00Z"),
+    _entry("entity.create", "entity", "2024-01-01T10:59:59.500000Z"),
+    _entry("memory.delete", "memory", "2024-01-01T10:30:00+00:00"),
+    _entry("memory.create", "memory", "2024-01-01T11:00:00Z"),
+    _entry("memory.delete", "memory", "2024-01-01T12:00:00+01:00"),
+]
+
+
+def test_counts_by_all_fields_across_chunks():
+    """Test groups are counted across chunk boundaries and sorted by name, then hour."""
+    counts = count_audit_logs(ENTRIES, chunk_size=2)
+
+    assert list(counts.operation) == [
+        "entity.create", "memory.create", "memory.delete", "memory.delete"
+    ]
+    assert list(counts.resource_type) == ["entity", "memory", "memory", "memory"]
+    assert counts.hour.dtype == np.dtype("datetime64[h]")
+    assert counts.to_dict()[("memory.delete", "memory", datetime(2024, 1, 1, 10))] == 2
+    assert counts.to_dict()[("memory.delete", "memory", datetime(2024, 1, 1, 11))] == 1
+    assert counts.count.sum() == len(ENTRIES)
+
+
+def test_counts_models_by_subset():
+    """Test AuditLog models and a subset of fields."""
+    logs = [AuditLog(**entry) for entry in ENTRIES]
+    logs.append(AuditLog(**_entry("memory.delete", "memory", "2024-01-02T00:00:00Z")))
+
+    counts = count_audit_logs(logs, by=("hour", "operation"))
+
+    assert counts.resource_type is None
+    assert counts.to_dict() == {
+        (datetime(2024, 1, 1, 10), "entity.create"): 1,
+        (datetime(2024, 1, 1, 10), "memory.delete"): 2,
+        (datetime(2024, 1, 1, 11), "memory.create"): 1,
+        (datetime(2024, 1, 1, 11), "memory.delete"): 1,
+        (datetime(2024, 1, 2, 0), "memory.delete"): 1,
+    }
+
+
+def test_empty_and_invalid():
+    """Test empty input and unknown group fields."""
+    assert len(count_audit_logs([], by=("operation",))) == 0
+    with pytest.raises(ValueError):
+        count_audit_logs(ENTRIES, by=("agent_id",))
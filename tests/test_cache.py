@@ -0,0 +1,112 @@
+"""Tests for in-process caches."""
+
+import asyncio
+import threading
+
+from keyoku._cache import MISSING, AsyncStaleWhileRevalidate, StaleWhileRevalidate, TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_expiry_and_negative_entries(self):
+        """Test None is cached and entries expire after the TTL."""
+        now = [100.0]
+        cache: TTLCache = TTLCache(ttl=10, clock=lambda: now[0])
+
+        cache.set("a", None)
+        assert cache.get("a") is None
+        assert cache.get("b") is MISSING
+
+        now[0] += 10
+        assert cache.get("a") is MISSING
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted when full."""
+        cache: TTLCache = TTLCache(ttl=60, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is MISSING
+        assert (cache.get("a"), cache.get("c")) == (1, 3)
+
+
+class TestStaleWhileRevalidate:
+    """Tests for StaleWhileRevalidate."""
+
+    def test_fresh_stale_and_expired(self):
+        """Test fresh values are reused, stale ones refresh in the background."""
+        now = [100.0]
+        release = threading.Event()
+        calls = []
+
+        def fetch():
+            calls.append(now[0])
+            if len(calls) == 2:
+                release.wait(5)
+            return len(calls)
+
+        cache = StaleWhileRevalidate(fetch, clock=lambda: now[0])
+        assert cache.get(10, 30) == 1
+        now[0] += 5
+        assert cache.get(10, 30) == 1
+        assert len(calls) == 1
+
+        # Stale: every caller gets the old value while one refresh runs.
+        now[0] += 10
+        assert [cache.get(10, 30) for _ in range(3)] == [1, 1, 1]
+        release.set()
+        for _ in range(100):
+            if cache.get(10, 30) == 2:
+                break
+            threading.Event().wait(0.01)
+        assert len(calls) == 2
+
+        # Past the stale window the caller waits for a fresh value.
+        now[0] += 100
+        assert cache.get(10, 30) == 3
+
+    def test_background_error_keeps_value(self):
+        """Test a failed refresh is recorded and the cached value kept."""
+        now = [0.0]
+        results = iter([1])
+
+        def fetch():
+            for value in results:
+                return value
+            raise RuntimeError("boom")
+
+        cache = StaleWhileRevalidate(fetch, clock=lambda: now[0])
+        assert cache.get(1, 60) == 1
+        now[0] = 5
+        assert cache.get(1, 60) == 1
+        for _ in range(100):
+            if cache.last_error is not None:
+                break
+            threading.Event().wait(0.01)
+        assert isinstance(cache.last_error, RuntimeError)
+        assert cache.get(1, 60) == 1
+
+
+class TestAsyncStaleWhileRevalidate:
+    """Tests for AsyncStaleWhileRevalidate."""
+
+    async def test_single_refresh_task(self):
+        """Test concurrent stale reads share one background refresh."""
+        now = [0.0]
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return len(calls)
+
+        cache = AsyncStaleWhileRevalidate(fetch, clock=lambda: now[0])
+        assert await cache.get(10, 30) == 1
+        now[0] = 15
+        assert await asyncio.gather(*(cache.get(10, 30) for _ in range(5))) == [1] * 5
+        await asyncio.sleep(0.01)
+        assert len(calls) == 2
+        assert await cache.get(10, 30) == 2
@@ -1,11 +1,14 @@
 """Tests for the Keyoku client."""
 
+import json
+
 import pytest
 import respx
 from httpx import Response
 
 from keyoku import Keyoku
 from keyoku.exceptions import AuthenticationError, NotFoundError, ValidationError
+from keyoku.ranking import Reranker
 
 
 @respx.mock
@@ -170,3 +173,167 @@ def test_entities_search():
 
     assert len(entities) == 1
     assert entities[0].name == "John"
+
+
+@respx.mock
+def test_federated_search():
+    """Test federated search fans out per agent and tenant and fuses results."""
+    pytest.importorskip("numpy")
+
+    def search_side_effect(request):
+        body = json.loads(request.content)
+        agent = body.get("agent_id")
+        tenant = request.headers.get("X-Entity-ID")
+        memories = [
+            {
+                "id": f"mem_{agent}",
+                "content": f"Memory from {agent}",
+                "type": "fact",
+                "agent_id": agent,
+                "importance": 0.5,
+                "score": 0.9,
+                "created_at": "2024-01-01T00:00:00Z",
+            },
+            {
+                "id": "mem_shared",
+                "content": f"Shared memory in {tenant}",
+                "type": "fact",
+                "agent_id": agent,
+                "importance": 0.5,
+                "score": 0.8,
+                "created_at": "2024-01-01T00:00:00Z",
+            },
+        ]
+        return Response(200, json={"memories": memories, "query_time_ms": 5})
+
+    route = respx.post("https://api.keyoku.dev/v1/memories/search").mock(
+        side_effect=search_side_effect
+    )
+
+    client = Keyoku(api_key="test-key")
+    results = client.federated_search(
+        "preferences",
+        agent_ids=["a1", "a2"],
+        entity_ids=["t1", "t2"],
+        limit=3,
+    )
+
+    assert route.call_count == 4
+    tenants = sorted(call.request.headers["X-Entity-ID"] for call in route.calls)
+    assert tenants == ["t1", "t1", "t2", "t2"]
+    assert len(results) == 3
+    assert results[0].id == "mem_shared"
+    assert len({r.id for r in results}) == 3
+
+
+@respx.mock
+def test_search_with_rerank_overfetches():
+    """Test search over-fetches and keeps the top results after reranking."""
+    pytest.importorskip("numpy")
+    memories = [
+        {
+            "id": f"mem_{i}",
+            "content": f"Memory {i}",
+            "type": "fact",
+            "agent_id": "default",
+            "importance": i / 10,
+            "score": 0.5,
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+        for i in range(6)
+    ]
+    route = respx.post("https://api.keyoku.dev/v1/memories/search").mock(
+        return_value=Response(200, json={"memories": memories, "query_time_ms": 5})
+    )
+
+    client = Keyoku(api_key="test-key")
+    results = client.search(
+        "facts", limit=2, rerank=Reranker(importance_weight=1.0, overfetch=3)
+    )
+
+    assert json.loads(route.calls[0].request.content)["limit"] == 6
+    assert [r.id for r in results] == ["mem_5", "mem_4"]
+
+
+@respx.mock
+def test_stats_conditional_get():
+    """Test stats() revalidates with If-None-Match and reuses the body on 304."""
+    route = respx.get("https://api.keyoku.dev/v1/stats").mock(
+        side_effect=[
+            Response(200, json={"total_memories": 5, "by_type": {}}, headers={"ETag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    client = Keyoku(api_key="test-key")
+    first = client.stats()
+    second = client.stats()
+
+    assert "If-None-Match" not in route.calls[0].request.headers
+    assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert second == first and second is not first
+    assert second.total_memories == 5
+
+
+@respx.mock
+def test_stats_max_age_serves_cached():
+    """Test stats(max_age=...) answers from the cache while fresh."""
+    route = respx.get("https://api.keyoku.dev/v1/stats").mock(
+        return_value=Response(200, json={"total_memories": 5, "by_type": {}})
+    )
+    suggestions = respx.get("https://api.keyoku.dev/v1/memories/cleanup-suggestions").mock(
+        return_value=Response(
+            200,
+            json={
+                "suggestions": [],
+                "usage": {"memories_stored": 80, "memories_limit": 100, "percentage": 80},
+            },
+        )
+    )
+
+    client = Keyoku(api_key="test-key")
+    first = client.stats(max_age=30)
+    assert client.stats(max_age=30) is first
+    client.stats()
+    assert client.cleanup.suggestions(max_age=30) is client.cleanup.suggestions(max_age=30)
+
+    assert route.call_count == 2
+    assert suggestions.call_count == 1
+
+
+@respx.mock
+def test_conditional_get_last_modified():
+    """Test Last-Modified validators and refreshed bodies replace the cache."""
+    route = respx.get("https://api.keyoku.dev/v1/schemas").mock(
+        side_effect=[
+            Response(200, json={"schemas": []}, headers={"Last-Modified": "Mon, 01 Jan 2024"}),
+            Response(200, json={"schemas": []}),
+            Response(200, json={"schemas": []}),
+        ]
+    )
+
+    client = Keyoku(api_key="test-key")
+    client.schemas.list()
+    client.schemas.list()
+    client.schemas.list()
+
+    assert route.calls[1].request.headers["If-Modified-Since"] == "Mon, 01 Jan 2024"
+    assert "If-Modified-Since" not in route.calls[2].request.headers
+
+
+@respx.mock
+def test_conditional_get_returns_copies():
+    """Test mutating a returned value does not change what a 304 returns."""
+    respx.get("https://api.keyoku.dev/v1/schemas").mock(
+        side_effect=[
+            Response(200, json={"schemas": []}, headers={"ETag": '"s1"'}),
+            Response(304),
+            Response(304),
+        ]
+    )
+
+    client = Keyoku(api_key="test-key")
+    client.schemas.list().append("mutated")
+    client.schemas.list().append("mutated")
+
+    assert client.schemas.list() == []
@@ -0,0 +1,125 @@
+"""Tests for columnar memory results."""
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+
+np = pytest.importorskip("numpy")
+
+from keyoku.columnar import GrowableArray, MemoryColumnBuilder, MemoryColumns  # noqa: E402
+
+
+def _row(i: int, **overrides: object) -> dict:
+    row = {
+        "id": f"mem_{i}",
+        "content": f"Memory {i}",
+        "type": "fact",
+        "agent_id": "default",
+        "importance": i / 10,
+        "created_at": "2024-01-15T10:30:00Z",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestGrowableArray:
+    """Tests for GrowableArray."""
+
+    def test_grows_past_capacity(self):
+        """Test appending beyond the initial capacity."""
+        buffer = GrowableArray(np.int64, capacity=2)
+
+        buffer.extend([1, 2])
+        buffer.extend([3, 4, 5])
+
+        assert len(buffer) == 5
+        assert buffer.view().tolist() == [1, 2, 3, 4, 5]
+
+
+class TestMemoryColumns:
+    """Tests for MemoryColumns and MemoryColumnBuilder."""
+
+    def test_from_rows(self):
+        """Test building columns from search rows."""
+        rows = [_row(1, score=0.9), _row(2, score=0.8, created_at="2024-01-15T12:30:00+02:00")]
+
+        columns = MemoryColumns.from_rows(rows)
+
+        assert len(columns) == 2
+        assert columns.id.tolist() == ["mem_1", "mem_2"]
+        assert columns.score.dtype == np.float64
+        assert columns.score.tolist() == [0.9, 0.8]
+        assert columns.created_at[1] == np.datetime64("2024-01-15T10:30:00")
+
+    def test_score_missing_is_nan(self):
+        """Test listing rows without score yield NaN scores."""
+        columns = MemoryColumns.from_rows([_row(1)])
+
+        assert np.isnan(columns.score[0])
+
+    def test_builder_appends_pages(self):
+        """Test builder accumulates several pages."""
+        builder = MemoryColumnBuilder(capacity=1)
+        builder.append([_row(1), _row(2)])
+        builder.append([_row(3)])
+
+        columns = builder.build()
+
+        assert columns.importance.tolist() == [0.1, 0.2, 0.3]
+
+    def test_to_arrow(self):
+        """Test converting columns to a pyarrow table."""
+        pytest.importorskip("pyarrow")
+        table = MemoryColumns.from_rows([_row(1, score=0.5)]).to_arrow()
+
+        assert table.num_rows == 1
+        assert table.column_names == [
+            "id", "content", "type", "agent_id", "importance", "score", "created_at"
+        ]
+
+
+class TestColumnarCalls:
+    """Tests for columnar client and resource methods."""
+
+    @respx.mock
+    def test_search_columns(self, client: Keyoku, memory_search_response: dict):
+        """Test search_columns returns columns."""
+        respx.post("https://api.keyoku.dev/v1/memories/search").mock(
+            return_value=Response(200, json=memory_search_response)
+        )
+
+        columns = client.search_columns("preferences")
+
+        assert columns.score.tolist() == [0.95, 0.82]
+
+    @respx.mock
+    def test_scan_columns_paginates(self, client: Keyoku):
+        """Test scan_columns walks every page."""
+        route = respx.get("https://api.keyoku.dev/v1/memories").mock(
+            side_effect=[
+                Response(200, json={"memories": [_row(0), _row(1)], "total": 3, "has_more": True}),
+                Response(200, json={"memories": [_row(2)], "total": 3, "has_more": False}),
+            ]
+        )
+
+        columns = client.memories.scan_columns(page_size=2)
+
+        assert route.call_count == 2
+        assert "offset=2" in str(route.calls[1].request.url)
+        assert columns.id.tolist() == ["mem_0", "mem_1", "mem_2"]
+
+    @respx.mock
+    def test_scan_columns_max_rows(self, client: Keyoku):
+        """Test scan_columns stops at max_rows."""
+        route = respx.get("https://api.keyoku.dev/v1/memories").mock(
+            return_value=Response(
+                200, json={"memories": [_row(0), _row(1)], "total": 10, "has_more": True}
+            )
+        )
+
+        columns = client.memories.scan_columns(page_size=2, max_rows=2)
+
+        assert route.call_count == 1
+        assert len(columns) == 2
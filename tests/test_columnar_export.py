@@ -0,0 +1,124 @@
+"""Tests for columnar export files."""
+
+import json
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from keyoku.columnar_export import ColumnarExportWriter, write_columnar  # noqa: E402
+
+
+def _memory(i: int) -> dict:
+    return {
+        "record_type": "memory",
+        "data": {
+            "id": f"mem_{i}",
+            "content": f"Memory {i}",
+            "type": "fact",
+            "agent_id": "default",
+            "importance": 0.5,
+            "created_at": "2024-01-15T10:30:00Z",
+        },
+    }
+
+
+ENTITY = {
+    "record_type": "entity",
+    "data": {
+        "id": "ent_1",
+        "canonical_name": "Alice",
+        "type": "person",
+        "properties": {"role": "admin"},
+        "created_at": "2024-01-10T08:00:00Z",
+    },
+}
+
+
+class TestColumnarExportWriter:
+    """Tests for ColumnarExportWriter."""
+
+    def test_parquet_row_groups(self, tmp_path):
+        """Test rows are split by kind and written in row groups."""
+        objects = [_memory(i) for i in range(5)] + [ENTITY]
+
+        counts = write_columnar(objects, tmp_path, row_group_size=2)
+
+        assert counts == {"memory": 5, "entity": 1}
+        memories = pq.ParquetFile(tmp_path / "memory.parquet")
+        assert memories.metadata.num_rows == 5
+        assert memories.metadata.num_row_groups == 3
+        table = memories.read()
+        assert table.column("id").to_pylist() == [f"mem_{i}" for i in range(5)]
+        assert pa.types.is_timestamp(table.schema.field("created_at").type)
+
+        entities = pq.read_table(tmp_path / "entity.parquet")
+        assert json.loads(entities.column("properties")[0].as_py()) == {"role": "admin"}
+        assert entities.column("updated_at")[0].as_py() is None
+
+    def test_arrow_ipc(self, tmp_path):
+        """Test writing Arrow IPC files."""
+        write_columnar([_memory(i) for i in range(3)], tmp_path, format="arrow")
+
+        with pa.ipc.open_file(tmp_path / "memory.arrow") as reader:
+            assert reader.read_all().num_rows == 3
+
+    def test_unknown_kind_inferred(self, tmp_path):
+        """Test kinds without a known layout get an inferred schema."""
+        with ColumnarExportWriter(tmp_path) as writer:
+            writer.write("session", {"id": "s1", "turns": 3, "meta": {"a": 1}})
+            writer.write("session", {"id": "s2", "turns": 5})
+
+        table = pq.read_table(writer.path("session"))
+        assert table.column("turns").to_pylist() == [3.0, 5.0]
+        assert table.column("meta").to_pylist() == ['{"a": 1}', None]
+
+    def test_inferred_schema_conflict(self, tmp_path):
+        """Test later rows that do not fit an inferred layout are rejected."""
+        writer = ColumnarExportWriter(tmp_path, row_group_size=1)
+        writer.write("session", {"n": 1})
+        with pytest.raises(ValueError, match="numeric"):
+            writer.write("session", {"n": "abc"})
+        writer.write("other", {"n": 1})
+        with pytest.raises(ValueError, match="extra"):
+            writer.write("other", {"n": 2, "extra": "x"})
+
+    def test_kind_cannot_escape_directory(self, tmp_path):
+        """Test record kinds are sanitized into file names inside the directory."""
+        writer = ColumnarExportWriter(tmp_path / "out")
+        assert writer.path("../x") == str(tmp_path / "out" / "___x.parquet")
+
+    def test_colliding_kinds_get_distinct_files(self, tmp_path):
+        """Test kinds that sanitize to the same file name do not overwrite each other."""
+        with ColumnarExportWriter(tmp_path) as writer:
+            writer.write("audit.log", {"id": "a1"})
+            writer.write("audit_log", {"id": "b1"})
+            writer.write("audit_log", {"id": "b2"})
+            writer.write("Audit_Log", {"id": "c1"})
+
+        assert pq.read_table(tmp_path / "audit_log.parquet").num_rows == 1
+        assert pq.read_table(tmp_path / "audit_log-2.parquet").num_rows == 2
+        assert pq.read_table(tmp_path / "Audit_Log-3.parquet").num_rows == 1
+
+    def test_invalid_format(self, tmp_path):
+        """Test unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            ColumnarExportWriter(tmp_path, format="csv")
+
+    @respx.mock
+    def test_download_columnar(self, client: Keyoku, tmp_path):
+        """Test streaming an export download into Parquet files."""
+        body = "".join(json.dumps(o) + "\n" for o in [_memory(1), ENTITY, _memory(2)])
+        respx.get("https://api.keyoku.dev/v1/data/export/job_123/download").mock(
+            return_value=Response(200, content=body.encode())
+        )
+
+        counts = client.data.download_columnar("job_123", tmp_path, chunk_size=64)
+
+        assert counts == {"memory": 2, "entity": 1}
+        assert pq.read_table(tmp_path / "memory.parquet").num_rows == 2
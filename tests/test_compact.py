@@ -0,0 +1,94 @@
+"""Tests for compact memory scan storage."""
+
+from datetime import datetime, timezone
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+from keyoku.models import Memory
+
+np = pytest.importorskip("numpy")
+
+from keyoku.compact import CompactMemoryStore, StringPool  # noqa: E402
+
+
+def _row(i: int, **overrides: object) -> dict:
+    row = {
+        "id": f"mem_{i}",
+        "content": f"Memory {i} — ünïcode",
+        "type": "fact" if i % 2 else "preference",
+        "agent_id": "default",
+        "importance": i / 10,
+        "created_at": "2024-01-15T10:30:00.123456Z",
+    }
+    row.update(overrides)
+    return row
+
+
+class TestStringPool:
+    """Tests for StringPool."""
+
+    def test_encode_reuses_codes(self):
+        """Test repeated values share one code across batches."""
+        pool = StringPool()
+
+        first = pool.encode(["b", "a", "b"])
+        second = pool.encode(["a", "c"])
+
+        assert first.dtype == np.int32
+        assert [pool.values[c] for c in first] == ["b", "a", "b"]
+        assert [pool.values[c] for c in second] == ["a", "c"]
+        assert len(pool) == 3
+        assert pool.code("missing") == -1
+
+
+class TestCompactMemoryStore:
+    """Tests for CompactMemoryStore."""
+
+    def test_round_trip(self):
+        """Test stored rows materialize back into equal Memory models."""
+        rows = [_row(i) for i in range(5)]
+        store = CompactMemoryStore(capacity=2)
+        store.append(rows[:3])
+        store.append(rows[3:])
+
+        assert len(store) == 5
+        assert store[4] == Memory(**rows[4])
+        assert store[-1].id == "mem_4"
+        assert [m.id for m in store] == [r["id"] for r in rows]
+
+    def test_columns(self):
+        """Test interned codes and int64 timestamps."""
+        store = CompactMemoryStore()
+        store.append([_row(i) for i in range(4)])
+
+        types = [store.types.values[c] for c in store.type_codes]
+        assert types == ["preference", "fact", "preference", "fact"]
+        assert sorted(store.types.values) == ["fact", "preference"]
+        assert store.agent_ids.values == ["default"]
+        expected = datetime(2024, 1, 15, 10, 30, 0, 123456, tzinfo=timezone.utc)
+        assert store.created_at[0] == int(expected.timestamp()) * 1_000_000 + 123456
+        assert store.content(1) == "Memory 1 — ünïcode"
+        assert store.nbytes > 0
+
+    def test_index_error(self):
+        """Test out of range access raises IndexError."""
+        with pytest.raises(IndexError):
+            CompactMemoryStore()[0]
+
+    @respx.mock
+    def test_scan_compact(self, client: Keyoku):
+        """Test scan_compact pages through all memories."""
+        respx.get("https://api.keyoku.dev/v1/memories").mock(
+            side_effect=[
+                Response(200, json={"memories": [_row(0), _row(1)], "total": 3, "has_more": True}),
+                Response(200, json={"memories": [_row(2)], "total": 3, "has_more": False}),
+            ]
+        )
+
+        store = client.memories.scan_compact(page_size=2)
+
+        assert len(store) == 3
+        assert store.id(2) == "mem_2"
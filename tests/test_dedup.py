@@ -0,0 +1,149 @@
+"""Tests for near-duplicate detection."""
+
+import json
+import random
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+
+pytest.importorskip("numpy")
+
+from keyoku import dedup  # noqa: E402
+from keyoku.dedup import NearDuplicateIndex, delete_duplicates, lsh_params  # noqa: E402
+
+WORDS = [f"word{i}" for i in range(5000)]
+
+
+def _text(seed: int, length: int = 60) -> str:
+    rng = random.Random(seed)
+    return " ".join(rng.choice(WORDS) for _ in range(length))
+
+
+def _reword(text: str) -> str:
+    words = text.split()
+    words[len(words) // 2] = "changed"
+    return " ".join(words).upper()
+
+
+def _row(memory_id: str, content: str, importance: float = 0.5, day: int = 1) -> dict:
+    return {
+        "id": memory_id,
+        "content": content,
+        "type": "fact",
+        "agent_id": "default",
+        "importance": importance,
+        "created_at": f"2024-01-{day:02d}T10:00:00Z",
+    }
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "scipy":
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(dedup, "optional_scipy_sparse", lambda: None)
+    return request.param
+
+
+class TestNearDuplicateIndex:
+    """Tests for NearDuplicateIndex."""
+
+    def test_clusters_and_survivors(self, backend):
+        """Test reworded copies cluster and the most important, newest one survives."""
+        base = _text(1)
+        index = NearDuplicateIndex(threshold=0.8, capacity=1)
+        index.append([_row("a", base, 0.5, day=1), _row("b", _reword(base), 0.9, day=2)])
+        index.append([_row("c", base, 0.9, day=3), _row("d", _text(2)), _row("e", "")])
+        index.append([_row("f", "", day=4)] + [_row(f"x{i}", _text(100 + i)) for i in range(50)])
+
+        report = index.find()
+
+        assert len(report.clusters) == 1
+        cluster = report.clusters[0]
+        assert cluster.keep_id == "c"
+        assert sorted(cluster.duplicate_ids) == ["a", "b"]
+        assert report.scanned == 56
+        assert index.find(keep="oldest").clusters[0].keep_id == "b"
+
+    def test_chain_only_deletes_what_is_close_to_the_survivor(self, backend):
+        """Test a chain of rewordings does not delete memories far from the survivor."""
+        chain = [_text(6, length=100).split()]
+        for step in range(1, 15):
+            reworded = list(chain[-1])
+            reworded[step * 6] = f"changed{step}"
+            chain.append(reworded)
+
+        def shingles(text_words):
+            return {tuple(text_words[i : i + 3]) for i in range(len(text_words) - 2)}
+
+        def jaccard(a, b):
+            return len(shingles(a) & shingles(b)) / len(shingles(a) | shingles(b))
+
+        index = NearDuplicateIndex(threshold=0.8)
+        index.append([_row(f"m{i}", " ".join(w), day=i + 1) for i, w in enumerate(chain)])
+        report = index.find()
+
+        assert jaccard(chain[0], chain[14]) < 0.5
+        by_id = {f"m{i}": w for i, w in enumerate(chain)}
+        assert report.clusters[0].keep_id == "m14"
+        assert "m13" in report.clusters[0].duplicate_ids
+        assert "m0" not in report.clusters[0].duplicate_ids
+        for cluster in report.clusters:
+            for duplicate in cluster.duplicate_ids:
+                assert jaccard(by_id[cluster.keep_id], by_id[duplicate]) > 0.65
+        assert len(report.duplicate_ids) < 14
+
+    def test_threshold_filters_weak_matches(self):
+        """Test pairs below the threshold are not clustered."""
+        base = _text(3, length=20)
+        half = " ".join(base.split()[:10] + _text(4, length=10).split())
+        index = NearDuplicateIndex(threshold=0.9)
+        index.append([_row("a", base), _row("b", half)])
+
+        assert index.find().clusters == []
+
+    def test_lsh_params(self):
+        """Test band/row selection keeps high recall at the threshold."""
+        bands, rows = lsh_params(0.8, 128)
+        assert bands * rows == 128
+        assert 1 - (1 - 0.8**rows) ** bands >= 0.99
+        with pytest.raises(ValueError):
+            NearDuplicateIndex(num_perm=128, bands=3)
+
+
+@respx.mock
+def test_scan_and_delete_duplicates(client: Keyoku):
+    """Test scanning pages and deleting the duplicates in chunks."""
+    base = _text(5)
+    rows = [_row(f"m{i}", base, importance=i / 10) for i in range(5)]
+    rows += [_row(f"u{i}", _text(200 + i)) for i in range(5)]
+
+    def page(request):
+        offset = int(request.url.params["offset"])
+        limit = int(request.url.params["limit"])
+        chunk = rows[offset : offset + limit]
+        return Response(
+            200,
+            json={"memories": chunk, "total": len(rows), "has_more": offset + limit < len(rows)},
+        )
+
+    respx.get("https://api.keyoku.dev/v1/memories").mock(side_effect=page)
+    deletes = respx.delete("https://api.keyoku.dev/v1/memories/batch").mock(
+        return_value=Response(200, json={})
+    )
+    progress = []
+
+    report = client.memories.scan_duplicates(page_size=3)
+    deleted = delete_duplicates(
+        client, report, chunk_size=3, progress=lambda done, total: progress.append(done)
+    )
+
+    assert [c.keep_id for c in report.clusters] == ["m4"]
+    assert deleted == 4
+    assert deletes.call_count == 2
+    sent = sorted(i for call in deletes.calls for i in json.loads(call.request.content)["ids"])
+    assert sent == ["m0", "m1", "m2", "m3"]
+    assert max(progress) == 4
@@ -0,0 +1,71 @@
+"""Tests for entity name resolution."""
+
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+from keyoku.entity_resolver import EntityResolver
+from keyoku.models import Entity
+
+SEARCH_URL = "https://api.keyoku.dev/v1/entities/search"
+
+
+def _entity(entity_id: str, name: str, type: str = "person") -> Entity:
+    return Entity(id=entity_id, canonical_name=name, type=type, created_at="2024-01-10T08:00:00Z")
+
+
+def _search(request) -> Response:
+    query = request.url.params["query"]
+    hits = {
+        "bob": [{"id": "ent_bob", "canonical_name": "Bob", "type": "person",
+                 "created_at": "2024-01-10T08:00:00Z"}],
+    }
+    return Response(200, json={"entities": hits.get(query, [])})
+
+
+class TestEntityResolver:
+    """Tests for EntityResolver."""
+
+    def test_lookup_and_complete(self, client: Keyoku):
+        """Test case-folded exact lookups and prefix completion."""
+        resolver = EntityResolver(client)
+        resolver.add(
+            [
+                _entity("ent_1", "Alice Smith"),
+                _entity("ent_2", "Alice"),
+                _entity("ent_3", "Acme Corp", type="company"),
+            ]
+        )
+
+        assert [e.id for e in resolver.lookup("  alice   SMITH ")] == ["ent_1"]
+        assert [e.id for e in resolver.complete("ali")] == ["ent_2", "ent_1"]
+        assert [e.id for e in resolver.complete("a", type="company")] == ["ent_3"]
+        assert resolver.complete("zed") == []
+
+    def test_rename_reindexes(self, client: Keyoku):
+        """Test re-adding an entity under a new name drops the old key."""
+        resolver = EntityResolver(client)
+        resolver.add([_entity("ent_1", "Old Name")])
+        resolver.add([_entity("ent_1", "New Name")])
+
+        assert resolver.lookup("old name") == []
+        assert [e.id for e in resolver.complete("new")] == ["ent_1"]
+        assert len(resolver) == 1
+
+    @respx.mock
+    def test_resolve_falls_back_to_search(self, client: Keyoku):
+        """Test local hits skip the API and misses are searched once each."""
+        route = respx.get(SEARCH_URL).mock(side_effect=_search)
+        resolver = EntityResolver(client)
+        resolver.add([_entity("ent_1", "Alice")])
+
+        results = resolver.resolve(["ALICE", "Bob", "bob", "Nobody"])
+
+        assert [e.id if e else None for e in results] == ["ent_1", "ent_bob", "ent_bob", None]
+        assert sorted(call.request.url.params["query"] for call in route.calls) == [
+            "bob",
+            "nobody",
+        ]
+
+        assert resolver.resolve_one("bob").id == "ent_bob"
+        assert route.call_count == 2
@@ -0,0 +1,134 @@
+"""Tests for incremental export parsing."""
+
+import json
+
+import pytest
+
+from keyoku.export import (
+    ExportRecord,
+    JSONLDecoder,
+    aprefetch,
+    parse_record,
+    prefetch,
+)
+from keyoku.models import Entity, Memory
+from keyoku.records import MemoryRecord
+
+MEMORY = {
+    "id": "mem_1",
+    "content": "User likes tea",
+    "type": "preference",
+    "agent_id": "default",
+    "importance": 0.7,
+    "created_at": "2024-01-15T10:30:00Z",
+}
+ENTITY = {
+    "id": "ent_1",
+    "canonical_name": "Alice",
+    "type": "person",
+    "created_at": "2024-01-10T08:00:00Z",
+}
+
+
+class TestJSONLDecoder:
+    """Tests for JSONLDecoder."""
+
+    def test_lines_split_across_chunks(self):
+        """Test objects split over chunk boundaries are reassembled."""
+        payload = b"".join(json.dumps({"n": i}).encode() + b"\n" for i in range(50))
+        decoder = JSONLDecoder()
+
+        objects = []
+        for start in range(0, len(payload), 7):
+            objects.extend(decoder.feed(payload[start : start + 7]))
+        objects.extend(decoder.close())
+
+        assert [o["n"] for o in objects] == list(range(50))
+
+    def test_final_line_without_newline(self):
+        """Test a trailing line without newline is returned by close()."""
+        decoder = JSONLDecoder()
+
+        assert decoder.feed(b'{"a": 1}\n{"b"') == [{"a": 1}]
+        assert decoder.feed(b": 2}") == []
+        assert decoder.close() == [{"b": 2}]
+
+    def test_blank_lines_skipped(self):
+        """Test blank lines are ignored."""
+        assert JSONLDecoder().feed(b'\n{"a": 1}\r\n\n') == [{"a": 1}]
+
+
+class TestParseRecord:
+    """Tests for parse_record."""
+
+    def test_nested_data(self):
+        """Test records with fields under data."""
+        record = parse_record({"record_type": "memory", "data": MEMORY})
+
+        assert isinstance(record, Memory)
+        assert record.id == "mem_1"
+
+    def test_inline_fields(self):
+        """Test records with inline fields and the kind key."""
+        record = parse_record({"kind": "entity", **ENTITY})
+
+        assert isinstance(record, Entity)
+        assert record.canonical_name == "Alice"
+
+    def test_raw(self):
+        """Test raw mode yields lightweight records."""
+        record = parse_record({"record_type": "memory", "data": MEMORY}, raw=True)
+
+        assert isinstance(record, MemoryRecord)
+
+    def test_unknown_kind(self):
+        """Test unknown kinds are returned as ExportRecord."""
+        record = parse_record({"record_type": "session", "data": {"id": "s1"}})
+
+        assert isinstance(record, ExportRecord)
+        assert record.kind == "session"
+        assert record.data == {"id": "s1"}
+
+
+class TestPrefetch:
+    """Tests for read-ahead helpers."""
+
+    def test_prefetch_preserves_order(self):
+        """Test prefetch yields every item in order."""
+        assert list(prefetch(iter(range(100)), 3)) == list(range(100))
+
+    def test_prefetch_propagates_errors(self):
+        """Test errors in the source reach the consumer."""
+
+        def source():
+            yield 1
+            raise RuntimeError("network failed")
+
+        with pytest.raises(RuntimeError, match="network failed"):
+            list(prefetch(source(), 2))
+
+    def test_prefetch_early_exit_closes_source(self):
+        """Test stopping early closes the source generator."""
+        closed = []
+
+        def source():
+            try:
+                yield from range(1000)
+            finally:
+                closed.append(True)
+
+        stream = prefetch(source(), 2)
+        assert next(stream) == 0
+        stream.close()
+
+        assert closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_aprefetch(self):
+        """Test async prefetch yields every item in order."""
+
+        async def source():
+            for i in range(20):
+                yield i
+
+        assert [i async for i in aprefetch(source(), 3)] == list(range(20))
@@ -0,0 +1,104 @@
+"""Tests for graph analytics over snapshots."""
+
+import pytest
+
+from keyoku.models import Entity, Relationship
+
+np = pytest.importorskip("numpy")
+
+from keyoku import graph_analytics  # noqa: E402
+from keyoku.graph_analytics import (  # noqa: E402
+    connected_components,
+    degree_centrality,
+    pagerank,
+)
+from keyoku.graph_snapshot import GraphSnapshot  # noqa: E402
+
+
+def _snapshot(n: int, edges: list) -> GraphSnapshot:
+    entities = [
+        Entity(id=f"e{i}", canonical_name=f"E{i}", type="thing", created_at="2024-01-01T00:00:00Z")
+        for i in range(n)
+    ]
+    relationships = [
+        Relationship(
+            id=f"r{k}",
+            source_entity_id=f"e{a}",
+            target_entity_id=f"e{b}",
+            relationship_type=type,
+            created_at="2024-01-01T00:00:00Z",
+        )
+        for k, (a, b, type) in enumerate(edges)
+    ]
+    return GraphSnapshot(entities, relationships)
+
+
+@pytest.fixture(params=["scipy", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "scipy":
+        pytest.importorskip("scipy")
+    else:
+        monkeypatch.setattr(graph_analytics, "optional_scipy_sparse", lambda: None)
+    return request.param
+
+
+class TestPageRank:
+    """Tests for pagerank()."""
+
+    def test_cycle_is_uniform(self, backend):
+        """Test a directed cycle gives every entity the same score."""
+        snapshot = _snapshot(3, [(0, 1, "x"), (1, 2, "x"), (2, 0, "x")])
+
+        scores = pagerank(snapshot)
+
+        assert scores == pytest.approx({"e0": 1 / 3, "e1": 1 / 3, "e2": 1 / 3})
+
+    def test_hub_ranks_highest(self, backend):
+        """Test an entity linked from every other one ranks first."""
+        snapshot = _snapshot(5, [(i, 0, "x") for i in range(1, 5)] + [(1, 2, "y")])
+
+        scores = pagerank(snapshot)
+
+        assert max(scores, key=scores.get) == "e0"
+        assert sum(scores.values()) == pytest.approx(1.0)
+        filtered = pagerank(snapshot, relationship_types=["y"])
+        assert max(filtered, key=filtered.get) == "e2"
+
+    def test_backends_agree(self, monkeypatch):
+        """Test the NumPy fallback matches the SciPy result."""
+        pytest.importorskip("scipy")
+        rng = np.random.default_rng(0)
+        edges = [(int(a), int(b), "x") for a, b in rng.integers(0, 50, size=(200, 2))]
+        snapshot = _snapshot(50, edges)
+
+        with_scipy = pagerank(snapshot, tol=1e-12)
+        monkeypatch.setattr(graph_analytics, "optional_scipy_sparse", lambda: None)
+        without_scipy = pagerank(snapshot, tol=1e-12)
+
+        assert without_scipy == pytest.approx(with_scipy)
+
+
+class TestDegreeAndComponents:
+    """Tests for degree_centrality() and connected_components()."""
+
+    def test_degree_centrality(self):
+        """Test in, out and total degrees."""
+        snapshot = _snapshot(3, [(0, 1, "x"), (0, 2, "x"), (1, 2, "y")])
+
+        assert degree_centrality(snapshot, direction="outgoing", normalized=False) == {
+            "e0": 2.0, "e1": 1.0, "e2": 0.0,
+        }
+        assert degree_centrality(snapshot, direction="incoming")["e2"] == 1.0
+        assert degree_centrality(snapshot, relationship_types=["y"])["e0"] == 0.0
+        with pytest.raises(ValueError):
+            degree_centrality(snapshot, direction="up")
+
+    def test_connected_components(self, backend):
+        """Test weak components are labelled in snapshot order."""
+        snapshot = _snapshot(6, [(1, 0, "x"), (3, 2, "x"), (2, 4, "y")])
+
+        labels = connected_components(snapshot)
+
+        assert labels == {"e0": 0, "e1": 0, "e2": 1, "e3": 1, "e4": 1, "e5": 2}
+        by_type = connected_components(snapshot, relationship_types=["x"])
+        assert by_type["e4"] != by_type["e2"]
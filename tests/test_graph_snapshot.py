@@ -0,0 +1,266 @@
+"""Tests for local knowledge-graph snapshots."""
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+from keyoku.models import Entity, Relationship
+
+np = pytest.importorskip("numpy")
+
+from keyoku.graph_snapshot import GraphSnapshot  # noqa: E402
+
+
+def _entity(i: int) -> dict:
+    return {
+        "id": f"ent_{i}",
+        "canonical_name": f"Entity {i}",
+        "type": "person",
+        "created_at": "2024-01-10T08:00:00Z",
+    }
+
+
+def _relationship(rel_id: str, source: int, target: int, type: str = "knows") -> dict:
+    return {
+        "id": rel_id,
+        "source_entity_id": f"ent_{source}",
+        "target_entity_id": f"ent_{target}",
+        "relationship_type": type,
+        "created_at": "2024-01-12T14:00:00Z",
+    }
+
+
+EDGES = [
+    ("rel_01", 0, 1, "knows"),
+    ("rel_12", 1, 2, "knows"),
+    ("rel_23", 2, 3, "works_with"),
+    ("rel_03", 0, 3, "works_with"),
+    ("rel_43", 4, 3, "knows"),
+    ("rel_0x", 0, 99, "knows"),
+]
+
+
+@pytest.fixture
+def snapshot() -> GraphSnapshot:
+    return GraphSnapshot(
+        [Entity(**_entity(i)) for i in range(6)],
+        [Relationship(**_relationship(*edge)) for edge in EDGES],
+    )
+
+
+class TestGraphSnapshot:
+    """Tests for GraphSnapshot traversal."""
+
+    def test_csr_layout(self, snapshot: GraphSnapshot):
+        """Test CSR arrays group edges by source and skip dangling edges."""
+        assert len(snapshot) == 6
+        assert snapshot.num_relationships == 6
+        assert snapshot.out_indptr.tolist() == [0, 2, 3, 4, 4, 5, 5]
+        assert sorted(snapshot.out_indices[0:2].tolist()) == [1, 3]
+        assert snapshot.in_indptr[4] - snapshot.in_indptr[3] == 3
+
+    def test_find_path_shortest(self, snapshot: GraphSnapshot):
+        """Test the shortest path is reconstructed with its relationships."""
+        path = snapshot.find_path("ent_0", "ent_3")
+
+        assert [e.id for e in path.entities] == ["ent_0", "ent_3"]
+        assert [r.id for r in path.relationships] == ["rel_03"]
+        assert path.length == 1
+
+    def test_find_path_type_filter(self, snapshot: GraphSnapshot):
+        """Test relationship types restrict the traversal."""
+        path = snapshot.find_path("ent_0", "ent_2", relationship_types=["works_with"])
+
+        assert [e.id for e in path.entities] == ["ent_0", "ent_3", "ent_2"]
+        assert [r.id for r in path.relationships] == ["rel_03", "rel_23"]
+        assert snapshot.find_path("ent_0", "ent_3", relationship_types=["knows"]) is None
+
+    def test_find_path_direction_and_depth(self, snapshot: GraphSnapshot):
+        """Test direction and max_depth limits."""
+        assert snapshot.find_path("ent_3", "ent_0", direction="outgoing") is None
+        assert snapshot.find_path("ent_0", "ent_2", max_depth=1) is None
+        assert snapshot.find_path("ent_0", "ent_5") is None
+        assert snapshot.find_path("ent_0", "missing") is None
+
+    def test_bfs_distances(self, snapshot: GraphSnapshot):
+        """Test BFS hop counts from a seed."""
+        assert snapshot.bfs(["ent_0"]) == {"ent_0": 0, "ent_1": 1, "ent_3": 1, "ent_2": 2}
+
+    def test_neighborhood(self, snapshot: GraphSnapshot):
+        """Test k-hop neighborhoods over both directions with a type filter."""
+        nearby = snapshot.neighborhood(["ent_3"], depth=1, relationship_types=["knows"])
+        assert [e.id for e in nearby.entities] == ["ent_3", "ent_4"]
+        assert [r.id for r in nearby.relationships] == ["rel_43"]
+
+        two_hops = snapshot.neighborhood(["ent_4"], depth=2)
+        assert two_hops.depths == {"ent_4": 0, "ent_3": 1, "ent_2": 2, "ent_0": 2}
+        assert {r.id for r in two_hops.relationships} == {"rel_43", "rel_23", "rel_03"}
+        assert not two_hops.truncated
+
+        outgoing = snapshot.neighborhood(["ent_0"], depth=1, direction="outgoing")
+        assert {r.id for r in outgoing.relationships} == {"rel_01", "rel_03"}
+
+    def test_invalid_direction(self, snapshot: GraphSnapshot):
+        """Test an unknown direction is rejected."""
+        with pytest.raises(ValueError):
+            snapshot.bfs(["ent_0"], direction="sideways")
+
+
+class TestGraphSnapshotLoad:
+    """Tests for client.graph.snapshot()."""
+
+    @respx.mock
+    def test_snapshot_fetches_all_pages(self, client: Keyoku):
+        """Test pages are fetched until a short page arrives."""
+
+        def entities_page(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            ids = range(offset, min(offset + limit, 6))
+            return Response(200, json={"entities": [_entity(i) for i in ids]})
+
+        def relationships_page(request):
+            offset = int(request.url.params["offset"])
+            limit = int(request.url.params["limit"])
+            edges = EDGES[offset : offset + limit]
+            return Response(200, json={"relationships": [_relationship(*e) for e in edges]})
+
+        respx.get("https://api.keyoku.dev/v1/entities").mock(side_effect=entities_page)
+        respx.get("https://api.keyoku.dev/v1/relationships").mock(side_effect=relationships_page)
+
+        snapshot = client.graph.snapshot(page_size=2, max_workers=2)
+
+        assert snapshot.entity_ids == [f"ent_{i}" for i in range(6)]
+        assert snapshot.relationship_ids == [e[0] for e in EDGES]
+        assert snapshot.find_path("ent_4", "ent_1").length == 3
+
+
+def _audit(
+    log_id: str,
+    operation: str,
+    resource_type: str,
+    resource_id: str,
+    created_at: str = "2024-02-01T10:00:00Z",
+) -> dict:
+    return {
+        "id": log_id,
+        "operation": operation,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "created_at": created_at,
+    }
+
+
+class TestGraphSnapshotRefresh:
+    """Tests for GraphSnapshot.refresh()."""
+
+    @pytest.fixture
+    def loaded(self, client: Keyoku) -> GraphSnapshot:
+        with respx.mock:
+            respx.get("https://api.keyoku.dev/v1/entities").mock(
+                return_value=Response(200, json={"entities": [_entity(i) for i in range(6)]})
+            )
+            respx.get("https://api.keyoku.dev/v1/relationships").mock(
+                return_value=Response(
+                    200, json={"relationships": [_relationship(*e) for e in EDGES]}
+                )
+            )
+            return client.graph.snapshot(page_size=100)
+
+    @respx.mock
+    def test_refresh_patches_changes(self, loaded: GraphSnapshot):
+        """Test audit entries are applied without a full reload."""
+        synced_at = loaded.synced_at
+
+        def audit_page(request):
+            assert request.url.params["start_date"].endswith("Z")
+            if request.url.params["resource_type"] == "entity":
+                logs = [
+                    _audit("log_1", "entity.create", "entity", "ent_6"),
+                    _audit("log_2", "entity.update", "entity", "ent_5"),
+                ]
+            else:
+                logs = [
+                    _audit("log_3", "relationship.delete", "relationship", "rel_01"),
+                    _audit("log_4", "relationship.create", "relationship", "rel_56"),
+                ]
+            return Response(200, json={"audit_logs": logs, "total": 2, "has_more": False})
+
+        respx.get("https://api.keyoku.dev/v1/audit-logs").mock(side_effect=audit_page)
+        respx.get("https://api.keyoku.dev/v1/entities/ent_6").mock(
+            return_value=Response(200, json=_entity(6))
+        )
+        respx.get("https://api.keyoku.dev/v1/entities/ent_5").mock(
+            return_value=Response(404, json={"error": "not found"})
+        )
+        respx.get("https://api.keyoku.dev/v1/relationships/rel_56").mock(
+            return_value=Response(200, json=_relationship("rel_56", 4, 6))
+        )
+
+        result = loaded.refresh()
+
+        assert not result.full_rebuild
+        assert (result.entities_updated, result.entities_removed) == (1, 1)
+        assert (result.relationships_updated, result.relationships_removed) == (1, 1)
+        assert loaded.entity("ent_5") is None
+        assert loaded.relationship("rel_01") is None
+        assert loaded.find_path("ent_3", "ent_6").length == 2
+        assert loaded.find_path("ent_0", "ent_1", max_depth=1) is None
+        assert loaded.synced_at > synced_at
+
+        # The overlap returns the same entries again; they are not re-applied.
+        rebuild_calls = []
+        loaded.rebuild = lambda: rebuild_calls.append(1)  # type: ignore[method-assign]
+        gets = respx.calls.call_count
+        again = loaded.refresh()
+
+        assert (again.entities_updated, again.relationships_removed) == (0, 0)
+        assert respx.calls.call_count == gets + 2
+        assert not rebuild_calls
+        start_date = respx.calls.last.request.url.params["start_date"]
+        assert start_date == "2024-02-01T09:59:00Z"
+
+    @respx.mock
+    def test_refresh_applies_late_entries_below_the_mark(self, loaded: GraphSnapshot):
+        """Test an entry committed late with an older timestamp is still applied once."""
+        entity_logs = [_audit("log_1", "entity.update", "entity", "ent_1")]
+
+        def audit_page(request):
+            logs = entity_logs if request.url.params["resource_type"] == "entity" else []
+            return Response(200, json={"audit_logs": logs, "total": len(logs), "has_more": False})
+
+        respx.get("https://api.keyoku.dev/v1/audit-logs").mock(side_effect=audit_page)
+        respx.get("https://api.keyoku.dev/v1/entities/ent_1").mock(
+            return_value=Response(200, json=_entity(1))
+        )
+        assert loaded.refresh().entities_updated == 1
+
+        entity_logs.append(
+            _audit("log_0", "entity.delete", "entity", "ent_2", "2024-02-01T09:59:30Z")
+        )
+        late = loaded.refresh()
+
+        assert (late.entities_updated, late.entities_removed) == (0, 1)
+        assert loaded.entity("ent_2") is None
+        assert loaded.refresh().entities_removed == 0
+
+    @respx.mock
+    def test_refresh_reloads_on_gap(self, loaded: GraphSnapshot):
+        """Test too many changes trigger a full reload."""
+        respx.get("https://api.keyoku.dev/v1/audit-logs").mock(
+            return_value=Response(200, json={"audit_logs": [], "total": 5000, "has_more": True})
+        )
+        entities = respx.get("https://api.keyoku.dev/v1/entities").mock(
+            return_value=Response(200, json={"entities": [_entity(0)]})
+        )
+        respx.get("https://api.keyoku.dev/v1/relationships").mock(
+            return_value=Response(200, json={"relationships": []})
+        )
+
+        result = loaded.refresh()
+
+        assert result.full_rebuild
+        assert entities.called
+        assert loaded.entity_ids == ["ent_0"]
+        assert loaded.num_relationships == 0
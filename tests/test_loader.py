@@ -0,0 +1,147 @@
+"""Tests for batching loaders."""
+
+import asyncio
+import threading
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import AsyncKeyoku, Keyoku
+from keyoku.exceptions import NotFoundError
+from keyoku.loader import AsyncLoader, BatchLoader
+
+MEMORY_URL = r"https://api.keyoku.dev/v1/memories/(?P<memory_id>\w+)"
+
+
+def _memory(request, memory_id: str) -> Response:
+    if memory_id == "missing":
+        return Response(404, json={"error": "not found"})
+    return Response(
+        200,
+        json={
+            "id": memory_id,
+            "content": f"content of {memory_id}",
+            "type": "fact",
+            "agent_id": "default",
+            "importance": 0.5,
+            "created_at": "2024-01-15T10:30:00Z",
+        },
+    )
+
+
+class TestAsyncLoader:
+    """Tests for per-tick batching on AsyncKeyoku."""
+
+    @respx.mock
+    async def test_dedupes_within_a_tick(self, api_key: str):
+        """Test concurrent loads of the same IDs share requests."""
+        route = respx.get(url__regex=MEMORY_URL).mock(side_effect=_memory)
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            loader = client.loaders.memories
+            results = await asyncio.gather(
+                loader.load("m1"), loader.load("m2"), loader.load("m1"), loader.load("m2")
+            )
+
+        assert [m.id for m in results] == ["m1", "m2", "m1", "m2"]
+        assert route.call_count == 2
+
+    @respx.mock
+    async def test_errors_fan_out_per_key(self, api_key: str):
+        """Test a failing key does not fail the rest of the batch."""
+        respx.get(url__regex=MEMORY_URL).mock(side_effect=_memory)
+
+        async with AsyncKeyoku(api_key=api_key) as client:
+            results = await asyncio.gather(
+                client.loaders.memories.load("m1"),
+                client.loaders.memories.load("missing"),
+                return_exceptions=True,
+            )
+
+        assert results[0].id == "m1"
+        assert isinstance(results[1], NotFoundError)
+
+    async def test_batch_fetch(self):
+        """Test one bulk call per tick when batch_fetch is given."""
+        batches = []
+
+        async def batch_fetch(keys):
+            batches.append(keys)
+            return [k * 2 for k in keys]
+
+        async def fetch(key):
+            raise AssertionError("single fetch should not be used")
+
+        loader: AsyncLoader = AsyncLoader(fetch, batch_fetch=batch_fetch)
+
+        assert await loader.load_many([1, 2, 1, 3]) == [2, 4, 2, 6]
+        assert batches == [[1, 2, 3]]
+
+    async def test_short_batch_fails_every_key(self):
+        """Test a batch_fetch returning too few values fails instead of hanging."""
+
+        async def batch_fetch(keys):
+            return keys[:1]
+
+        loader: AsyncLoader = AsyncLoader(lambda key: key, batch_fetch=batch_fetch)
+
+        with pytest.raises(ValueError, match="1 values for 2 keys"):
+            await asyncio.wait_for(loader.load_many([1, 2]), timeout=1)
+
+
+class TestBatchLoader:
+    """Tests for window batching on the sync client."""
+
+    @respx.mock
+    def test_load_many_dedupes(self, client: Keyoku):
+        """Test repeated IDs are fetched once."""
+        route = respx.get(url__regex=MEMORY_URL).mock(side_effect=_memory)
+
+        results = client.loaders.memories.load_many(["m1", "m2", "m1"])
+
+        assert [m.id for m in results] == ["m1", "m2", "m1"]
+        assert route.call_count == 2
+        with pytest.raises(NotFoundError):
+            client.loaders.memories.load("missing")
+        client.close()
+
+    def test_threads_share_a_window(self):
+        """Test loads from several threads inside one window form one batch."""
+        batches = []
+        loader: BatchLoader = BatchLoader(
+            lambda key: key,
+            batch_fetch=lambda keys: batches.append(sorted(keys)) or keys,
+            window=0.1,
+        )
+        results = {}
+        barrier = threading.Barrier(4)
+
+        def worker(key):
+            barrier.wait()
+            results[key] = loader.load(key % 2)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {0: 0, 1: 1, 2: 0, 3: 1}
+        assert batches == [[0, 1]]
+
+    def test_short_batch_fails_every_key(self):
+        """Test a batch_fetch returning too few values fails instead of hanging."""
+        loader: BatchLoader = BatchLoader(lambda key: key, batch_fetch=lambda keys: keys[:1])
+
+        with pytest.raises(ValueError):
+            loader.load_many([1, 2])
+
+    def test_closed_loader_rejects_loads(self):
+        """Test loads after close() fail fast."""
+        loader: BatchLoader = BatchLoader(lambda key: key)
+        assert loader.load_many([1]) == [1]
+        loader.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            loader.load(2)
@@ -0,0 +1,112 @@
+"""Tests for client-side ranking utilities."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from keyoku.models import MemorySearchResult
+from keyoku.ranking import Reranker, fuse_results
+
+pytest.importorskip("numpy")
+
+
+def _result(memory_id: str, score: float) -> MemorySearchResult:
+    return MemorySearchResult(
+        id=memory_id,
+        content=f"content {memory_id}",
+        type="fact",
+        agent_id="default",
+        importance=0.5,
+        score=score,
+        created_at="2024-01-15T10:30:00Z",
+    )
+
+
+class TestFuseResults:
+    """Tests for fuse_results."""
+
+    def test_rrf_dedupes_and_orders(self):
+        """Test RRF merges lists and rewards items found in several lists."""
+        a = [_result("m1", 0.9), _result("m2", 0.8), _result("m3", 0.7)]
+        b = [_result("m2", 0.6), _result("m4", 0.5)]
+
+        fused = fuse_results([a, b], limit=10)
+
+        ids = [r.id for r in fused]
+        assert ids[0] == "m2"
+        assert sorted(ids) == ["m1", "m2", "m3", "m4"]
+        assert fused[0].score == pytest.approx(1 / 62 + 1 / 61)
+
+    def test_limit(self):
+        """Test fused list is truncated to limit."""
+        a = [_result(f"m{i}", 1.0 - i / 10) for i in range(5)]
+
+        fused = fuse_results([a, a], limit=2)
+
+        assert [r.id for r in fused] == ["m0", "m1"]
+
+    def test_score_normalization(self):
+        """Test score fusion normalizes each list independently."""
+        a = [_result("m1", 100.0), _result("m2", 50.0)]
+        b = [_result("m3", 0.9), _result("m1", 0.1)]
+
+        fused = fuse_results([a, b], method="score", limit=10)
+
+        assert [r.id for r in fused] == ["m1", "m3", "m2"]
+        assert fused[0].score == pytest.approx(1.0)
+        assert fused[2].score == pytest.approx(0.0)
+
+    def test_empty_lists(self):
+        """Test fusing empty inputs."""
+        assert fuse_results([[], []]) == []
+
+    def test_unknown_method(self):
+        """Test unknown fusion methods are rejected."""
+        with pytest.raises(ValueError):
+            fuse_results([[_result("m1", 1.0)]], method="borda")
+
+
+class TestReranker:
+    """Tests for Reranker."""
+
+    NOW = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+    def _results(self) -> list:
+        old = _result("old", 0.9).model_copy(
+            update={"created_at": self.NOW - timedelta(days=70), "importance": 0.1}
+        )
+        new = _result("new", 0.8).model_copy(
+            update={"created_at": self.NOW, "importance": 0.9}
+        )
+        return [old, new]
+
+    def test_default_keeps_score_order(self):
+        """Test default weights order by server score."""
+        reranked = Reranker().rerank(self._results(), now=self.NOW)
+
+        assert [r.id for r in reranked] == ["old", "new"]
+
+    def test_recency_and_importance(self):
+        """Test importance and recency weights change the order."""
+        reranker = Reranker(importance_weight=0.5, recency_weight=0.5, half_life=86400.0)
+
+        scores = reranker.scores(self._results(), now=self.NOW)
+        reranked = reranker.rerank(self._results(), now=self.NOW)
+
+        assert scores[1] == pytest.approx(0.8 + 0.45 + 0.5)
+        assert [r.id for r in reranked] == ["new", "old"]
+
+    def test_limit(self):
+        """Test rerank keeps only the top results."""
+        results = [_result(f"m{i}", i / 100) for i in range(100)]
+
+        reranked = Reranker().rerank(results, limit=3)
+
+        assert [r.id for r in reranked] == ["m99", "m98", "m97"]
+
+    def test_invalid_config(self):
+        """Test invalid reranker configuration is rejected."""
+        with pytest.raises(ValueError):
+            Reranker(half_life=0)
+        with pytest.raises(ValueError):
+            Reranker(overfetch=0)
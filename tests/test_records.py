@@ -0,0 +1,148 @@
+"""Tests for lightweight result records."""
+
+from datetime import datetime, timezone
+
+import pytest
+import respx
+from httpx import Response
+
+from keyoku import Keyoku
+from keyoku.models import Entity, Memory, MemorySearchResult, Relationship
+from keyoku.records import (
+    EntityRecord,
+    MemoryRecord,
+    MemoryRecordPage,
+    MemorySearchRecord,
+    RelationshipRecord,
+    parse_datetime,
+)
+
+ENTITY = {
+    "id": "ent_1",
+    "canonical_name": "John Doe",
+    "type": "person",
+    "properties": {"age": 30},
+    "created_at": "2024-01-10T08:00:00Z",
+}
+
+RELATIONSHIP = {
+    "id": "rel_1",
+    "source_entity_id": "ent_1",
+    "target_entity_id": "ent_2",
+    "relationship_type": "works_with",
+    "created_at": "2024-01-12T14:00:00Z",
+}
+
+
+class TestParseDatetime:
+    """Tests for parse_datetime."""
+
+    def test_utc_suffix(self):
+        """Test Z suffix is parsed as UTC."""
+        assert parse_datetime("2024-01-15T10:30:00Z") == datetime(
+            2024, 1, 15, 10, 30, tzinfo=timezone.utc
+        )
+
+    def test_nanoseconds(self):
+        """Test nanosecond precision timestamps are accepted."""
+        parsed = parse_datetime("2024-01-15T10:30:00.123456789Z")
+
+        assert parsed.microsecond == 123456
+
+
+class TestRecords:
+    """Tests for record classes."""
+
+    def test_memory_record_lazy_created_at(self, memory_response: dict):
+        """Test created_at is parsed on first access and cached."""
+        record = MemoryRecord(memory_response)
+
+        assert record._created_at == "2024-01-15T10:30:00Z"
+        assert record.created_at == datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        assert isinstance(record._created_at, datetime)
+
+    def test_memory_record_to_model(self, memory_response: dict):
+        """Test converting a record to the validated model."""
+        memory = MemoryRecord(memory_response).to_model()
+
+        assert memory == Memory(**memory_response)
+
+    def test_records_are_slotted(self, memory_response: dict):
+        """Test records do not carry a per-instance __dict__."""
+        assert not hasattr(MemoryRecord(memory_response), "__dict__")
+
+    def test_search_record(self, memory_search_response: dict):
+        """Test MemorySearchRecord keeps the score."""
+        row = memory_search_response["memories"][0]
+        record = MemorySearchRecord(row)
+
+        assert record.score == 0.95
+        assert record.to_model() == MemorySearchResult(**row)
+
+    def test_entity_record(self):
+        """Test EntityRecord fields and conversion."""
+        record = EntityRecord(ENTITY)
+
+        assert record.canonical_name == "John Doe"
+        assert record.updated_at is None
+        assert record.to_model() == Entity(**ENTITY)
+
+    def test_relationship_record(self):
+        """Test RelationshipRecord fields and conversion."""
+        record = RelationshipRecord(RELATIONSHIP)
+
+        assert record.properties == {}
+        assert record.to_model() == Relationship(**RELATIONSHIP)
+
+
+class TestRawMode:
+    """Tests for raw=True on listing and search calls."""
+
+    @respx.mock
+    def test_search_raw(self, client: Keyoku, memory_search_response: dict):
+        """Test search returns records in raw mode."""
+        respx.post("https://api.keyoku.dev/v1/memories/search").mock(
+            return_value=Response(200, json=memory_search_response)
+        )
+
+        results = client.search("preferences", raw=True)
+
+        assert all(isinstance(r, MemorySearchRecord) for r in results)
+        assert results[1].content == "User uses VS Code"
+
+    @respx.mock
+    def test_memories_list_raw(self, client: Keyoku, memory_response: dict):
+        """Test memories.list returns a record page in raw mode."""
+        respx.get("https://api.keyoku.dev/v1/memories").mock(
+            return_value=Response(
+                200, json={"memories": [memory_response], "total": 1, "has_more": False}
+            )
+        )
+
+        page = client.memories.list(raw=True)
+
+        assert isinstance(page, MemoryRecordPage)
+        assert page.total == 1
+        assert page.memories[0].id == "mem_abc123"
+
+    @respx.mock
+    def test_entities_list_raw(self, client: Keyoku):
+        """Test entities.list returns records in raw mode."""
+        respx.get("https://api.keyoku.dev/v1/entities").mock(
+            return_value=Response(200, json={"entities": [ENTITY]})
+        )
+
+        entities = client.entities.list(raw=True)
+
+        assert isinstance(entities[0], EntityRecord)
+
+    @respx.mock
+    def test_relationships_list_raw(self, client: Keyoku):
+        """Test relationships.list returns records in raw mode."""
+        respx.get("https://api.keyoku.dev/v1/relationships").mock(
+            return_value=Response(200, json={"relationships": [RELATIONSHIP]})
+        )
+
+        relationships = client.relationships.list(raw=True)
+
+        assert isinstance(relationships[0], RelationshipRecord)
@@ -0,0 +1,20 @@
+"""Tests for request pacing."""
+
+from keyoku._throttle import RateLimiter
+
+
+def test_rate_limiter_spaces_calls():
+    """Test calls are spaced 1 / rate seconds apart."""
+    now = [0.0]
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(4, clock=lambda: now[0], sleep=sleep)
+    for _ in range(3):
+        limiter.acquire()
+
+    assert sleeps == [0.25, 0.25]
+    RateLimiter(None).acquire()